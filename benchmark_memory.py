@@ -0,0 +1,353 @@
+# benchmark_memory.py
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+from lexer import Lexer
+from parser import Parser
+from syntax_tree import ASTNode
+
+# Varsayılan bütçeler (bayt). Anahtarlar raporlanan ölçüm adlarıdır; aşılan her
+# bütçe çalıştırmayı başarısız yapar. RSS ölçümleri gürültülü olduğu için
+# varsayılan olarak yalnızca raporlanır, istenirse --budget ile sınırlanabilir.
+DEFAULT_BUDGETS = {
+    'lexer.retained_per_token': 190,
+    'lexer.peak_per_token': 200,
+    'parser.retained_per_node': 170,
+    'parser.peak_per_node': 170,
+    'repr.peak_per_node': 250,
+    'panel.peak_per_node': 210,
+}
+
+# RSS örnekleme aralığı (saniye)
+RSS_SAMPLE_INTERVAL = 0.002
+
+_IGNORED_SITES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+)
+
+
+def generate_source(lines=5000, seed=0):
+    """
+    Yaklaşık lines satırlık, sözdizimi geçerli ve tekrarlanabilir bir kaynak
+    üretir: iç içe if/while blokları, fonksiyonlar, atamalar ve çağrılar.
+    """
+    rng = random.Random(seed)
+    names = ['x', 'y', 'toplam', 'sayac', 'deger', 'liste', 'sonuc']
+
+    def expression(depth=0):
+        if depth > 2 or rng.random() < 0.35:
+            return rng.choice(names + ['42', '3.5', '"metin"', 'True', 'None', 'f(x)'])
+        kind = rng.random()
+        if kind < 0.55:
+            operator = rng.choice(['+', '-', '*', '/', '%', '==', '<', '>=', 'and', 'or'])
+            return f"{expression(depth + 1)} {operator} {expression(depth + 1)}"
+        if kind < 0.7:
+            return f"-{expression(depth + 1)}"
+        if kind < 0.85:
+            return f"({expression(depth + 1)})"
+        return f"hesapla({expression(depth + 1)}, {expression(depth + 1)})"
+
+    def block(indent, depth, out):
+        prefix = '    ' * indent
+        for _ in range(rng.randrange(2, 5)):
+            kind = rng.random()
+            if depth < 3 and kind < 0.15:
+                out.append(f"{prefix}if {expression()}:")
+                block(indent + 1, depth + 1, out)
+                if rng.random() < 0.4:
+                    out.append(f"{prefix}else:")
+                    block(indent + 1, depth + 1, out)
+            elif depth < 3 and kind < 0.22:
+                out.append(f"{prefix}while {expression()}:")
+                block(indent + 1, depth + 1, out)
+            elif kind < 0.3:
+                out.append(f"{prefix}return {expression()}")
+            elif kind < 0.7:
+                out.append(f"{prefix}{rng.choice(names)} = {expression()}")
+            else:
+                if kind < 0.75:
+                    out.append(f"{prefix}# yorum satırı")
+                out.append(f"{prefix}print({expression()})")
+
+    out = []
+    count = 0
+    while len(out) < lines:
+        out.append(f"def islem{count}(a, b):")
+        block(1, 1, out)
+        out.append("")
+        count += 1
+    return '\n'.join(out) + '\n'
+
+
+def count_nodes(node):
+    """node altındaki AST düğümlerinin sayısı (özyinelemesiz)."""
+    count = 0
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (list, tuple)):
+            stack.extend(item)
+        elif isinstance(item, ASTNode):
+            count += 1
+            stack.extend(vars(item).values())
+    return count
+
+
+class _TextBuffer:
+    """AST panelinin (ScrolledText) yerine geçer; eklenen metni Tk gibi bellekte tutar."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def insert(self, index, text, tags=None):
+        self.chunks.append(text)
+
+
+def _panel_recorder_class():
+    from main import EditorTab
+
+    class PanelRecorder:
+        """print_ast_node'u pencere olmadan çalıştırır (panelin yazdığı metin aynıdır)."""
+
+        print_ast_node = EditorTab.print_ast_node
+        print_ast_body = EditorTab.print_ast_body
+
+        def __init__(self):
+            self.ast_output = _TextBuffer()
+            self.lazy_ast_nodes = {}
+
+    return PanelRecorder
+
+
+def render_panel(program, recorder_class):
+    """update_ast_output'un panel yazımı: üst seviye deyimler birer birer yazılır."""
+    recorder = recorder_class()
+    recorder.ast_output.insert('end', "Abstract Syntax Tree:\n\n")
+    recorder.ast_output.insert('end', f"• {program.__class__.__name__}")
+    for statement in program.statements:
+        recorder.print_ast_node(statement, 1)
+    return recorder.ast_output
+
+
+def _read_rss():
+    """Sürecin şu anki RSS'i (bayt); /proc olmayan sistemlerde None."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class RssSampler:
+    """Arka plan iş parçacığıyla RSS'i örnekler; peak, başlangıca göre en yüksek artıştır."""
+
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.baseline = None
+        self.highest = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        self.baseline = self.highest = _read_rss()
+        if self.baseline is not None:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._record()
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self._record()
+
+    def _record(self):
+        rss = _read_rss()
+        if rss is not None and rss > self.highest:
+            self.highest = rss
+
+    @property
+    def peak(self):
+        return None if self.baseline is None else self.highest - self.baseline
+
+
+class Measurement:
+    """Bir aşamanın ölçümü: count birim başına bayt hesaplarında kullanılır."""
+
+    def __init__(self, stage, unit, count, retained, peak, rss_peak, top_sites):
+        self.stage = stage
+        self.unit = unit
+        self.count = count
+        self.retained = retained  # Aşama bittikten sonra sonucun tuttuğu bellek
+        self.peak = peak  # Aşama sırasında ayrılan en yüksek bellek
+        self.rss_peak = rss_peak
+        self.top_sites = top_sites  # tracemalloc.Statistic listesi (tutulan bellek, satır bazında)
+
+    def metrics(self):
+        per = max(self.count, 1)
+        values = {
+            f'{self.stage}.retained': self.retained,
+            f'{self.stage}.peak': self.peak,
+            f'{self.stage}.retained_per_{self.unit}': self.retained / per,
+            f'{self.stage}.peak_per_{self.unit}': self.peak / per,
+        }
+        if self.rss_peak is not None:
+            values[f'{self.stage}.rss_peak'] = self.rss_peak
+            values[f'{self.stage}.rss_per_{self.unit}'] = self.rss_peak / per
+        return values
+
+
+def measure(stage, unit, func, count_of, top=10):
+    """
+    func'ı iki kez çalıştırır: önce yalnızca RSS örneklenir (tracemalloc'un kendi
+    yükü karışmasın), sonra tracemalloc ile tutulan/en yüksek bellek ve en çok
+    bellek tutan satırlar ölçülür. func'ın sonucu ve ölçüm döner.
+    """
+    gc.collect()
+    with RssSampler() as sampler:
+        result = func()
+    del result
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+        top_sites = []
+        if top:
+            snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_SITES)
+            top_sites = snapshot.statistics('lineno')[:top]
+    finally:
+        tracemalloc.stop()
+    return result, Measurement(stage, unit, count_of(result), retained, peak, sampler.peak, top_sites)
+
+
+def run_suite(source, top=10):
+    """Lexer, Parser, AST metni (__repr__) ve AST paneli için ölçümleri döndürür."""
+    recorder_class = _panel_recorder_class()  # main/tkinter içe aktarımı ölçüme girmesin
+    lexer = Lexer()
+    tokens, lexer_result = measure('lexer', 'token', lambda: lexer.tokenize(source), len, top)
+    program, parser_result = measure('parser', 'node', lambda: Parser(tokens).parse(), count_nodes, top)
+    node_count = parser_result.count
+    _, repr_result = measure('repr', 'node', lambda: repr(program), lambda text: node_count, top)
+    _, panel_result = measure('panel', 'node', lambda: render_panel(program, recorder_class),
+                              lambda buffer: node_count, top)
+    return [lexer_result, parser_result, repr_result, panel_result]
+
+
+def check_budgets(measurements, budgets):
+    """Aşılan bütçeler için (ölçüm adı, değer, bütçe) listesi; bilinmeyen anahtar ValueError'dır."""
+    metrics = {}
+    for result in measurements:
+        metrics.update(result.metrics())
+    violations = []
+    for name, limit in budgets.items():
+        if name not in metrics:
+            if name.split('.')[0] in {result.stage for result in measurements} and 'rss' in name:
+                continue  # Bu sistemde RSS okunamıyor
+            raise ValueError(f"Bilinmeyen bütçe: {name} (geçerli adlar: {', '.join(sorted(metrics))})")
+        if metrics[name] > limit:
+            violations.append((name, metrics[name], limit))
+    return violations
+
+
+def _format_bytes(value):
+    for unit in ('B', 'KiB', 'MiB'):
+        if abs(value) < 1024:
+            return f"{value:.0f} {unit}" if unit == 'B' else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def print_report(measurements, out=sys.stdout):
+    for result in measurements:
+        rss = _format_bytes(result.rss_peak) if result.rss_peak is not None else '-'
+        per = max(result.count, 1)
+        print(f"{result.stage:7} {result.count:9} {result.unit:5}  "
+              f"tutulan {_format_bytes(result.retained):>10} ({result.retained / per:6.1f} B/{result.unit})  "
+              f"en yüksek {_format_bytes(result.peak):>10} ({result.peak / per:6.1f} B/{result.unit})  "
+              f"RSS {rss}", file=out)
+    for result in measurements:
+        if not result.top_sites:
+            continue
+        print(f"\n{result.stage}: en çok bellek tutan satırlar", file=out)
+        for stat in result.top_sites:
+            frame = stat.traceback[0]
+            print(f"  {_format_bytes(stat.size):>10} {stat.count:8} blok  "
+                  f"{os.path.basename(frame.filename)}:{frame.lineno}", file=out)
+
+
+def parse_budget(text):
+    """argparse türü: 'ad=değer' -> (ad, değer)."""
+    name, sep, value = text.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError(f"Bütçe 'ad=değer' biçiminde olmalı: {text}")
+    try:
+        return name.strip(), float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz bütçe değeri: {text}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description="Lexer, Parser ve AST çıktısının bellek kullanımını ölçer, bütçe aşımında başarısız olur")
+    arg_parser.add_argument('source', nargs='?', help="Ölçülecek dosya (verilmezse kaynak üretilir)")
+    arg_parser.add_argument('--lines', type=int, default=5000, help="Üretilecek kaynağın satır sayısı")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--budgets', help="Varsayılanların yerine geçen bütçe dosyası (JSON: ad -> bayt)")
+    arg_parser.add_argument('--budget', type=parse_budget, action='append', default=[], metavar='AD=BAYT',
+                            help="Tek bir bütçeyi değiştirir veya ekler (ör. lexer.peak_per_token=300)")
+    arg_parser.add_argument('--top', type=int, default=10, help="Aşama başına raporlanacak satır sayısı")
+    arg_parser.add_argument('--json', help="Ölçümleri bu JSON dosyasına da yazar")
+    args = arg_parser.parse_args()
+
+    if args.source:
+        with open(args.source, encoding='utf-8') as f:
+            source = f.read()
+    else:
+        source = generate_source(args.lines, args.seed)
+
+    budgets = dict(DEFAULT_BUDGETS)
+    if args.budgets:
+        with open(args.budgets, encoding='utf-8') as f:
+            budgets = json.load(f)
+    budgets.update(args.budget)
+
+    started = time.perf_counter()
+    measurements = run_suite(source, args.top)
+    print(f"{len(source.splitlines())} satır, {time.perf_counter() - started:.1f} sn\n")
+    print_report(measurements)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({name: value for result in measurements for name, value in result.metrics().items()},
+                      f, indent=2)
+
+    try:
+        violations = check_budgets(measurements, budgets)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+    if violations:
+        print("\nBütçe aşıldı:", file=sys.stderr)
+        for name, value, limit in violations:
+            print(f"  {name}: {value:.1f} > {limit:.1f}", file=sys.stderr)
+        sys.exit(1)
+    print("\nTüm bütçeler içinde.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+# benchmark_startup.py
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmark_memory import generate_source, parse_budget
+
+# Varsayılan bütçeler (milisaniye). Her ölçüm ayrı bir süreçte yapılır ve
+# tekrarların en iyisi alınır; aşılan her bütçe çalıştırmayı başarısız yapar.
+DEFAULT_BUDGETS = {
+    'import.lexer': 15,
+    'import.parser': 20,
+    'import.main': 60,
+    'lexer.first_tokenize': 2,
+    'cli.export': 200,
+    'gui.first_window': 300,
+    'gui.first_highlight': 1500,
+}
+
+# Açılış dosyasının satır sayısı (ilk vurgulama ölçümü için)
+STARTUP_FILE_LINES = 2000
+
+_REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Ölçüm süreçlerinde çalışan kod; sonuçları (ad -> ms) son satırda JSON olarak yazar
+_IMPORT_PROBE = """
+import json, time
+started = time.perf_counter()
+import {module}
+results = {{'import.{module}': (time.perf_counter() - started) * 1000}}
+print(json.dumps(results))
+"""
+
+_LEXER_PROBE = """
+import json, time
+from lexer import Lexer
+started = time.perf_counter()
+Lexer().tokenize('if x == 1:\\n    y = f(x, "a")  # yorum\\n')
+print(json.dumps({'lexer.first_tokenize': (time.perf_counter() - started) * 1000}))
+"""
+
+_GUI_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError as e:
+    print(json.dumps({'skipped': str(e)}))
+    sys.exit(0)
+from main import SyntaxHighlighterGUI
+app = SyntaxHighlighterGUI(root)
+app.open_file(path=sys.argv[1])
+tab = app.current_tab
+results = {}
+
+def on_map(event):
+    results.setdefault('gui.first_window', (time.perf_counter() - started) * 1000)
+
+def poll():
+    task = tab._highlight_task
+    if not tab.loading and task is not None and not task.running:
+        results['gui.first_highlight'] = (time.perf_counter() - started) * 1000
+        root.destroy()
+    else:
+        root.after(1, poll)
+
+tab.text_area.bind('<Map>', on_map, add='+')
+root.after(1, poll)
+root.mainloop()
+print(json.dumps(results))
+"""
+
+
+def _run_process(args):
+    """Yeni bir yorumlayıcıyı args ile çalıştırır; (standart çıktı, süreç süresi ms) döndürür."""
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, *args], cwd=_REPO_DIR, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - started) * 1000
+    if completed.returncode != 0:
+        raise RuntimeError(f"Ölçüm süreci başarısız oldu ({' '.join(args[:1])}):\n{completed.stderr.strip()}")
+    return completed.stdout, elapsed
+
+
+def _run_probe(code, args=()):
+    """Ölçüm kodunu yeni bir süreçte çalıştırır; yazdığı sonuç sözlüğünü döndürür."""
+    lines = _run_process(['-c', code, *args])[0].strip().splitlines()
+    return json.loads(lines[-1]) if lines else {}
+
+
+def _best(results, measured):
+    for name, value in measured.items():
+        results[name] = value if name not in results else min(results[name], value)
+
+
+def run_suite(repeat=5, lines=STARTUP_FILE_LINES):
+    """
+    Açılış ölçümlerini yapar; (ölçüm adı -> en iyi süre ms, atlanan ölçümlerin
+    açıklamaları) döndürür. Grafik ekran yoksa gui.* ölçümleri atlanır.
+    """
+    results = {}
+    skipped = {}
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = os.path.join(directory, 'startup.py')
+        with open(source_path, 'w', encoding='utf-8') as f:
+            f.write(generate_source(lines))
+        output_path = os.path.join(directory, 'startup.html')
+
+        for _ in range(repeat):
+            for module in ('lexer', 'parser', 'main'):
+                _best(results, _run_probe(_IMPORT_PROBE.format(module=module)))
+            _best(results, _run_probe(_LEXER_PROBE))
+            # Kısa ömürlü komut satırı çağrısı: yorumlayıcının açılışı dahil toplam süre
+            _, elapsed = _run_process(['exporters.py', source_path, '-o', output_path])
+            _best(results, {'cli.export': elapsed})
+            measured = _run_probe(_GUI_PROBE, (source_path,))
+            if 'skipped' in measured:
+                skipped['gui'] = measured['skipped']
+            else:
+                _best(results, measured)
+    return results, skipped
+
+
+def check_budgets(results, budgets, skipped=()):
+    """Aşılan bütçeler için (ölçüm adı, değer, bütçe) listesi; bilinmeyen anahtar ValueError'dır."""
+    violations = []
+    for name, limit in budgets.items():
+        if name not in results:
+            if name.split('.')[0] in skipped:
+                continue  # Bu sistemde ölçülemedi (ör. ekran yok)
+            raise ValueError(f"Bilinmeyen bütçe: {name} (geçerli adlar: {', '.join(sorted(results))})")
+        if results[name] > limit:
+            violations.append((name, results[name], limit))
+    return violations
+
+
+def print_report(results, budgets, skipped, out=sys.stdout):
+    for name, value in results.items():
+        limit = budgets.get(name)
+        limit_text = f"  (bütçe {limit:.0f} ms)" if limit is not None else ''
+        print(f"{name:22} {value:8.1f} ms{limit_text}", file=out)
+    for group, reason in skipped.items():
+        print(f"{group}.* atlandı: {reason}", file=out)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description="İçe aktarma, ilk pencere ve ilk vurgulama sürelerini ölçer, bütçe aşımında başarısız olur")
+    arg_parser.add_argument('--repeat', type=int, default=5, help="Her ölçümün tekrar sayısı (en iyisi alınır)")
+    arg_parser.add_argument('--lines', type=int, default=STARTUP_FILE_LINES,
+                            help="İlk vurgulamada açılan dosyanın satır sayısı")
+    arg_parser.add_argument('--budgets', help="Varsayılanların yerine geçen bütçe dosyası (JSON: ad -> ms)")
+    arg_parser.add_argument('--budget', type=parse_budget, action='append', default=[], metavar='AD=MS',
+                            help="Tek bir bütçeyi değiştirir veya ekler (ör. import.main=200)")
+    arg_parser.add_argument('--json', help="Ölçümleri bu JSON dosyasına da yazar")
+    args = arg_parser.parse_args()
+
+    budgets = dict(DEFAULT_BUDGETS)
+    if args.budgets:
+        with open(args.budgets, encoding='utf-8') as f:
+            budgets = json.load(f)
+    budgets.update(args.budget)
+
+    try:
+        results, skipped = run_suite(args.repeat, args.lines)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+    print_report(results, budgets, skipped)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    try:
+        violations = check_budgets(results, budgets, skipped)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+    if violations:
+        print("\nBütçe aşıldı:", file=sys.stderr)
+        for name, value, limit in violations:
+            print(f"  {name}: {value:.1f} > {limit:.1f}", file=sys.stderr)
+        sys.exit(1)
+    print("\nTüm bütçeler içinde.")
+
+
+if __name__ == '__main__':
+    main()
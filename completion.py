@@ -0,0 +1,209 @@
+# completion.py
+import heapq
+import re
+from bisect import bisect_left, bisect_right, insort
+
+# Sıralı isim dizisinin blok boyutu; bloklar bunun iki katını aşınca bölünür
+BLOCK_SIZE = 64
+# Açılır listede gösterilen en fazla aday
+DEFAULT_LIMIT = 12
+
+_KEYWORD_PATTERN = re.compile(r'\\b(\w+)\\b')
+
+
+class CompletionIndex:
+    """
+    Tamamlama için isim -> geçiş sayısı indeksi (OccurrenceIndex'ten beslenir).
+
+    İsimler sıralı bloklar halinde tutulur: önek aralığı bisect ile bulunur,
+    her blok içindeki en sık ismin sıralama anahtarını saklar. En sık k aday,
+    aralıktaki bloklar bu anahtarlarla yığına konup yalnızca en iyi blokları
+    açılarak bulunur; aralıktaki tüm isimler taranmaz. Her güncellemede
+    yalnızca geçiş sayısı değişen isimlerin blokları yenilenir.
+    """
+
+    def __init__(self):
+        self._blocks = []  # Sıralı isim listeleri; birleşimleri de sıralıdır
+        self._firsts = []  # bisect için blokların ilk isimleri
+        self._best = []  # Her bloğun en iyi sıralama anahtarı: (-geçiş sayısı, isim)
+        self._ranked = []  # Her bloğun anahtarları sıralı (blok ilk açıldığında kurulur; değişince None)
+        self._counts = {}  # isim -> geçiş sayısı
+        self.revision = None  # İndeksin yansıttığı OccurrenceIndex revizyonu
+
+    def clear(self):
+        self.__init__()
+
+    def __len__(self):
+        return len(self._counts)
+
+    def count(self, name):
+        return self._counts.get(name, 0)
+
+    def update(self, occurrences):
+        """
+        İndeksi OccurrenceIndex'in güncel haline getirir. Önceki revizyondan
+        artımlı güncellendiyse yalnızca changed_names'teki isimler işlenir,
+        aksi halde indeks baştan kurulur.
+        """
+        if self.revision == occurrences.revision:
+            return
+        if occurrences.changed_names is None or self.revision != occurrences.revision - 1:
+            self.rebuild(occurrences)
+            return
+        for name in occurrences.changed_names:
+            self._set_count(name, occurrences.count(name))
+        self.revision = occurrences.revision
+
+    def rebuild(self, occurrences):
+        self._counts = {name: occurrences.count(name) for name in occurrences.names()}
+        names = sorted(self._counts)
+        self._blocks = [names[idx:idx + BLOCK_SIZE] for idx in range(0, len(names), BLOCK_SIZE)]
+        self._firsts = [block[0] for block in self._blocks]
+        self._best = [self._block_best(block) for block in self._blocks]
+        self._ranked = [None] * len(self._blocks)
+        self.revision = occurrences.revision
+
+    def most_frequent(self, prefix, limit=DEFAULT_LIMIT):
+        """prefix ile başlayan isimlerden en sık geçen limit tanesi (eşitlikte alfabetik): [(isim, sayı)]."""
+        if not self._blocks or limit <= 0:
+            return []
+        upper = _prefix_end(prefix)
+        counts = self._counts
+        first = max(bisect_right(self._firsts, prefix) - 1, 0)
+        last = bisect_left(self._firsts, upper) if upper is not None else len(self._blocks)
+        last = max(last, first + 1)
+
+        # Aralığın içindeki bloklar bütün olarak, uçlardaki bloklar isim isim yığına girer;
+        # (anahtar, blok no) çiftlerinde blok no -1 tek bir ismi gösterir
+        inner = range(first + 1, last - 1)
+        heap = list(zip(self._best[inner.start:inner.stop], inner))
+        for idx in {first, last - 1}:
+            block = self._blocks[idx]
+            start = bisect_left(block, prefix)
+            stop = bisect_left(block, upper) if upper is not None else len(block)
+            heap.extend(((-counts[name], name), -1) for name in block[start:stop])
+        heapq.heapify(heap)
+
+        result = []
+        while heap and len(result) < limit:
+            key, idx = heapq.heappop(heap)
+            if idx < 0:
+                result.append((key[1], -key[0]))
+            else:
+                # Blok anahtarı içindeki her ismin anahtarından küçük/eşit; açılınca yalnızca
+                # eksik aday sayısı kadar en iyi ismi yığına girer
+                ranked = self._ranked[idx]
+                if ranked is None:
+                    ranked = self._ranked[idx] = sorted((-counts[name], name) for name in self._blocks[idx])
+                for item in ranked[:limit - len(result)]:
+                    heapq.heappush(heap, (item, -1))
+        return result
+
+    # --- Bakım ---
+    def _set_count(self, name, count):
+        old = self._counts.get(name)
+        if old == count or (old is None and not count):
+            return
+        if not count:
+            del self._counts[name]
+            self._remove(name)
+            return
+        self._counts[name] = count
+        if old is None:
+            self._insert(name)
+            return
+        idx = self._block_of(name)
+        self._ranked[idx] = None
+        key = (-count, name)
+        if key < self._best[idx]:
+            self._best[idx] = key
+        elif self._best[idx][1] == name:
+            self._best[idx] = self._block_best(self._blocks[idx])  # En iyi isim geriledi
+
+    def _block_of(self, name):
+        return max(bisect_right(self._firsts, name) - 1, 0)
+
+    def _block_best(self, block):
+        counts = self._counts
+        return min((-counts[name], name) for name in block)
+
+    def _insert(self, name):
+        if not self._blocks:
+            self._blocks.append([name])
+            self._firsts.append(name)
+            self._best.append((-self._counts[name], name))
+            self._ranked.append(None)
+            return
+        idx = self._block_of(name)
+        block = self._blocks[idx]
+        insort(block, name)
+        self._ranked[idx] = None
+        self._firsts[idx] = block[0]
+        if len(block) > 2 * BLOCK_SIZE:
+            self._blocks[idx + 1:idx + 1] = [block[BLOCK_SIZE:]]
+            del block[BLOCK_SIZE:]
+            self._firsts.insert(idx + 1, self._blocks[idx + 1][0])
+            self._best[idx:idx + 1] = [self._block_best(block), self._block_best(self._blocks[idx + 1])]
+            self._ranked.insert(idx + 1, None)
+        else:
+            self._best[idx] = min(self._best[idx], (-self._counts[name], name))
+
+    def _remove(self, name):
+        idx = self._block_of(name)
+        block = self._blocks[idx]
+        del block[bisect_left(block, name)]
+        if not block:
+            del self._blocks[idx], self._firsts[idx], self._best[idx], self._ranked[idx]
+            return
+        self._ranked[idx] = None
+        self._firsts[idx] = block[0]
+        if self._best[idx][1] == name:
+            self._best[idx] = self._block_best(block)
+
+
+def _prefix_end(prefix):
+    """prefix ile başlayan tüm dizelerden büyük en küçük dize (boş önekte None)."""
+    if not prefix:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def keyword_words(lexer):
+    """Lexer'ın anahtar kelimeleri: keywords tablosu ve KEYWORD_* kalıplarındaki sözcükler (sıralı)."""
+    words = set(lexer.keywords)
+    for name, pattern in lexer.token_specs:
+        match = _KEYWORD_PATTERN.fullmatch(pattern)
+        if name.startswith('KEYWORD_') and match:
+            words.add(match.group(1))
+    return sorted(words)
+
+
+def complete(prefix, index, keywords=(), symbols=None, line=None, limit=DEFAULT_LIMIT):
+    """
+    prefix için tamamlama adayları, en uygunu önce. Önce imlecin bulunduğu
+    fonksiyon kapsamlarında (içten dışa) tanımlı isimler, sonra anahtar
+    kelimeler, en son diğer isimler gelir; her grup kendi içinde geçiş
+    sayısına göre sıralanır. prefix'in kendisi aday olmaz. symbols
+    (SymbolIndex) ve line verilmezse kapsam bilgisi kullanılmaz.
+    """
+    seen = {prefix}
+    result = []
+    scope = symbols.scope_at(line) if symbols is not None and line is not None else None
+    while scope is not None:
+        local = [name for name in scope.definitions if name.startswith(prefix) and name not in seen]
+        local.sort(key=lambda name: (-index.count(name), name))
+        seen.update(local)
+        result.extend(local)
+        scope = scope.parent
+    for word in keywords:
+        if word.startswith(prefix) and word not in seen:
+            seen.add(word)
+            result.append(word)
+    if len(result) < limit:
+        # Zaten eklenen isimler atlanacağı için fazladan aday istenir
+        for name, _ in index.most_frequent(prefix, limit + len(seen)):
+            if name not in seen:
+                result.append(name)
+                if len(result) == limit:
+                    break
+    return result[:limit]
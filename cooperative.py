@@ -0,0 +1,193 @@
+# cooperative.py
+import time
+
+# Tek bir iş diliminin en uzun süresi (saniye); dilimler arasında Tk ekranı çizer ve girdi işler
+SLICE_BUDGET = 0.008
+# Dilimler arasındaki bekleme (ms); olay kuyruğundaki tuş/fare olaylarına sıra gelmesi için
+SLICE_DELAY_MS = 1
+# SliceScheduler öncelikleri (küçük olan önce çalışır)
+PRIORITY_FOCUSED = 0
+PRIORITY_BACKGROUND = 1
+# Arka plan işlerinin iki dilimi arasındaki en kısa süre (ms)
+BACKGROUND_DELAY_MS = 50
+
+
+class CooperativeTask:
+    """
+    Bir üreteci (generator) Tk olay döngüsünü bloklamadan dilimler halinde çalıştırır.
+
+    Üreteç her küçük iş biriminden sonra bir ilerleme değeri üretir. Dilim
+    bütçesi dolunca kalan iş after ile bir sonraki dilime bırakılır ve son
+    ilerleme değeri on_progress'e verilir. İlk dilim start() içinde hemen
+    çalışır; bütçeye sığan küçük işler böylece eşzamanlı biter. cancel()
+    bekleyen dilimi iptal edip üreteci kapatır (ör. yeni bir düzenleme geldiğinde).
+    scheduler (SliceScheduler) verilirse dilimler kendi after'ı yerine o
+    zamanlayıcıda, priority önceliğiyle sıraya girer.
+    """
+
+    def __init__(self, widget, steps, on_progress=None, on_done=None, budget=SLICE_BUDGET,
+                 scheduler=None, priority=PRIORITY_FOCUSED):
+        self.widget = widget
+        self.steps = steps
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.budget = budget
+        self.scheduler = scheduler
+        self.priority = priority
+        self.busy_time = 0.0  # Dilimlerde harcanan toplam süre (dilimler arası bekleme hariç)
+        self.slices = 0
+        self.finished = False
+        self.cancelled = False
+        self._job = None
+
+    @property
+    def running(self):
+        return not (self.finished or self.cancelled)
+
+    def start(self):
+        if self.scheduler is not None:
+            self.scheduler.submit(self)
+        else:
+            self._run_slice()
+        return self
+
+    def cancel(self):
+        if not self.running:
+            return
+        self.cancelled = True
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        if self.scheduler is not None:
+            self.scheduler.discard(self)
+        self.steps.close()
+
+    def _run_slice(self):
+        self._job = None
+        if self.run_slice():
+            self._job = self.widget.after(SLICE_DELAY_MS, self._run_slice)
+
+    def run_slice(self):
+        """Bütçe dolana kadar iş birimi çalıştırır; iş bitmediyse True döndürür."""
+        started = time.perf_counter()
+        deadline = started + self.budget
+        progress = None
+        try:
+            for progress in self.steps:
+                if time.perf_counter() >= deadline:
+                    break
+            else:
+                self.finished = True
+        except BaseException:
+            self.finished = True
+            raise
+        finally:
+            self.slices += 1
+            self.busy_time += time.perf_counter() - started
+
+        if self.finished:
+            if self.on_done is not None:
+                self.on_done(self)
+            return False
+        if self.on_progress is not None and progress is not None:
+            self.on_progress(progress)
+        return True
+
+
+class SliceScheduler:
+    """
+    CooperativeTask'ları tek bir after zamanlayıcısıyla, önceliğe göre çalıştıran
+    ortak iş havuzu (ör. sekmelerin analiz işleri).
+
+    Her adımda bekleyen en öncelikli işin bir dilimi çalışır; aynı öncelikteki
+    işler sırayla dönüşür. Odaktaki işin ilk dilimi gönderildiği anda
+    çalışır (küçük belgeler eskisi gibi eşzamanlı biter). Arka plan işleri
+    yalnızca öncelikli iş yokken ve en fazla background_delay_ms'de bir dilim
+    alır; açık belge sayısı arttıkça odaktaki belgenin yanıt süresi uzamaz.
+    """
+
+    def __init__(self, widget, background_delay_ms=BACKGROUND_DELAY_MS):
+        self.widget = widget
+        self.background_delay_ms = background_delay_ms
+        self.tasks = []  # Bekleyen işler; aynı öncelikte olanlardan listede önce gelen çalışır
+        self._job = None
+        self._job_due = None  # Bekleyen after'ın çalışacağı an (perf_counter)
+        self._background_ran = None  # Son arka plan diliminin bittiği an
+
+    def submit(self, task):
+        self.tasks.append(task)
+        if task.priority < PRIORITY_BACKGROUND:
+            self._run(task)
+        self._schedule()
+
+    def discard(self, task):
+        if task in self.tasks:
+            self.tasks.remove(task)
+            self._schedule()
+
+    def set_priority(self, task, priority):
+        if task.priority != priority:
+            task.priority = priority
+            self._schedule()
+
+    def _next(self):
+        running = [task for task in self.tasks if task.running]
+        return min(running, key=lambda task: task.priority) if running else None
+
+    def _delay(self, task):
+        """task'ın bir sonraki dilimine kadar beklenecek süre (ms)."""
+        if task.priority < PRIORITY_BACKGROUND or self._background_ran is None:
+            return SLICE_DELAY_MS
+        remaining = self.background_delay_ms - (time.perf_counter() - self._background_ran) * 1000
+        return max(SLICE_DELAY_MS, int(remaining) + 1) if remaining > 0 else SLICE_DELAY_MS
+
+    def _schedule(self):
+        task = self._next()
+        if task is None:
+            if self._job is not None:
+                self.widget.after_cancel(self._job)
+                self._job = None
+            return
+        delay = self._delay(task)
+        due = time.perf_counter() + delay / 1000
+        if self._job is not None:
+            if self._job_due <= due:
+                return  # Daha erken bir adım zaten bekliyor
+            self.widget.after_cancel(self._job)
+        self._job = self.widget.after(delay, self._tick)
+        self._job_due = due
+
+    def _tick(self):
+        self._job = None
+        try:
+            task = self._next()
+            if task is not None and self._delay(task) == SLICE_DELAY_MS:
+                # Aynı öncelikteki işler sırayla dönüşsün
+                self.tasks.remove(task)
+                self.tasks.append(task)
+                self._run(task)
+        finally:
+            self._schedule()
+
+    def _run(self, task):
+        more = False
+        try:
+            more = task.run_slice()
+        finally:
+            if task.priority >= PRIORITY_BACKGROUND:
+                self._background_ran = time.perf_counter()
+            if not more and task in self.tasks:
+                self.tasks.remove(task)
+
+
+def labelled_steps(label, steps):
+    """
+    (yapılan, toplam) ilerlemesi üreten bir alt işi (etiket, yapılan, toplam)
+    üretecek şekilde sarar; alt işin dönüş değerini aynen döndürür (yield from ile).
+    """
+    while True:
+        try:
+            done, total = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        yield label, done, total
@@ -0,0 +1,110 @@
+# diagnostics.py
+SEVERITY_ERROR = 'error'
+SEVERITY_WARNING = 'warning'
+SEVERITY_INFO = 'info'
+
+# logging seviyeleri (ERROR, WARNING, INFO); logging yalnızca logger verenlerce yüklenir
+_LOG_LEVELS = {
+    SEVERITY_ERROR: 40,
+    SEVERITY_WARNING: 30,
+    SEVERITY_INFO: 20,
+}
+
+# Tanı kodları
+CODE_MISMATCH = 'L001'  # Tanımlanamayan karakter(ler)
+CODE_INDENT = 'L002'  # Girinti hatası
+CODE_PARSER = 'P001'  # Sözdizimi hatası
+
+
+class Diagnostic:
+    def __init__(self, severity, code, message, line, column, end_column=None):
+        self.severity = severity
+        self.code = code
+        self.message = message
+        self.line = line
+        self.column = column
+        self.end_column = end_column if end_column is not None else column + 1
+        self.text = None  # Birleştirilmiş tanımlanamayan karakterler
+
+    def __repr__(self):
+        return (f"Diagnostic({self.severity}, {self.code}, '{self.message}', "
+                f"Line:{self.line}, Col:{self.column}-{self.end_column})")
+
+
+class DiagnosticCollector:
+    """
+    Lexer ve Parser'ın ürettiği tanıları toplar; print() yerine kullanılır.
+
+    Aynı satırda art arda gelen tanımlanamayan karakterler tek bir aralık
+    tanısında birleştirilir ve toplam tanı sayısı max_diagnostics ile
+    sınırlandırılır (aşan tanılar yalnızca sayılır). İsteğe bağlı bir callback
+    veya logging.Logger her yeni tanıda çağrılır; varsayılan olarak hiçbir G/Ç
+    yapılmaz.
+    """
+
+    def __init__(self, max_diagnostics=200, callback=None, logger=None):
+        self.max_diagnostics = max_diagnostics
+        self.callback = callback
+        self.logger = logger
+        self.diagnostics = []
+        self.dropped = 0
+
+    def report(self, severity, code, message, line, column, end_column=None):
+        if len(self.diagnostics) >= self.max_diagnostics:
+            self.dropped += 1
+            return None
+        diagnostic = Diagnostic(severity, code, message, line, column, end_column)
+        self.diagnostics.append(diagnostic)
+        if self.callback is not None:
+            self.callback(diagnostic)
+        if self.logger is not None:
+            self.logger.log(_LOG_LEVELS.get(severity, _LOG_LEVELS[SEVERITY_INFO]), "%s Satır %s, Sütun %s: %s",
+                            code, line, column, message)
+        return diagnostic
+
+    def report_mismatch(self, char, line, column):
+        """Tanımlanamayan karakteri bildirir; bir öncekine bitişikse onun aralığını genişletir."""
+        if self.diagnostics:
+            last = self.diagnostics[-1]
+            if last.code == CODE_MISMATCH and last.line == line and last.end_column == column:
+                last.end_column += 1
+                last.text += char
+                last.message = f"Tanımlanamayan karakterler: '{last.text}'"
+                return last
+        diagnostic = self.report(SEVERITY_WARNING, CODE_MISMATCH, f"Tanımlanamayan karakter: '{char}'",
+                                 line, column)
+        if diagnostic is not None:
+            diagnostic.text = char
+        return diagnostic
+
+    def clear(self):
+        self.diagnostics = []
+        self.dropped = 0
+
+    def count(self, severity=None):
+        """Tanı sayısı (sınırı aşıp atılanlar dahil, severity verilmezse)."""
+        if severity is None:
+            return len(self.diagnostics) + self.dropped
+        return sum(1 for diagnostic in self.diagnostics if diagnostic.severity == severity)
+
+    def __len__(self):
+        return len(self.diagnostics)
+
+    def __iter__(self):
+        return iter(self.diagnostics)
+
+    def summary(self):
+        """Durum çubuğu için kısa özet; tanı yoksa boş string."""
+        total = self.count()
+        if not total:
+            return ""
+        errors = self.count(SEVERITY_ERROR)
+        warnings = self.count(SEVERITY_WARNING)
+        parts = []
+        if errors:
+            parts.append(f"{errors} hata")
+        if warnings:
+            parts.append(f"{warnings} uyarı")
+        if self.dropped:
+            parts.append(f"+{self.dropped} gösterilmedi")
+        return ", ".join(parts)
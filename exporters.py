@@ -0,0 +1,362 @@
+# exporters.py
+import argparse
+import os
+import re
+import sys
+
+from lexer import Lexer, LexerError
+from themes import TOKEN_TAGS, ThemeError, load_theme
+
+# Çıktı bu kadar satır biriktikten sonra tek write çağrısıyla yazılır
+WRITE_BATCH_LINES = 256
+
+
+def iter_source_lines(f):
+    """
+    Dosyayı satır satır okur ve Lexer.split_lines ile aynı satırları üretir
+    (splitlines ayırıcıları, son satıra eklenen '\\n'); dosya belleğe alınmaz.
+    """
+    pending = None
+    for physical_line in f:
+        for line in physical_line.splitlines(keepends=True):
+            if pending is not None:
+                yield pending
+            pending = line
+    if pending is not None:
+        if not pending.endswith('\n'):
+            pending += '\n'
+        yield pending
+
+
+def line_runs(text, tokens):
+    """
+    Bir satırı (tag, başlangıç, bitiş) parçalarına böler; tag None ise parça
+    renksizdir. Aynı tag'li ve aralarında yalnızca boşluk bulunan tokenlar tek
+    parçada birleştirilir.
+    """
+    runs = []
+    pos = 0
+    for token in tokens:
+        tag = TOKEN_TAGS.get(token.type)
+        if tag is None or not token.value:
+            continue
+        start = token.column
+        if not text.startswith(token.value, start):
+            # Sekmeli girintide sütun kayabilir; değeri satırda ara
+            start = text.find(token.value, pos)
+            if start < 0:
+                continue
+        end = start + len(token.value)
+        if runs and runs[-1][0] == tag and (start == pos or text[pos:start].isspace()):
+            runs[-1][2] = end
+        else:
+            if start > pos:
+                runs.append([None, pos, start])
+            runs.append([tag, start, end])
+        pos = end
+    if pos < len(text):
+        runs.append([None, pos, len(text)])
+    return runs
+
+
+class Exporter:
+    """
+    Vurgulanmış kaynak dışa aktarıcılarının ortak tabanı. Satırlar ve tokenlar
+    satır sırasıyla tüketilir, çıktı toplu olarak dosya nesnesine yazılır;
+    bellek kullanımı dosya boyutundan bağımsızdır.
+    """
+
+    def __init__(self, theme=None):
+        self.theme = theme if theme is not None else load_theme()
+        self.styles = self.theme.token_styles()
+
+    def export(self, lines, tokens, out):
+        """
+        lines: kaynak satırları (split_lines biçiminde), tokens: satır sırasıyla
+        token yineleyicisi (Lexer.tokenize çıktısı, TokenStream vb.).
+        """
+        token_iter = iter(tokens)
+        pending = next(token_iter, None)
+        self._export_lines(out, self._group(lines, token_iter, pending))
+
+    def export_source(self, lines, out, lexer=None):
+        """Satırları akış halinde tokenlayarak dışa aktarır; token listesi tutulmaz."""
+        lexer = lexer if lexer is not None else Lexer()
+
+        def grouped():
+            indent_stack = [0]
+            for line_num, line in enumerate(lines, 1):
+                yield line, lexer.tokenize_line(line, line_num, indent_stack)
+
+        self._export_lines(out, grouped())
+
+    def _group(self, lines, token_iter, pending):
+        for line_num, line in enumerate(lines, 1):
+            line_tokens = []
+            # Yapısal tokenlar (DEDENT, EOF) önceki satır numarasını taşıyabilir
+            while pending is not None and pending.line <= line_num:
+                if pending.line == line_num:
+                    line_tokens.append(pending)
+                pending = next(token_iter, None)
+            yield line, line_tokens
+
+    def _export_lines(self, out, grouped):
+        out.write(self.header())
+        batch = []
+        for line, line_tokens in grouped:
+            text = line.rstrip('\r\n')
+            batch.append(self.format_line(text, line_runs(text, line_tokens)))
+            if len(batch) >= WRITE_BATCH_LINES:
+                out.write(''.join(batch))
+                batch = []
+        if batch:
+            out.write(''.join(batch))
+        out.write(self.footer())
+
+    def header(self):
+        return ''
+
+    def footer(self):
+        return ''
+
+    def format_line(self, text, runs):
+        raise NotImplementedError
+
+
+_HTML_SPECIAL = re.compile(r'[&<>"]')
+_HTML_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})
+
+
+class HtmlExporter(Exporter):
+    """CSS sınıflı <span>'lar içeren tek başına bir HTML belgesi üretir."""
+
+    def __init__(self, theme=None, title='', class_prefix='t-'):
+        super().__init__(theme)
+        self.title = title
+        self.class_prefix = class_prefix
+
+    def stylesheet(self):
+        editor = self.theme.editor
+        rules = [f"pre.highlight {{ font-family: Consolas, monospace; font-size: 10pt; "
+                 f"color: {editor['foreground']}; background-color: {editor['background']}; }}"]
+        for tag, style in self.styles.items():
+            declarations = []
+            if 'foreground' in style:
+                declarations.append(f"color: {style['foreground']}")
+            if 'background' in style:
+                declarations.append(f"background-color: {style['background']}")
+            if style.get('italic'):
+                declarations.append('font-style: italic')
+            if style.get('bold'):
+                declarations.append('font-weight: bold')
+            if style.get('underline'):
+                declarations.append('text-decoration: underline')
+            rules.append(f".{self.class_prefix}{tag} {{ {'; '.join(declarations)}; }}")
+        return '\n'.join(rules)
+
+    def header(self):
+        title = self.title.translate(_HTML_ESCAPES)
+        return (f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n'
+                f'<style>\n{self.stylesheet()}\n</style>\n</head>\n<body>\n<pre class="highlight">')
+
+    def footer(self):
+        return '</pre>\n</body>\n</html>\n'
+
+    def format_line(self, text, runs):
+        # Özel karakter içermeyen satırlarda (çoğunluk) kaçış hiç yapılmaz
+        needs_escape = _HTML_SPECIAL.search(text) is not None
+        parts = []
+        for tag, start, end in runs:
+            chunk = text[start:end]
+            if needs_escape:
+                chunk = chunk.translate(_HTML_ESCAPES)
+            if tag is None:
+                parts.append(chunk)
+            else:
+                parts.append(f'<span class="{self.class_prefix}{tag}">{chunk}</span>')
+        parts.append('\n')
+        return ''.join(parts)
+
+
+def _hex_to_rgb(color):
+    color = color.lstrip('#')
+    return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+
+_NAMED_COLORS = {'red': '#FF0000', 'yellow': '#FFFF00', 'black': '#000000', 'white': '#FFFFFF'}
+
+
+def _normalize_color(color):
+    return _NAMED_COLORS.get(color.lower(), color)
+
+
+def xterm_256(color):
+    """#RRGGBB rengini en yakın xterm 256 renk indeksine çevirir (6x6x6 küp veya gri rampa)."""
+    r, g, b = _hex_to_rgb(_normalize_color(color))
+    levels = (0, 95, 135, 175, 215, 255)
+
+    def nearest_level(value):
+        return min(range(6), key=lambda idx: abs(levels[idx] - value))
+
+    ri, gi, bi = nearest_level(r), nearest_level(g), nearest_level(b)
+    cube_index = 16 + 36 * ri + 6 * gi + bi
+    cube_distance = (levels[ri] - r) ** 2 + (levels[gi] - g) ** 2 + (levels[bi] - b) ** 2
+
+    gray = min(23, max(0, round(((r + g + b) / 3 - 8) / 10)))
+    gray_value = 8 + 10 * gray
+    gray_distance = (gray_value - r) ** 2 + (gray_value - g) ** 2 + (gray_value - b) ** 2
+    return 232 + gray if gray_distance < cube_distance else cube_index
+
+
+class AnsiExporter(Exporter):
+    """Terminal için ANSI 256 renk kaçış dizileri üretir."""
+
+    def __init__(self, theme=None):
+        super().__init__(theme)
+        self.codes = {}
+        for tag, style in self.styles.items():
+            params = []
+            if style.get('bold'):
+                params.append('1')
+            if style.get('italic'):
+                params.append('3')
+            if style.get('underline'):
+                params.append('4')
+            if 'foreground' in style:
+                params.append(f"38;5;{xterm_256(style['foreground'])}")
+            if 'background' in style:
+                params.append(f"48;5;{xterm_256(style['background'])}")
+            self.codes[tag] = f"\x1b[{';'.join(params)}m" if params else ''
+
+    def format_line(self, text, runs):
+        parts = []
+        for tag, start, end in runs:
+            code = self.codes.get(tag) if tag is not None else None
+            if code:
+                parts.append(f"{code}{text[start:end]}\x1b[0m")
+            else:
+                parts.append(text[start:end])
+        parts.append('\n')
+        return ''.join(parts)
+
+
+_RTF_ESCAPES = str.maketrans({'\\': '\\\\', '{': '\\{', '}': '\\}', '\t': '\\tab '})
+_NON_ASCII = re.compile(r'[^\x00-\x7f]')
+
+
+def _rtf_unicode(match):
+    # RTF \u değerleri işaretli 16 bittir; BMP dışı karakterler vekil çift olarak yazılır
+    encoded = match.group().encode('utf-16-le')
+    parts = []
+    for idx in range(0, len(encoded), 2):
+        unit = int.from_bytes(encoded[idx:idx + 2], 'little')
+        parts.append(f"\\u{unit - 65536 if unit > 32767 else unit}?")
+    return ''.join(parts)
+
+
+class RtfExporter(Exporter):
+    """Kelime işlemcilere yapıştırılabilir RTF belgesi üretir."""
+
+    def __init__(self, theme=None, font='Consolas', font_size=10):
+        super().__init__(theme)
+        self.font = font
+        self.font_size = font_size
+        self.colors = []  # Renk tablosu (1 tabanlı indeks)
+        self.codes = {}
+        for tag, style in self.styles.items():
+            code = ''
+            if 'foreground' in style:
+                code += f"\\cf{self._color_index(style['foreground'])}"
+            if 'background' in style:
+                code += f"\\highlight{self._color_index(style['background'])}"
+            if style.get('italic'):
+                code += '\\i'
+            if style.get('bold'):
+                code += '\\b'
+            if style.get('underline'):
+                code += '\\ul'
+            self.codes[tag] = code
+
+    def _color_index(self, color):
+        rgb = _hex_to_rgb(_normalize_color(color))
+        if rgb not in self.colors:
+            self.colors.append(rgb)
+        return self.colors.index(rgb) + 1
+
+    def header(self):
+        color_table = ''.join(f"\\red{r}\\green{g}\\blue{b};" for r, g, b in self.colors)
+        return (f"{{\\rtf1\\ansi\\deff0{{\\fonttbl{{\\f0\\fmodern {self.font};}}}}"
+                f"{{\\colortbl ;{color_table}}}\n\\f0\\fs{self.font_size * 2}\n")
+
+    def footer(self):
+        return '}\n'
+
+    def format_line(self, text, runs):
+        needs_unicode = not text.isascii()
+        parts = []
+        for tag, start, end in runs:
+            chunk = text[start:end].translate(_RTF_ESCAPES)
+            if needs_unicode:
+                chunk = _NON_ASCII.sub(_rtf_unicode, chunk)
+            code = self.codes.get(tag) if tag is not None else None
+            if code:
+                parts.append(f"{{{code} {chunk}}}")
+            else:
+                parts.append(chunk)
+        parts.append('\\par\n')
+        return ''.join(parts)
+
+
+EXPORTERS = {
+    'html': HtmlExporter,
+    'ansi': AnsiExporter,
+    'rtf': RtfExporter,
+}
+
+_EXTENSION_FORMATS = {'.html': 'html', '.htm': 'html', '.rtf': 'rtf', '.ans': 'ansi', '.txt': 'ansi'}
+
+
+def export_file(source_path, output_path, fmt=None, theme=None):
+    """Bir kaynak dosyayı akış halinde okuyup seçilen biçimde dışa aktarır."""
+    if fmt is None:
+        fmt = _EXTENSION_FORMATS.get(os.path.splitext(output_path)[1].lower(), 'html')
+    exporter_class = EXPORTERS[fmt]
+    if fmt == 'html':
+        exporter = exporter_class(theme, title=os.path.basename(source_path))
+    else:
+        exporter = exporter_class(theme)
+    with open(source_path, encoding='utf-8') as source, \
+            open(output_path, 'w', encoding='utf-8', newline='\n') as out:
+        exporter.export_source(iter_source_lines(source), out)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Vurgulanmış kaynağı HTML, ANSI veya RTF olarak dışa aktarır")
+    arg_parser.add_argument('source')
+    arg_parser.add_argument('-o', '--output', help="Çıktı dosyası (verilmezse standart çıktı)")
+    arg_parser.add_argument('-f', '--format', choices=sorted(EXPORTERS),
+                            help="Çıktı biçimi (verilmezse uzantıdan, standart çıktıda ansi)")
+    arg_parser.add_argument('-t', '--theme', default='default',
+                            help="Tema adı (themes/ altındaki JSON dosyası) veya tema dosyası yolu")
+    args = arg_parser.parse_args()
+
+    try:
+        theme = load_theme(args.theme)
+    except ThemeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        if args.output:
+            export_file(args.source, args.output, args.format, theme)
+        else:
+            exporter = EXPORTERS[args.format or 'ansi'](theme)
+            with open(args.source, encoding='utf-8') as source:
+                exporter.export_source(iter_source_lines(source), sys.stdout)
+    except LexerError as e:
+        print(f"Lexer Hatası: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
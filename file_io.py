@@ -0,0 +1,120 @@
+# file_io.py
+import codecs
+import mmap
+import os
+import tempfile
+
+# Okuma parçası boyutu (bayt); her parça satır sonunda bitecek şekilde kırpılır
+READ_CHUNK_BYTES = 64 * 1024
+# Bu boyuttan büyük dosyalar mmap ile okunur (read() kopyası yerine sayfa eşlemesi)
+MMAP_MIN_BYTES = 1024 * 1024
+
+
+class ChunkedReader:
+    """
+    Dosyayı satır sınırında biten metin parçaları halinde okur; dosya bir kerede
+    belleğe alınmaz. Satır sonları Tk gibi '\\n'e çevrilir, dosyadaki satır
+    sonu biçimi kayıtta korunabilsin diye newline'da saklanır. bytes_read,
+    ilerleme göstermek için okunan bayt sayısıdır.
+    """
+
+    def __init__(self, path, chunk_bytes=READ_CHUNK_BYTES, encoding='utf-8', use_mmap=None):
+        self.path = path
+        self.chunk_bytes = chunk_bytes
+        self.encoding = encoding
+        self.size = os.path.getsize(path)
+        self.use_mmap = self.size >= MMAP_MIN_BYTES if use_mmap is None else use_mmap
+        self.bytes_read = 0
+        self.newline = None  # İlk satır sonuna göre '\n', '\r\n' veya '\r'; satır sonu yoksa None
+
+    def __iter__(self):
+        decoder = codecs.getincrementaldecoder(self.encoding)()
+        pending = ''  # Henüz satır sonu gelmemiş kısım
+        for raw in self._raw_chunks():
+            self.bytes_read += len(raw)
+            text = pending + decoder.decode(raw)
+            if text.endswith('\r'):
+                # '\r\n' iki parçaya bölünmüş olabilir; '\r' bir sonraki parçayla birlikte çevrilir
+                text, pending = text[:-1], '\r'
+            else:
+                pending = ''
+            text = self._normalize(text)
+            cut = text.rfind('\n') + 1
+            pending = text[cut:] + pending
+            if cut:
+                yield text[:cut]
+        text = self._normalize(pending + decoder.decode(b'', final=True))
+        if text:
+            yield text
+
+    def _normalize(self, text):
+        if self.newline is None:
+            # İlk görülen satır sonu dosyanın biçimi sayılır
+            first = min((pos for pos in (text.find('\r'), text.find('\n')) if pos >= 0), default=-1)
+            if first >= 0:
+                self.newline = '\r\n' if text.startswith('\r\n', first) else text[first]
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
+
+    def _raw_chunks(self):
+        with open(self.path, 'rb') as f:
+            if self.use_mmap and self.size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    for pos in range(0, len(mapped), self.chunk_bytes):
+                        yield mapped[pos:pos + self.chunk_bytes]
+            else:
+                while True:
+                    raw = f.read(self.chunk_bytes)
+                    if not raw:
+                        break
+                    yield raw
+
+
+def atomic_write(path, chunks, encoding='utf-8', newline='\n'):
+    """
+    chunks'taki metin parçalarını önce hedefle aynı dizindeki geçici dosyaya
+    yazar, diske indirdikten (fsync) sonra os.replace ile hedefin yerine koyar.
+    Kayıt yarıda kesilirse (hata, çökme) hedef dosya eski haliyle kalır.
+    """
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline=newline) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp dosyayı 0600 ile açar; mevcut dosyanın (yoksa umask'ın) izinleri korunur
+        try:
+            mode = os.stat(path).st_mode
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(temp_path, mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    _sync_directory(directory)
+
+
+def _sync_directory(directory):
+    """Yeniden adlandırmanın kalıcı olması için dizin girdisini diske indirir (yalnızca POSIX)."""
+    if os.name != 'posix':
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,320 @@
+# grammar.py
+import os
+import re
+
+# Varsayılan dilbilgisi dosyası
+GRAMMAR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'language.grammar')
+
+EPSILON = 'ε'
+
+_COMMENT_PATTERN = re.compile(r"(^|\s)#.*$")
+_SYMBOL_PATTERN = re.compile(r"[A-Z][A-Z0-9_]*(?:'[^']*')?|[@!]?[a-z_][a-z0-9_]*|%default|%lookahead|[:|]|ε")
+
+
+class GrammarError(Exception):
+    """Dilbilgisi dosyası okunamadığında veya LL(1) tablosu kurulamadığında."""
+
+
+class Terminal:
+    """Üretimdeki bir terminal; display, hata mesajında gösterilecek metindir."""
+
+    __slots__ = ('name', 'display')
+
+    def __init__(self, name, display=None):
+        self.name = name
+        self.display = display
+
+    def __repr__(self):
+        return self.name if self.display is None else f"{self.name}'{self.display}'"
+
+
+class Action:
+    """Anlamsal eylem (@ad) veya hata eylemi (!ad); dilbilgisi sembolü değildir."""
+
+    __slots__ = ('name', 'is_error')
+
+    def __init__(self, name, is_error=False):
+        self.name = name
+        self.is_error = is_error
+
+    def __repr__(self):
+        return ('!' if self.is_error else '@') + self.name
+
+
+class Production:
+    """Bir kuralın tek alternatifi. symbols: Terminal, Action veya kural adı (str)."""
+
+    __slots__ = ('index', 'head', 'symbols', 'is_default', 'lookahead')
+
+    def __init__(self, index, head, symbols, is_default=False, lookahead=None):
+        self.index = index
+        self.head = head
+        self.symbols = symbols
+        self.is_default = is_default
+        # Boş türetebilen alternatif için FOLLOW yerine kullanılacak terminaller (%lookahead)
+        self.lookahead = lookahead
+
+    @property
+    def is_error(self):
+        return any(isinstance(symbol, Action) and symbol.is_error for symbol in self.symbols)
+
+    def grammar_symbols(self):
+        """Eylemler hariç semboller (FIRST/FOLLOW hesabı için)."""
+        return [symbol for symbol in self.symbols if not isinstance(symbol, Action)]
+
+    def __repr__(self):
+        body = ' '.join(symbol if isinstance(symbol, str) else repr(symbol) for symbol in self.symbols) or EPSILON
+        return f"{self.head} : {body}"
+
+
+class Grammar:
+    """
+    Dilbilgisi dosyasından okunan kurallar. Yazım kuralları language.grammar'ın
+    başında açıklanmıştır.
+    """
+
+    def __init__(self):
+        self.rules = {}  # kural adı -> [Production] (dosyadaki sırayla)
+        self.productions = []
+        self.start = None
+        self.lazy = set()  # Tembel ayrıştırmada atlanabilen kurallar
+        self.discard = set()  # Değer yığınına konmayan terminal adları
+
+    @classmethod
+    def load(cls, path=GRAMMAR_PATH):
+        with open(path, encoding='utf-8') as f:
+            return cls.parse(f.read())
+
+    @classmethod
+    def parse(cls, text):
+        grammar = cls()
+        words = []
+        for line_num, line in enumerate(text.splitlines(), 1):
+            line = _COMMENT_PATTERN.sub('', line).strip()
+            if line.startswith('%') and not line.startswith(('%default', '%lookahead')):
+                grammar._directive(line.split(), line_num)
+                continue
+            position = 0
+            for match in _SYMBOL_PATTERN.finditer(line):
+                if line[position:match.start()].strip():
+                    break
+                words.append((match.group(), line_num))
+                position = match.end()
+            if line[position:].strip():
+                raise GrammarError(f"Satır {line_num}: tanınmayan '{line[position:].split()[0]}'")
+
+        grammar._read_rules(words)
+        grammar._validate()
+        return grammar
+
+    def _directive(self, parts, line_num):
+        name, args = parts[0], parts[1:]
+        if name == '%start' and len(args) == 1:
+            self.start = args[0]
+        elif name == '%lazy':
+            self.lazy.update(args)
+        elif name == '%discard':
+            self.discard.update(args)
+        else:
+            raise GrammarError(f"Satır {line_num}: bilinmeyen yönerge {' '.join(parts)}")
+
+    def _read_rules(self, words):
+        idx = 0
+        while idx < len(words):
+            head, line_num = words[idx]
+            if idx + 1 >= len(words) or words[idx + 1][0] != ':' or not head.islower():
+                raise GrammarError(f"Satır {line_num}: kural başı ('ad :') bekleniyordu, '{head}' bulundu")
+            if head in self.rules:
+                raise GrammarError(f"Satır {line_num}: '{head}' kuralı iki kez tanımlanmış")
+            idx += 2
+            alternatives = [[]]
+            # Sonraki kural başına ('ad :') kadar olan her şey bu kuralındır
+            while idx < len(words) and not (idx + 1 < len(words) and words[idx + 1][0] == ':'):
+                word = words[idx][0]
+                if word == '|':
+                    alternatives.append([])
+                else:
+                    alternatives[-1].append(word)
+                idx += 1
+            self.rules[head] = [self._production(head, alternative) for alternative in alternatives]
+
+    def _production(self, head, words):
+        symbols = []
+        is_default = False
+        lookahead = None
+        for word in words:
+            if lookahead is not None:
+                lookahead.add(word)
+            elif word == '%default':
+                is_default = True
+            elif word == '%lookahead':
+                lookahead = set()
+            elif word == EPSILON:
+                continue
+            elif word[0] in '@!':
+                symbols.append(Action(word[1:], is_error=word[0] == '!'))
+            elif word[0].isupper():
+                name, _, display = word.partition("'")
+                symbols.append(Terminal(name, display[:-1] if display else None))
+            else:
+                symbols.append(word)
+        production = Production(len(self.productions), head, symbols, is_default, lookahead)
+        self.productions.append(production)
+        return production
+
+    def _validate(self):
+        if self.start not in self.rules:
+            raise GrammarError(f"Başlangıç kuralı tanımlı değil: {self.start}")
+        for production in self.productions:
+            for symbol in production.symbols:
+                if isinstance(symbol, str) and symbol not in self.rules:
+                    raise GrammarError(f"'{production.head}' kuralında tanımsız kural: {symbol}")
+        for name in self.lazy:
+            if name not in self.rules:
+                raise GrammarError(f"%lazy: tanımsız kural {name}")
+        for head, productions in self.rules.items():
+            defaults = [p for p in productions if p.is_default or p.is_error]
+            if len(defaults) > 1:
+                raise GrammarError(f"'{head}' kuralında birden fazla varsayılan alternatif var")
+
+    @property
+    def terminals(self):
+        names = set()
+        for production in self.productions:
+            names.update(symbol.name for symbol in production.symbols if isinstance(symbol, Terminal))
+        return names
+
+
+class ParseTable:
+    """
+    LL(1) tablosu: table[kural][terminal] -> Production. defaults[kural], tabloda
+    karşılığı olmayan token için seçilecek üretimdir: %default veya hata
+    alternatifi, yoksa boş türetebilen ya da tek alternatif, o da yoksa None. conflicts,
+    boş olmayan alternatif lehine çözülen FIRST/FOLLOW çakışmalarıdır.
+    """
+
+    def __init__(self, grammar, table, defaults, first, follow, conflicts):
+        self.grammar = grammar
+        self.table = table
+        self.defaults = defaults
+        self.first = first
+        self.follow = follow
+        self.conflicts = conflicts
+
+
+def compute_first(grammar):
+    """Her kural için FIRST kümesi; boş dizgeyi türetebilen kuralların kümesinde EPSILON bulunur."""
+    first = {head: set() for head in grammar.rules}
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            if production.is_error:
+                continue
+            symbols_first = first_of_sequence(production.grammar_symbols(), first)
+            if not symbols_first <= first[production.head]:
+                first[production.head] |= symbols_first
+                changed = True
+    return first
+
+
+def first_of_sequence(symbols, first):
+    result = set()
+    for symbol in symbols:
+        if isinstance(symbol, Terminal):
+            result.add(symbol.name)
+            return result
+        result |= first[symbol] - {EPSILON}
+        if EPSILON not in first[symbol]:
+            return result
+    result.add(EPSILON)
+    return result
+
+
+def compute_follow(grammar, first):
+    follow = {head: set() for head in grammar.rules}
+    changed = True
+    while changed:
+        changed = False
+        for production in grammar.productions:
+            if production.is_error:
+                continue
+            symbols = production.grammar_symbols()
+            for idx, symbol in enumerate(symbols):
+                if isinstance(symbol, Terminal):
+                    continue
+                rest_first = first_of_sequence(symbols[idx + 1:], first)
+                additions = rest_first - {EPSILON}
+                if EPSILON in rest_first:
+                    additions |= follow[production.head]
+                if not additions <= follow[symbol]:
+                    follow[symbol] |= additions
+                    changed = True
+    return follow
+
+
+def build_table(grammar):
+    """
+    LL(1) tablosunu kurar. İki alternatif aynı terminalle başlıyorsa (FIRST/FIRST)
+    dilbilgisi LL(1) değildir ve GrammarError fırlatılır. Bir alternatifin FIRST
+    terminali başka bir alternatifin FOLLOW girdisiyle çakışırsa FIRST kazanır.
+    """
+    first = compute_first(grammar)
+    follow = compute_follow(grammar, first)
+    table = {head: {} for head in grammar.rules}
+    from_follow = set()  # FOLLOW'dan gelen (kural, terminal) girdileri
+    conflicts = []
+
+    for production in grammar.productions:
+        if production.is_error:
+            continue
+        row = table[production.head]
+        symbols_first = first_of_sequence(production.grammar_symbols(), first)
+        for terminal in symbols_first - {EPSILON}:
+            existing = row.get(terminal)
+            if existing is production:
+                continue
+            if existing is not None and (production.head, terminal) not in from_follow:
+                raise GrammarError(f"LL(1) çakışması ({production.head}, {terminal}): "
+                                   f"'{existing}' ve '{production}'")
+            if existing is not None:
+                conflicts.append((production.head, terminal, production, existing))
+                from_follow.discard((production.head, terminal))
+            row[terminal] = production
+        if EPSILON in symbols_first:
+            lookahead = production.lookahead if production.lookahead is not None else follow[production.head]
+            for terminal in lookahead:
+                existing = row.get(terminal)
+                if existing is production:
+                    continue
+                if existing is None:
+                    row[terminal] = production
+                    from_follow.add((production.head, terminal))
+                elif (production.head, terminal) in from_follow:
+                    raise GrammarError(f"LL(1) çakışması ({production.head}, {terminal}): "
+                                       f"'{existing}' ve '{production}' boş türetebiliyor")
+                else:
+                    conflicts.append((production.head, terminal, existing, production))
+
+    defaults = {}
+    for head, productions in grammar.rules.items():
+        explicit = [p for p in productions if p.is_default or p.is_error]
+        nullable = [p for p in productions
+                    if not p.is_error and EPSILON in first_of_sequence(p.grammar_symbols(), first)]
+        if explicit or nullable:
+            defaults[head] = (explicit or nullable)[0]
+        else:
+            # Tek alternatifli kural doğrudan açılır; hata ilk uymayan terminalde oluşur
+            defaults[head] = productions[0] if len(productions) == 1 else None
+    return ParseTable(grammar, table, defaults, first, follow, conflicts)
+
+
+if __name__ == '__main__':
+    parse_table = build_table(Grammar.load())
+    grammar = parse_table.grammar
+    entries = sum(len(row) for row in parse_table.table.values())
+    print(f"{len(grammar.rules)} kural, {len(grammar.productions)} üretim, "
+          f"{len(grammar.terminals)} terminal, {entries} tablo girdisi")
+    print(f"Boş olmayan alternatif lehine çözülen çakışma: {len(parse_table.conflicts)}")
+    for head, terminal, chosen, dropped in parse_table.conflicts:
+        print(f"  ({head}, {terminal}): '{chosen}' seçildi, '{dropped}' yerine")
@@ -0,0 +1,59 @@
+# highlight_policy.py
+
+
+class HighlightPolicy:
+    """
+    Belge boyutuna ve son çalışma sürelerine göre ne kadar analiz yapılacağını seçer.
+
+    - MODE_FULL: tokenleme, renklendirme, Parser.parse ve AST paneli
+    - MODE_LEXICAL: sadece tokenleme ve renklendirme (parser ve AST paneli kapalı)
+    - MODE_PLAIN: hiçbir analiz yapılmaz, metin düz gösterilir
+
+    Boyut sınırları ayarlanabilir. Ayrıca bir mod zaman bütçesini aşarsa, o
+    boyuttaki ve daha büyük belgeler için bir alt moda geçilir; belge bu
+    boyutun altına küçüldüğünde üst moda kendiliğinden dönülür.
+    """
+
+    MODE_FULL = 'full'
+    MODE_LEXICAL = 'lexical'
+    MODE_PLAIN = 'plain'
+
+    MODE_DESCRIPTIONS = {
+        MODE_FULL: "Tam analiz",
+        MODE_LEXICAL: "Büyük dosya: sadece sözcüksel vurgulama (parser ve AST kapalı)",
+        MODE_PLAIN: "Çok büyük dosya: vurgulama kapalı",
+    }
+
+    def __init__(self, full_max_lines=3000, full_max_chars=150_000,
+                 lexical_max_lines=30_000, lexical_max_chars=1_500_000,
+                 time_budget=0.2):
+        self.full_max_lines = full_max_lines
+        self.full_max_chars = full_max_chars
+        self.lexical_max_lines = lexical_max_lines
+        self.lexical_max_chars = lexical_max_chars
+        self.time_budget = time_budget  # Saniye cinsinden, bir vurgulama turu için
+
+        # Zaman bütçesini aşan en küçük belge boyutları (karakter); None = sınır yok
+        self.slow_full_chars = None
+        self.slow_lexical_chars = None
+
+    def choose_mode(self, line_count, char_count):
+        if line_count <= self.full_max_lines and char_count <= self.full_max_chars and \
+                (self.slow_full_chars is None or char_count < self.slow_full_chars):
+            return self.MODE_FULL
+        if line_count <= self.lexical_max_lines and char_count <= self.lexical_max_chars and \
+                (self.slow_lexical_chars is None or char_count < self.slow_lexical_chars):
+            return self.MODE_LEXICAL
+        return self.MODE_PLAIN
+
+    def record_timing(self, mode, char_count, elapsed):
+        """Bir vurgulama turunun süresini kaydeder; bütçe aşıldıysa o boyut için modu düşürür."""
+        if elapsed <= self.time_budget:
+            return
+        if mode == self.MODE_FULL:
+            self.slow_full_chars = char_count if self.slow_full_chars is None else min(self.slow_full_chars, char_count)
+        elif mode == self.MODE_LEXICAL:
+            self.slow_lexical_chars = char_count if self.slow_lexical_chars is None else min(self.slow_lexical_chars, char_count)
+
+    def describe(self, mode):
+        return self.MODE_DESCRIPTIONS[mode]
@@ -0,0 +1,365 @@
+# highlight_server.py
+import argparse
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer import Lexer, IncrementalLexer
+from parser import Parser, ParserError
+from diagnostics import DiagnosticCollector, SEVERITY_ERROR, CODE_INDENT
+from themes import TOKEN_TAGS
+
+# Hata kodları (JSON-RPC'ye benzer)
+ERROR_INVALID_REQUEST = -32600
+ERROR_METHOD_NOT_FOUND = -32601
+ERROR_INVALID_PARAMS = -32602
+ERROR_ANALYSIS = -32000
+ERROR_CANCELLED = -32800
+
+_worker_lexer = None
+
+
+def _get_lexer():
+    global _worker_lexer
+    if _worker_lexer is None:
+        _worker_lexer = Lexer()
+    return _worker_lexer
+
+
+def _diagnostics_to_json(diagnostics):
+    return [{'severity': d.severity, 'code': d.code, 'message': d.message,
+             'line': d.line, 'column': d.column, 'end_column': d.end_column} for d in diagnostics]
+
+
+def _highlight_spans(tokens):
+    """Renklendirilecek tokenlar için [satır, sütun, uzunluk, tag] listesi."""
+    spans = []
+    for token in tokens:
+        tag = TOKEN_TAGS.get(token.type)
+        if tag is not None:
+            spans.append([token.line, token.column, len(token.value), tag])
+    return spans
+
+
+def _report_lexer_error(diagnostics, error):
+    # Girinti hataları (LexerError) tanı olarak döner; satırı bilinmiyorsa 0 kullanılır
+    line = getattr(error, 'line', None)
+    diagnostics.report(SEVERITY_ERROR, CODE_INDENT, str(error), line if line is not None else 0, 0)
+
+
+def _tokenize(code, diagnostics):
+    try:
+        return _get_lexer().tokenize(code, diagnostics)
+    except RuntimeError as e:
+        _report_lexer_error(diagnostics, e)
+        return []
+
+
+def tokenize_job(code):
+    diagnostics = DiagnosticCollector()
+    tokens = _tokenize(code, diagnostics)
+    return {'tokens': [[t.type.name, t.value, t.line, t.column] for t in tokens],
+            'diagnostics': _diagnostics_to_json(diagnostics)}
+
+
+def parse_job(code):
+    diagnostics = DiagnosticCollector()
+    tokens = _tokenize(code, diagnostics)
+    ast = None
+    if tokens:
+        try:
+            ast = repr(Parser(tokens, diagnostics).parse())
+        except ParserError:
+            pass  # Hata zaten tanı listesinde
+    return {'ast': ast, 'diagnostics': _diagnostics_to_json(diagnostics)}
+
+
+def highlight_job(code):
+    diagnostics = DiagnosticCollector()
+    tokens = _tokenize(code, diagnostics)
+    return {'spans': _highlight_spans(tokens), 'diagnostics': _diagnostics_to_json(diagnostics)}
+
+
+_JOBS = {'tokenize': tokenize_job, 'parse': parse_job, 'highlight': highlight_job}
+
+
+class RequestError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class _Document:
+    def __init__(self):
+        self.lexer = IncrementalLexer(_get_lexer())
+        self.text = ''
+
+
+class HighlightServer:
+    """
+    Lexer ve Parser'ı Tk başlatmadan kullanmak isteyen araçlar için asyncio sunucusu.
+
+    Her satır bir JSON isteğidir: {"id": 1, "method": "highlight", "params": {"text": "..."}}.
+    Yanıtlar {"id": 1, "result": ...} veya {"id": 1, "error": {"code", "message"}} şeklindedir.
+
+    - tokenize / parse / highlight: tam metin analizleri süreç havuzunda çalışır;
+      küçük metinler IPC maliyetinden kaçınmak için doğrudan işlenir.
+    - open / change / close: belge başına IncrementalLexer tutulur; change yalnızca
+      değişen satırları yeniden tarar ve o satırların renk aralıklarını döndürür.
+      Belgeler bağlantıya aittir: aynı uri'yi açan iki istemci birbirini etkilemez,
+      bağlantı kapanınca açık kalan belgeleri de bırakılır.
+    - cancel: bekleyen bir isteği iptal eder.
+
+    Aynı anda en fazla max_concurrency analiz çalışır. Bir bağlantıdan en fazla
+    max_pending istek kuyrukta bekleyebilir; kuyruk doluyken bağlantıdan okuma
+    durur (geri basınç). İstemci yalnızca yazmayı bitirirse (EOF) gönderdiği
+    istekler yanıtlanır; bağlantı koptuğunda ya da yanıt yazılamadığında o
+    bağlantının bütün işleri iptal edilir. Aynı id ile yanıtı beklenen ikinci
+    bir istek reddedilir.
+    """
+
+    def __init__(self, workers=None, max_concurrency=None, max_pending=64, inline_threshold=4000):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.semaphore = asyncio.Semaphore(max_concurrency or self.workers * 2)
+        self.max_pending = max_pending
+        self.inline_threshold = inline_threshold
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+    async def handle_connection(self, reader, writer):
+        queue = asyncio.Queue(self.max_pending)
+        tasks = {}  # istek id -> asyncio.Task
+        in_flight = asyncio.Semaphore(self.max_pending)  # Bağlantı başına bekleyen/çalışan istek sınırı
+        write_lock = asyncio.Lock()
+        documents = {}  # uri -> _Document (yalnızca bu bağlantının belgeleri)
+        replies = set()  # request_done'ın gönderdiği iptal yanıtları
+        lost = False  # Yazma başarısız oldu ya da taşıyıcı kapanıyor
+
+        def abort():
+            # Bağlantı koptu: yanıtlanamayacak işler beklenmez, hepsi birlikte iptal edilir.
+            # Kuyruk da boşaltılır; okuma döngüsü put'ta bekliyorsa serbest kalır.
+            nonlocal lost
+            lost = True
+            consumer.cancel()
+            while not queue.empty():
+                queue.get_nowait()
+            current = asyncio.current_task()
+            for task in list(tasks.values()):
+                if task is not current:
+                    task.cancel()
+
+        async def send(message):
+            async with write_lock:
+                if writer.is_closing():
+                    raise ConnectionResetError("Bağlantı kapandı")
+                writer.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+
+        async def reply(message):
+            try:
+                await send(message)
+            except ConnectionError:
+                abort()
+
+        async def run_request(request_id, method, params):
+            try:
+                result = await self.dispatch(method, params, documents)
+                message = {'id': request_id, 'result': result}
+            except RequestError as e:
+                message = {'id': request_id, 'error': {'code': e.code, 'message': str(e)}}
+            except Exception as e:
+                message = {'id': request_id, 'error': {'code': ERROR_ANALYSIS, 'message': str(e)}}
+            await reply(message)
+
+        def request_done(request_id, task):
+            # Görev hiç başlamadan iptal edilmiş olabilir; temizlik burada yapılır
+            if tasks.get(request_id) is task:
+                del tasks[request_id]
+            in_flight.release()
+            if task.cancelled() and not lost and not writer.is_closing():
+                future = asyncio.ensure_future(
+                    reply({'id': request_id, 'error': {'code': ERROR_CANCELLED, 'message': "İstek iptal edildi"}}))
+                replies.add(future)
+                future.add_done_callback(replies.discard)
+
+        async def consume():
+            while True:
+                request = await queue.get()
+                if request is None:
+                    return
+                request_id, method, params = request
+                if method == 'cancel':
+                    task = tasks.get(params.get('id'))
+                    if task is not None:
+                        task.cancel()
+                    continue
+                if request_id in tasks:
+                    # Aynı id'li iki istek birbirinin iptalini ve temizliğini karıştırırdı
+                    await reply({'id': request_id, 'error': {'code': ERROR_INVALID_REQUEST,
+                                                             'message': f"İstek id'si zaten kullanımda: {request_id}"}})
+                    continue
+                # Sınır doluysa kuyruk boşalmaz, kuyruk dolunca da okuma durur
+                await in_flight.acquire()
+                task = asyncio.create_task(run_request(request_id, method, params))
+                tasks[request_id] = task
+                task.add_done_callback(lambda done, rid=request_id: request_done(rid, done))
+
+        consumer = asyncio.create_task(consume())
+        try:
+            while not lost:
+                line = await reader.readline()
+                if not line:
+                    break  # İstemci yazmayı bitirdi
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                    request = (message.get('id'), message['method'], message.get('params') or {})
+                except (ValueError, KeyError, AttributeError):
+                    await reply({'id': None, 'error': {'code': ERROR_INVALID_REQUEST, 'message': "Geçersiz istek"}})
+                    continue
+                # Kuyruk doluysa burada beklenir ve istemciden okuma durur
+                if not lost:
+                    await queue.put(request)
+            # Yarım kapanışta (EOF) taşıyıcı açık kaldıkça kuyruktaki ve çalışan
+            # istekler yanıtlanır; ilk yazma hatası abort() ile hepsini iptal eder
+            if not lost:
+                await queue.put(None)
+            await asyncio.wait([consumer])
+            while tasks or replies:
+                await asyncio.wait([*tasks.values(), *replies])
+        except ConnectionError:
+            pass  # Bağlantı koptu; kalan istekler aşağıda iptal edilir
+        finally:
+            consumer.cancel()
+            for task in list(tasks.values()):
+                task.cancel()
+            documents.clear()
+            if not writer.is_closing():
+                writer.close()
+
+    async def dispatch(self, method, params, documents):
+        """İsteği çalıştırır; documents, isteğin geldiği bağlantının uri -> _Document sözlüğüdür."""
+        if method in _JOBS:
+            text = params.get('text')
+            if not isinstance(text, str):
+                raise RequestError(ERROR_INVALID_PARAMS, "'text' parametresi gerekli")
+            return await self.run_job(_JOBS[method], text)
+        if method == 'open':
+            return self.open_document(documents, params)
+        if method == 'change':
+            return self.change_document(documents, params)
+        if method == 'close':
+            documents.pop(params.get('uri'), None)
+            return None
+        raise RequestError(ERROR_METHOD_NOT_FOUND, f"Bilinmeyen metot: {method}")
+
+    async def run_job(self, job, text):
+        async with self.semaphore:
+            if len(text) <= self.inline_threshold:
+                return job(text)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, job, text)
+
+    def _document(self, documents, params):
+        uri = params.get('uri')
+        if uri not in documents:
+            raise RequestError(ERROR_INVALID_PARAMS, f"Açık olmayan belge: {uri}")
+        return documents[uri]
+
+    def open_document(self, documents, params):
+        uri = params.get('uri')
+        text = params.get('text')
+        if not isinstance(uri, str) or not isinstance(text, str):
+            raise RequestError(ERROR_INVALID_PARAMS, "'uri' ve 'text' parametreleri gerekli")
+        document = _Document()
+        documents[uri] = document
+        return self._update_document(document, text)
+
+    def change_document(self, documents, params):
+        """
+        Belgeye değişiklik uygular. 'text' verilirse tüm metin değiştirilir; 'edits'
+        verilirse her düzenleme {"start_line", "end_line", "text"} (0 tabanlı,
+        bitiş hariç satır aralığı) olarak sırayla uygulanır.
+        """
+        document = self._document(documents, params)
+        try:
+            if 'text' in params:
+                text = params['text']
+            else:
+                lines = document.text.splitlines(keepends=True)
+                for edit in params.get('edits', []):
+                    lines[edit['start_line']:edit['end_line']] = edit['text'].splitlines(keepends=True)
+                text = ''.join(lines)
+        except (KeyError, TypeError, AttributeError) as e:
+            # Eksik alan ya da yanlış türde değer: analiz hatası değil, geçersiz parametre
+            raise RequestError(ERROR_INVALID_PARAMS, f"Geçersiz düzenleme: {e!r}")
+        if not isinstance(text, str):
+            raise RequestError(ERROR_INVALID_PARAMS, "'text' parametresi metin olmalı")
+        return self._update_document(document, text)
+
+    def _update_document(self, document, text):
+        diagnostics = DiagnosticCollector()
+        try:
+            changed = document.lexer.update(text)
+        except RuntimeError as e:
+            _report_lexer_error(diagnostics, e)
+            changed = None
+        document.text = text
+        if changed is None:
+            return {'changed': None, 'spans': [], 'diagnostics': _diagnostics_to_json(diagnostics)}
+
+        start, old_end, new_end = changed
+        tokens = [token for line_tokens in document.lexer.line_tokens[start:new_end] for token in line_tokens]
+        document.lexer.collect_diagnostics(diagnostics)
+        return {'changed': {'start_line': start, 'old_end_line': old_end, 'new_end_line': new_end},
+                'spans': _highlight_spans(tokens),
+                'diagnostics': _diagnostics_to_json(diagnostics)}
+
+
+async def _stdio_streams():
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=2 ** 26)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+    return reader, writer
+
+
+async def serve(args):
+    server = HighlightServer(workers=args.workers, max_concurrency=args.max_concurrency)
+    try:
+        if args.socket:
+            async with await asyncio.start_unix_server(server.handle_connection, path=args.socket,
+                                                       limit=2 ** 26) as unix_server:
+                await unix_server.serve_forever()
+        elif args.port:
+            async with await asyncio.start_server(server.handle_connection, '127.0.0.1', args.port,
+                                                  limit=2 ** 26) as tcp_server:
+                await tcp_server.serve_forever()
+        else:
+            reader, writer = await _stdio_streams()
+            await server.handle_connection(reader, writer)
+    finally:
+        server.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Lexer/Parser için asyncio vurgulama servisi")
+    arg_parser.add_argument('--socket', help="Unix soket yolu (verilmezse stdio kullanılır)")
+    arg_parser.add_argument('--port', type=int, help="127.0.0.1 üzerinde TCP portu")
+    arg_parser.add_argument('--workers', type=int, help="Süreç havuzu boyutu")
+    arg_parser.add_argument('--max-concurrency', type=int, help="Aynı anda çalışan en fazla analiz")
+    args = arg_parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
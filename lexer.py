@@ -1,164 +1,183 @@
 # lexer.py
-import re
+from array import array
+from bisect import bisect_right
 from tokens import Token, TokenType
+from structure import StructureIndex
+from lexer_backends import DEFAULT_BACKEND, shared_backend
+
+# IncrementalLexer.update_steps'in ilerleme bildirdiği satır aralığı
+LEX_STEP_LINES = 128
+
+
+class LexerError(RuntimeError):
+    """Girinti hataları için; satır numarasını da taşır."""
+
+    def __init__(self, message, line=None):
+        super().__init__(message)
+        self.line = line
+
+    def __reduce__(self):
+        # Süreçler arasında (parallel_lexer) satır bilgisi kaybolmasın
+        return self.__class__, (str(self), self.line)
+
+
+# Token desenleri (sıra önemlidir) ve anahtar kelime tablosu; bütün Lexer
+# örnekleri bunları ve derlenmiş tarayıcıyı paylaşır
+TOKEN_SPECS = (
+    ('WHITESPACE', r'\s+'),
+    ('COMMENT', r'#.*'),
+    ('STRING', r'"[^"]*"|\'[^\']*\''),  # Çift veya tek tırnaklı dizeler
+    ('NUMBER', r'\b\d+(\.\d*)?|\.\d+\b'),  # Tam sayılar veya ondalıklı sayılar
+
+    # Operatörler: Önce uzun olanlar gelmeli, sonra kısa olanlar
+    ('EQ', r'=='),  # Eşittir
+    ('NE', r'!='),  # Eşit değildir
+    ('LE', r'<='),  # Küçük eşit
+    ('GE', r'>='),  # Büyük eşit
+    ('LT', r'<'),  # Küçük
+    ('GT', r'>'),  # Büyük
+
+    ('PLUS', r'\+'),  # Artı
+    ('MINUS', r'-'),  # Eksi
+    ('MULTIPLY', r'\*'),  # Çarpı
+    ('DIVIDE', r'/'),  # Bölü
+    ('MODULO', r'%'),  # Modulo
+
+    ('ASSIGN', r'='),  # Atama operatörü
+
+    ('LPAREN', r'\('),
+    ('RPAREN', r'\)'),
+    ('COLON', r':'),
+    ('COMMA', r','),
+
+    # Anahtar kelimeler (IDENTIFIER'dan önce gelmeli)
+    ('KEYWORD_IF', r'\bif\b'),
+    ('KEYWORD_ELIF', r'\belif\b'),
+    ('KEYWORD_ELSE', r'\belse\b'),
+    ('KEYWORD_WHILE', r'\bwhile\b'),
+    ('KEYWORD_DEF', r'\bdef\b'),
+    ('KEYWORD_RETURN', r'\breturn\b'),
+    ('KEYWORD_TRUE', r'\bTrue\b'),
+    ('KEYWORD_FALSE', r'\bFalse\b'),
+    ('KEYWORD_NONE', r'\bNone\b'),
+    ('KEYWORD_AND', r'\band\b'),
+    ('KEYWORD_OR', r'\bor\b'),
+    ('KEYWORD_NOT', r'\bnot\b'),
+    ('KEYWORD_PRINT', r'\bprint\b'),
+    ('KEYWORD_PASS', r'\bpass\b'),
+    ('KEYWORD_IMPORT', r'\bimport\b'),  # Eklemeyi unutmayın
+    ('KEYWORD_FROM', r'\bfrom\b'),  # Eklemeyi unutmayın
+
+    ('IDENTIFIER', r'[a-zA-Z_][a-zA-Z0-9_]*'),  # Anahtar kelimelerden sonra gelmeli
+
+    ('NEWLINE', r'\n'),  # Yeni satır tokenı
+
+    ('MISMATCH', r'.')  # Tanınmayan karakterler için (en sonda)
+)
+
+KEYWORDS = {
+    'if': TokenType.KEYWORD_IF,
+    'else': TokenType.KEYWORD_ELSE,
+    'elif': TokenType.KEYWORD_ELIF,
+    'while': TokenType.KEYWORD_WHILE,
+    'def': TokenType.KEYWORD_DEF,
+    'return': TokenType.KEYWORD_RETURN,
+    'True': TokenType.KEYWORD_TRUE,
+    'False': TokenType.KEYWORD_FALSE,
+    'None': TokenType.KEYWORD_NONE,
+    'print': TokenType.KEYWORD_PRINT,
+    'and': TokenType.KEYWORD_AND,
+    'or': TokenType.KEYWORD_OR,
+    'not': TokenType.KEYWORD_NOT
+}
 
 
 class Lexer:
-    def __init__(self):
-        self.token_specs = [
-            ('WHITESPACE', r'\s+'),
-            ('COMMENT', r'#.*'),
-            ('STRING', r'"[^"]*"|\'[^\']*\''),  # Çift veya tek tırnaklı dizeler
-            ('NUMBER', r'\b\d+(\.\d*)?|\.\d+\b'),  # Tam sayılar veya ondalıklı sayılar
-
-            # Operatörler: Önce uzun olanlar gelmeli, sonra kısa olanlar
-            ('EQ', r'=='),  # Eşittir
-            ('NE', r'!='),  # Eşit değildir
-            ('LE', r'<='),  # Küçük eşit
-            ('GE', r'>='),  # Büyük eşit
-            ('LT', r'<'),  # Küçük
-            ('GT', r'>'),  # Büyük
-
-            ('PLUS', r'\+'),  # Artı
-            ('MINUS', r'-'),  # Eksi
-            ('MULTIPLY', r'\*'),  # Çarpı
-            ('DIVIDE', r'/'),  # Bölü
-            ('MODULO', r'%'),  # Modulo
-
-            ('ASSIGN', r'='),  # Atama operatörü
-
-            ('LPAREN', r'\('),
-            ('RPAREN', r'\)'),
-            ('COLON', r':'),
-            ('COMMA', r','),
-
-            # Anahtar kelimeler (IDENTIFIER'dan önce gelmeli)
-            ('KEYWORD_IF', r'\bif\b'),
-            ('KEYWORD_ELIF', r'\belif\b'),
-            ('KEYWORD_ELSE', r'\belse\b'),
-            ('KEYWORD_WHILE', r'\bwhile\b'),
-            ('KEYWORD_DEF', r'\bdef\b'),
-            ('KEYWORD_RETURN', r'\breturn\b'),
-            ('KEYWORD_TRUE', r'\bTrue\b'),
-            ('KEYWORD_FALSE', r'\bFalse\b'),
-            ('KEYWORD_NONE', r'\bNone\b'),
-            ('KEYWORD_AND', r'\band\b'),
-            ('KEYWORD_OR', r'\bor\b'),
-            ('KEYWORD_NOT', r'\bnot\b'),
-            ('KEYWORD_PRINT', r'\bprint\b'),
-            ('KEYWORD_PASS', r'\bpass\b'),
-            ('KEYWORD_IMPORT', r'\bimport\b'),  # Eklemeyi unutmayın
-            ('KEYWORD_FROM', r'\bfrom\b'),  # Eklemeyi unutmayın
-
-            ('IDENTIFIER', r'[a-zA-Z_][a-zA-Z0-9_]*'),  # Anahtar kelimelerden sonra gelmeli
-
-            ('NEWLINE', r'\n'),  # Yeni satır tokenı
-
-            ('MISMATCH', r'.')  # Tanınmayan karakterler için (en sonda)
-        ]
-
-        self.keywords = {
-            'if': TokenType.KEYWORD_IF,
-            'else': TokenType.KEYWORD_ELSE,
-            'elif': TokenType.KEYWORD_ELIF,
-            'while': TokenType.KEYWORD_WHILE,
-            'def': TokenType.KEYWORD_DEF,
-            'return': TokenType.KEYWORD_RETURN,
-            'True': TokenType.KEYWORD_TRUE,
-            'False': TokenType.KEYWORD_FALSE,
-            'None': TokenType.KEYWORD_NONE,
-            'print': TokenType.KEYWORD_PRINT,
-            'and': TokenType.KEYWORD_AND,
-            'or': TokenType.KEYWORD_OR,
-            'not': TokenType.KEYWORD_NOT
-        }
-
-        self.full_regex = re.compile(
-            '|'.join(f'(?P<{name}>{pattern})' for name, pattern in self.token_specs)
-        )
-
-    def tokenize(self, code):
-        tokens = []
-        line_num = 1
-        indent_stack = [0]
+    def __init__(self, backend=None):
+        self.token_specs = TOKEN_SPECS
+        self.keywords = KEYWORDS
+        # Satır içi tarayıcı; indent/yorum satırı işleme bütün arka uçlarda ortaktır.
+        # Desenler ilk kullanımda bir kez derlenir ve aynı arka ucu seçen örneklerce paylaşılır.
+        self.backend = shared_backend(backend or DEFAULT_BACKEND, self.token_specs, self.keywords)
 
+    def split_lines(self, code):
         lines = code.splitlines(keepends=True)
         if lines and not lines[-1].endswith('\n'):
             lines[-1] += '\n'
+        return lines
 
+    def tokenize(self, code, diagnostics=None):
+        """
+        Kodu tokenlara ayırır. Tanımlanamayan karakterler, verilmişse diagnostics
+        (DiagnosticCollector) nesnesine bildirilir; tokenleme sırasında G/Ç yapılmaz.
+        """
+        tokens = []
+        indent_stack = [0]
+
+        lines = self.split_lines(code)
         for line_idx, line in enumerate(lines):
-            # Boş satırları tamamen atla. Lexer boş satırlar için token üretmemeli.
-            if not line.strip():
-                line_num += 1
-                continue
-
-            current_line_indent = 0
-            for char in line:
-                if char == ' ':
-                    current_line_indent += 1
-                elif char == '\t':
-                    current_line_indent += 4
-                else:
-                    break
-
-            code_content_on_line = line[current_line_indent:].rstrip('\n')
-
-            # Yorum satırları için sadece COMMENT token'ı ve NEWLINE üret
-            if code_content_on_line.startswith('#'):
-                tokens.append(Token(TokenType.COMMENT, code_content_on_line, line_num, current_line_indent))
-                tokens.append(Token(TokenType.NEWLINE, '\n', line_num, len(line.rstrip('\n'))))
-                line_num += 1
-                continue
-
-            # Girinti kontrolü (sadece boş ve yorum olmayan satırlar için)
-            if current_line_indent > indent_stack[-1]:
-                tokens.append(Token(TokenType.INDENT, '', line_num, indent_stack[-1]))
-                indent_stack.append(current_line_indent)
-            elif current_line_indent < indent_stack[-1]:
-                while current_line_indent < indent_stack[-1]:
-                    if not indent_stack:
-                        raise RuntimeError(f"Aşırı girinti azaltma hatası (DEDENT) satır {line_num}")
-                    tokens.append(Token(TokenType.DEDENT, '', line_num, indent_stack[-1]))
-                    indent_stack.pop()
-                if current_line_indent != indent_stack[-1]:
-                    raise RuntimeError(
-                        f"Geçersiz girinti seviyesi satır {line_num}: {current_line_indent} yerine {indent_stack[-1]} bekleniyor")
-
-            # Satır içi tokenleme (gerçek kod içeriği için)
-            current_column = 0
-            while current_column < len(code_content_on_line):
-                match = self.full_regex.match(code_content_on_line, current_column)
-
-                if not match:
-                    char = code_content_on_line[current_column]
-                    tokens.append(Token(TokenType.MISMATCH, char, line_num, current_line_indent + current_column))
-                    print(
-                        f"Uyarı: Tanımlanamayan karakter: '{char}' (Satır {line_num}, Sütun {current_line_indent + current_column})")
-                    current_column += 1
-                    continue
-
-                kind = match.lastgroup
-                value = match.group(kind)
-                token_column = current_line_indent + match.start()
-
-                if kind == 'WHITESPACE':
-                    pass
-                elif kind == 'IDENTIFIER' and value in self.keywords:
-                    tokens.append(Token(self.keywords[value], value, line_num, token_column))
-                elif kind == 'STRING':
-                    tokens.append(Token(TokenType.STRING, value, line_num, token_column))
-                elif kind == 'OPERATOR':
-                    tokens.append(Token(TokenType.OPERATOR, value, line_num, token_column))
-                elif kind in ['LPAREN', 'RPAREN', 'COLON', 'COMMA']:
-                    tokens.append(Token(TokenType[kind], value, line_num, token_column))
-                else:
-                    tokens.append(Token(TokenType[kind], value, line_num, token_column))
-
-                current_column = match.end()
-
-            # Her kod satırının sonunda bir NEWLINE token'ı ekle
+            tokens.extend(self.tokenize_line(line, line_idx + 1, indent_stack, diagnostics))
+
+        tokens.extend(self.finish_tokens(indent_stack, len(lines) + 1))
+        return tokens
+
+    def tokenize_line(self, line, line_num, indent_stack, diagnostics=None):
+        """
+        Tek bir satırı tokenlara ayırır. indent_stack yerinde güncellenir; böylece
+        satır başındaki girinti yığını saklanarak satırlar tek tek yeniden taranabilir.
+        """
+        tokens = []
+
+        # Boş satırları tamamen atla. Lexer boş satırlar için token üretmemeli.
+        if not line.strip():
+            return tokens
+
+        current_line_indent = 0
+        for char in line:
+            if char == ' ':
+                current_line_indent += 1
+            elif char == '\t':
+                current_line_indent += 4
+            else:
+                break
+
+        code_content_on_line = line[current_line_indent:].rstrip('\n')
+
+        # Yorum satırları için sadece COMMENT token'ı ve NEWLINE üret
+        if code_content_on_line.startswith('#'):
+            tokens.append(Token(TokenType.COMMENT, code_content_on_line, line_num, current_line_indent))
             tokens.append(Token(TokenType.NEWLINE, '\n', line_num, len(line.rstrip('\n'))))
-            line_num += 1
+            return tokens
+
+        # Girinti kontrolü (sadece boş ve yorum olmayan satırlar için)
+        if current_line_indent > indent_stack[-1]:
+            tokens.append(Token(TokenType.INDENT, '', line_num, indent_stack[-1]))
+            indent_stack.append(current_line_indent)
+        elif current_line_indent < indent_stack[-1]:
+            while current_line_indent < indent_stack[-1]:
+                if not indent_stack:
+                    raise LexerError(f"Aşırı girinti azaltma hatası (DEDENT) satır {line_num}", line_num)
+                tokens.append(Token(TokenType.DEDENT, '', line_num, indent_stack[-1]))
+                indent_stack.pop()
+            if current_line_indent != indent_stack[-1]:
+                raise LexerError(
+                    f"Geçersiz girinti seviyesi satır {line_num}: {current_line_indent} yerine {indent_stack[-1]} bekleniyor",
+                    line_num)
+
+        # Satır içi tokenleme (gerçek kod içeriği için) seçilen arka uçta yapılır
+        self.backend.scan(code_content_on_line, line_num, current_line_indent, tokens, diagnostics)
+
+        # Her kod satırının sonunda bir NEWLINE token'ı ekle
+        tokens.append(Token(TokenType.NEWLINE, '\n', line_num, len(line.rstrip('\n'))))
+        return tokens
+
+    def finish_tokens(self, indent_stack, line_num):
+        """
+        Dosya sonu tokenlarını (kalan DEDENT'ler ve EOF) üretir. line_num, son
+        satırdan bir sonraki satırın numarasıdır.
+        """
+        tokens = []
+        indent_stack = list(indent_stack)
 
         # Dosyanın sonunda kalan tüm açık girintileri kapat
         while indent_stack[-1] > 0:
@@ -170,6 +189,238 @@ class Lexer:
         return tokens
 
 
+class IncrementalLexer:
+    """
+    Lexer'ı satır satır önbelleğe alarak kullanır. Her güncellemede yalnızca
+    değişen satırlar (ve girinti durumu eski taramayla yakınsayana kadar
+    sonrakiler) yeniden taranır; değişmeyen satırların tokenları yeniden
+    kullanılır ve yalnızca satır numaraları kaydırılır.
+    """
+
+    def __init__(self, lexer=None):
+        self.lexer = lexer if lexer is not None else Lexer()
+        self.lines = []  # Kaynak satırları (split_lines çıktısı)
+        self.line_tokens = []  # Her satırın token listesi
+        self.line_states = []  # Her satırın başındaki girinti yığını (tuple)
+        self.final_state = (0,)  # Son satırdan sonraki girinti yığını
+        self.tail_tokens = self.lexer.finish_tokens([0], 1)
+        self.structure = StructureIndex()
+        # Her satır için (baştaki INDENT/DEDENT sayısı, görünür tokenların sütunları);
+        # sütunlar satır kaydığında değişmediği için yalnızca yeniden taranan satırlarda kurulur
+        self.line_columns = []
+        self._line_offsets = None  # tokens() listesinde her satırın ilk token indeksi (tembel)
+        self.revision = 0  # Önbelleğe işlenen her değişiklikte artar
+
+    def reset(self):
+        revision = self.revision
+        self.__init__(self.lexer)
+        self.revision = revision + 1  # Revizyonlar sıfırlamadan sonra da tekrar etmesin
+
+    def update(self, code, line_cache=None):
+        """
+        Önbelleği yeni metne göre günceller. Değişiklik yoksa None, varsa
+        (başlangıç, eski_bitiş, yeni_bitiş) şeklinde 0 tabanlı satır aralığı döndürür:
+        eski satırlardan [başlangıç, eski_bitiş) aralığı, yeniden taranan
+        [başlangıç, yeni_bitiş) aralığıyla değiştirilmiştir; geri kalan satırlar aynıdır.
+
+        line_cache verilirse (satır metni, girinti durumu) -> kayıt eşlemesi olarak
+        önce ona bakılır; kayıttaki tokens (tip, değer, sütun) demetleri ve
+        end_state (satır sonrası girinti yığını) kullanılır, satır yeniden taranmaz.
+        """
+        return self.replace_lines(0, len(self.lines), self.lexer.split_lines(code), line_cache)
+
+    def replace_lines(self, start, end, lines, line_cache=None):
+        """
+        Önbellekteki [start, end) satırlarını lines (split_lines biçiminde) ile
+        değiştirir; sonuç update ile aynıdır. Metin yeniden bölünmez ve aralığın
+        dışındaki satırlar karşılaştırılmaz; değişen aralığı zaten bilen çağıranlar
+        (örn. LSP didChange) için iş, belge boyuna değil düzenlemeye bağlıdır.
+        """
+        steps = self.replace_lines_steps(start, end, lines, line_cache=line_cache)
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+    def update_steps(self, code, step_lines=LEX_STEP_LINES, line_cache=None):
+        """
+        update'in dilimlenebilir hali: her step_lines satırda bir (taranan, toplam)
+        ilerlemesi üretir, bitince update'in sonucunu döndürür (StopIteration.value).
+
+        Token önbelleği tarama bittiğinde tek adımda değiştirilir (revision artar);
+        üreteç tarama sırasında bırakılırsa ya da tarama LexerError ile biterse
+        önbellek (ve revision) eski metnin tutarlı hali olarak kalır. Sonraki yapı
+        indeksi kurulumu sırasında bırakılırsa indeks bir sonraki update'te kaldığı
+        yerden tamamlanır.
+        """
+        return (yield from self.replace_lines_steps(0, len(self.lines), self.lexer.split_lines(code),
+                                                    step_lines, line_cache))
+
+    def replace_lines_steps(self, start, end, lines, step_lines=LEX_STEP_LINES, line_cache=None):
+        """replace_lines'ın dilimlenebilir hali; ilerleme ve sonuç update_steps ile aynıdır."""
+        old_lines = self.lines
+        offset = start  # lines[idx - offset], yeni metnin idx. satırıdır
+        old_end, new_end = end, start + len(lines)
+
+        # Aralığın içindeki ortak önek ve sonek ile değişen satır aralığını bul
+        limit = min(old_end, new_end)
+        while start < limit and old_lines[start] == lines[start - offset]:
+            start += 1
+        if start == old_end == new_end:
+            if len(self.structure.line_states) < len(self.line_tokens):
+                # Önceki güncellemenin yapı indeksi kurulumu yarıda kaldı; kaldığı yerden tamamlanır
+                yield from self.structure.rebuild_steps(len(self.structure.line_states), self.line_tokens, step_lines)
+            return None
+
+        while old_end > start and new_end > start and old_lines[old_end - 1] == lines[new_end - 1 - offset]:
+            old_end -= 1
+            new_end -= 1
+
+        # _relex durumu yalnızca bütün satırlar tarandıktan sonra değiştirir; girinti
+        # hatasında önbellek dokunulmamış kalır ve sonraki güncelleme oradan sürer
+        old_end, new_end = yield from self._relex(lines[start - offset:new_end - offset], start, old_end,
+                                                  step_lines, line_cache)
+
+        self._line_offsets = None
+        self.revision += 1
+        yield from self.structure.rebuild_steps(start, self.line_tokens, step_lines, old_end, new_end)
+        return start, old_end, new_end
+
+    def _relex(self, changed_lines, start, old_end, step_lines, line_cache):
+        """
+        [start, old_end) satırlarının yerine changed_lines'ı tarar; aralıktan sonraki
+        satırlar (metinleri değişmediği için self.lines'tan okunur) girinti durumu
+        eskisiyle aynı olana kadar yeniden taranır.
+        """
+        indent_stack = list(self.line_states[start]) if start < len(self.line_states) else list(self.final_state)
+        new_end = start + len(changed_lines)
+        delta = new_end - old_end
+
+        new_tokens = []
+        new_states = []
+        new_columns = []
+        total = new_end - start
+        for idx, line in enumerate(changed_lines, start):
+            state = tuple(indent_stack)
+            new_states.append(state)
+            new_tokens.append(self._tokenize_line(line, idx + 1, indent_stack, state, line_cache))
+            new_columns.append(_column_table(new_tokens[-1]))
+            if (idx - start + 1) % step_lines == 0:
+                yield idx - start + 1, total
+
+        # Sonek satırlar: girinti durumu eskisiyle aynı olana kadar yeniden tara
+        old_idx = old_end
+        new_idx = new_end
+        while old_idx < len(self.lines) and tuple(indent_stack) != self.line_states[old_idx]:
+            state = tuple(indent_stack)
+            new_states.append(state)
+            new_tokens.append(self._tokenize_line(self.lines[old_idx], new_idx + 1, indent_stack, state, line_cache))
+            new_columns.append(_column_table(new_tokens[-1]))
+            old_idx += 1
+            new_idx += 1
+            if (new_idx - start) % step_lines == 0:
+                yield new_idx - start, max(total, new_idx - start)
+
+        if old_idx == len(self.lines):
+            self.final_state = tuple(indent_stack)
+
+        # Yeniden kullanılan satırların satır numaralarını kaydır
+        if delta:
+            for line_tokens in self.line_tokens[old_idx:]:
+                for token in line_tokens:
+                    token.line += delta
+
+        self.line_tokens[start:old_idx] = new_tokens
+        self.line_states[start:old_idx] = new_states
+        self.line_columns[start:old_idx] = new_columns
+        self.lines[start:old_end] = changed_lines
+        self.tail_tokens = self.lexer.finish_tokens(self.final_state, len(self.lines) + 1)
+        return old_idx, new_idx
+
+    def _tokenize_line(self, line, line_num, indent_stack, state, line_cache):
+        if line_cache is not None:
+            cached = line_cache.get((line, state))
+            if cached is not None:
+                indent_stack[:] = cached.end_state
+                fields = cached.tokens
+                return [Token(fields[idx], fields[idx + 1], line_num, fields[idx + 2])
+                        for idx in range(0, len(fields), 3)]
+        return self.lexer.tokenize_line(line, line_num, indent_stack)
+
+    def collect_diagnostics(self, diagnostics):
+        """Önbellekteki tanımlanamayan karakterleri diagnostics nesnesine bildirir."""
+        for _ in self.collect_diagnostics_steps(diagnostics):
+            pass
+
+    def collect_diagnostics_steps(self, diagnostics, step_lines=LEX_STEP_LINES):
+        """collect_diagnostics'in her step_lines satırda bir (taranan, toplam) üreten hali."""
+        mismatch = TokenType.MISMATCH  # Enum üyesine her token için sınıf üzerinden erişmemek için
+        total = len(self.line_tokens)
+        for first in range(0, total, step_lines):
+            for line_tokens in self.line_tokens[first:first + step_lines]:
+                for token in line_tokens:
+                    if token.type is mismatch:
+                        diagnostics.report_mismatch(token.value, token.line, token.column)
+            yield min(first + step_lines, total), total
+
+    def token_at(self, line, column):
+        """
+        Verilen konumu (1 tabanlı satır, 0 tabanlı sütun) kapsayan token; yoksa
+        None. Satırın sütun dizisinde ikili arama yapılır.
+        """
+        idx = self.token_index_in_line(line, column)
+        return self.line_tokens[line - 1][idx] if idx is not None else None
+
+    def token_index_in_line(self, line, column):
+        if not 1 <= line <= len(self.line_columns):
+            return None
+        skip, columns = self.line_columns[line - 1]
+        pos = bisect_right(columns, column) - 1
+        if pos < 0:
+            return None
+        token = self.line_tokens[line - 1][skip + pos]
+        if column >= token.column + max(len(token.value), 1):
+            return None
+        return skip + pos
+
+    def token_index_at(self, line, column):
+        """token_at'in tokens() listesindeki indeksi; yoksa None."""
+        idx = self.token_index_in_line(line, column)
+        return self.line_offsets()[line - 1] + idx if idx is not None else None
+
+    def line_offsets(self):
+        """
+        Satır -> tokens() listesindeki token aralığı tablosu: satır i'nin (0
+        tabanlı) tokenları [offsets[i], offsets[i + 1]) aralığındadır.
+        """
+        if self._line_offsets is None:
+            offsets = array('l', [0]) * (len(self.line_tokens) + 1)
+            total = 0
+            for idx, line_tokens in enumerate(self.line_tokens):
+                offsets[idx] = total
+                total += len(line_tokens)
+            offsets[len(self.line_tokens)] = total
+            self._line_offsets = offsets
+        return self._line_offsets
+
+    def tokens(self):
+        """Lexer.tokenize ile aynı düz token listesini döndürür."""
+        tokens = []
+        for line_tokens in self.line_tokens:
+            tokens.extend(line_tokens)
+        tokens.extend(self.tail_tokens)
+        return tokens
+
+
+def _column_table(line_tokens):
+    """Satır başındaki yapısal tokenlar (INDENT/DEDENT) atlanarak görünür tokenların sütun dizisi."""
+    skip = 0
+    while skip < len(line_tokens) and not line_tokens[skip].value:
+        skip += 1
+    return skip, array('i', [token.column for token in line_tokens[skip:]])
+
+
 # Lexer test bloğu (basitleştirilmiş)
 if __name__ == '__main__':
     test_code = """
@@ -0,0 +1,335 @@
+# lexer_backends.py
+import re
+import sys
+import time
+
+from diagnostics import DiagnosticCollector
+from tokens import Token, TokenType
+
+# Lexer'ın varsayılan arka ucu; `python lexer_backends.py` karşılaştırmasında en hızlı çıkan
+DEFAULT_BACKEND = 'dispatch'
+
+# DispatchBackend'in ilk karakter sınıfları
+_OTHER = 0
+_SPACE = 1
+_NAME = 2
+_DIGIT = 3
+_DOT = 4
+_QUOTE = 5
+_COMMENT = 6
+_OPERATOR = 7
+
+# Bu spesifikasyonları DispatchBackend desen olarak değil kodla tanır
+_STRUCTURAL_SPECS = {'WHITESPACE', 'COMMENT', 'STRING', 'NUMBER', 'IDENTIFIER', 'NEWLINE', 'MISMATCH'}
+
+
+class RegexBackend:
+    """Tüm token desenlerini tek bir re alternasyonunda birleştiren özgün tarayıcı."""
+
+    name = 'regex'
+
+    def __init__(self, token_specs, keywords):
+        self.keywords = keywords
+        self.full_regex = re.compile(
+            '|'.join(f'(?P<{name}>{pattern})' for name, pattern in token_specs)
+        )
+
+    def scan(self, content, line_num, offset, tokens, diagnostics=None):
+        """
+        Girintisi ayrılmış satır içeriğini tokenlara ayırıp tokens'a ekler.
+        offset, içeriğin satırdaki başlangıç sütunudur.
+        """
+        current_column = 0
+        while current_column < len(content):
+            match = self.full_regex.match(content, current_column)
+
+            if not match:
+                char = content[current_column]
+                tokens.append(Token(TokenType.MISMATCH, char, line_num, offset + current_column))
+                if diagnostics is not None:
+                    diagnostics.report_mismatch(char, line_num, offset + current_column)
+                current_column += 1
+                continue
+
+            kind = match.lastgroup
+            value = match.group(kind)
+            token_column = offset + match.start()
+
+            if kind == 'WHITESPACE':
+                pass
+            elif kind == 'IDENTIFIER' and value in self.keywords:
+                tokens.append(Token(self.keywords[value], value, line_num, token_column))
+            elif kind == 'STRING':
+                tokens.append(Token(TokenType.STRING, value, line_num, token_column))
+            elif kind == 'OPERATOR':
+                tokens.append(Token(TokenType.OPERATOR, value, line_num, token_column))
+            elif kind in ['LPAREN', 'RPAREN', 'COLON', 'COMMA']:
+                tokens.append(Token(TokenType[kind], value, line_num, token_column))
+            elif kind == 'MISMATCH':
+                tokens.append(Token(TokenType.MISMATCH, value, line_num, token_column))
+                if diagnostics is not None:
+                    diagnostics.report_mismatch(value, line_num, token_column)
+            else:
+                tokens.append(Token(TokenType[kind], value, line_num, token_column))
+
+            current_column = match.end()
+
+
+class DispatchBackend:
+    """
+    İlk karaktere göre önceden hesaplanmış bir tabloyla dallanan elle yazılmış tarayıcı.
+
+    Her karakter için tüm alternasyonu denemek yerine sınıfı (boşluk, isim,
+    rakam, tırnak, operatör...) tek sözlük aramasıyla bulunur ve yalnızca o
+    sınıfın kuralı uygulanır. Operatörler ilk karakterlerine göre, token_specs
+    sırasıyla (uzun olanlar önce) denenir. RegexBackend ile aynı tokenları
+    üretir; \\b sınırlarından doğan özel durumlar da dahil (ör. 'ş1'deki 1 sayı
+    değildir, '1pass'teki pass anahtar kelime değil isimdir).
+    """
+
+    name = 'dispatch'
+
+    _spaces = re.compile(r'\s+')
+    _name_tail = re.compile(r'[a-zA-Z0-9_]*')
+    _number = re.compile(r'\b\d+(\.\d*)?')
+    _fraction = re.compile(r'\.\d+\b')
+
+    def __init__(self, token_specs, keywords):
+        self.keywords = keywords
+        self.bounded_keywords = {}  # \bkelime\b desenli anahtar kelimeler (keywords'te olmayanlar dahil)
+        self.operators = {}  # ilk karakter -> [(metin, tip)]
+        for name, pattern in token_specs:
+            if name in _STRUCTURAL_SPECS:
+                continue
+            word = re.fullmatch(r'\\b(\w+)\\b', pattern)
+            if name.startswith('KEYWORD_') and word:
+                self.bounded_keywords.setdefault(word.group(1), TokenType[name])
+                continue
+            literal = pattern.replace('\\', '')
+            if not literal or not re.fullmatch(pattern, literal) or literal[0].isalnum():
+                raise ValueError(f"DispatchBackend bu deseni desteklemiyor: {name} = {pattern!r}")
+            self.operators.setdefault(literal[0], []).append((literal, TokenType[name]))
+
+        self.classes = {chr(code): self._classify(chr(code)) for code in range(128)}
+        for char in self.operators:
+            self.classes[char] = _OPERATOR
+
+    @staticmethod
+    def _classify(char):
+        if char.isspace():
+            return _SPACE
+        if char.isdecimal():
+            return _DIGIT
+        if char.isascii() and (char.isalpha() or char == '_'):
+            return _NAME
+        return {'.': _DOT, '"': _QUOTE, "'": _QUOTE, '#': _COMMENT}.get(char, _OTHER)
+
+    def scan(self, content, line_num, offset, tokens, diagnostics=None):
+        append = tokens.append
+        classes = self.classes
+        keywords = self.keywords
+        bounded_keywords = self.bounded_keywords
+        name_tail = self._name_tail.match
+        identifier = TokenType.IDENTIFIER
+        length = len(content)
+        pos = 0
+        while pos < length:
+            char = content[pos]
+            kind = classes.get(char)
+            if kind is None:
+                kind = classes[char] = self._classify(char)
+
+            if kind == _NAME:
+                end = name_tail(content, pos + 1).end()
+                word = content[pos:end]
+                token_type = bounded_keywords.get(word)
+                # \b: önceki veya sonraki karakter bir kelime karakteriyse (ör. 'ş') desen eşleşmez
+                if token_type is not None and ((pos and _is_word(content[pos - 1])) or
+                                               (end < length and _is_word(content[end]))):
+                    token_type = None
+                if token_type is None:
+                    token_type = keywords.get(word, identifier)
+                append(Token(token_type, word, line_num, offset + pos))
+                pos = end
+                continue
+
+            if kind == _SPACE:
+                pos = self._spaces.match(content, pos).end()
+                continue
+
+            value = None
+            if kind == _OPERATOR:
+                for literal, token_type in self.operators[char]:
+                    if content.startswith(literal, pos):
+                        value = literal
+                        break
+            elif kind == _DIGIT:
+                match = self._number.match(content, pos)
+                if match:
+                    value, token_type = match.group(), TokenType.NUMBER
+            elif kind == _QUOTE:
+                end = content.find(char, pos + 1)
+                if end >= 0:
+                    value, token_type = content[pos:end + 1], TokenType.STRING
+            elif kind == _DOT:
+                match = self._fraction.match(content, pos)
+                if match:
+                    value, token_type = match.group(), TokenType.NUMBER
+            elif kind == _COMMENT:
+                value, token_type = content[pos:], TokenType.COMMENT
+
+            if value is None:
+                # Hiçbir desen eşleşmedi: tek karakterlik MISMATCH
+                append(Token(TokenType.MISMATCH, char, line_num, offset + pos))
+                if diagnostics is not None:
+                    diagnostics.report_mismatch(char, line_num, offset + pos)
+                pos += 1
+            else:
+                append(Token(token_type, value, line_num, offset + pos))
+                pos += len(value)
+
+
+def _is_word(char):
+    """re'deki \\w ile aynı: Unicode harf/rakam veya alt çizgi."""
+    return char.isalnum() or char == '_'
+
+
+BACKENDS = {RegexBackend.name: RegexBackend, DispatchBackend.name: DispatchBackend}
+
+
+def create_backend(name, token_specs, keywords):
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen lexer arka ucu: {name} (seçenekler: {', '.join(BACKENDS)})")
+    return BACKENDS[name](token_specs, keywords)
+
+
+_shared_backends = {}  # (ad, desenler, anahtar kelimeler) -> arka uç
+
+
+def shared_backend(name, token_specs, keywords):
+    """
+    create_backend gibi, fakat arka ucu aynı desen ve anahtar kelime tablosu
+    için süreç başına bir kez kurar. Arka uçlar tarama sırasında paylaşılan
+    durum tutmadığından aynı nesne bütün Lexer örneklerince kullanılabilir.
+    """
+    key = (name, tuple(token_specs), tuple(keywords.items()))
+    backend = _shared_backends.get(key)
+    if backend is None:
+        backend = _shared_backends[key] = create_backend(name, token_specs, keywords)
+    return backend
+
+
+# Uyumluluk denetiminin sabit örnekleri: \b sınırları, Unicode rakam/boşluklar, kapanmamış dizeler
+_CONFORMANCE_SAMPLES = [
+    "x = 10\nif x > 5:\n    print(\"Büyük\")\nelif x == 5:\n    pass\nelse:\n    y = x * 2.5 - .5\n",
+    "def f(a, b):\n    return a <= b and not b >= a or a != b\n\nwhile True:\n    f(1, 2) % 3\n",
+    "import os\nfrom x import y\n1pass ş1 şif passé ifé elif2 _if if_ None1 True\n",
+    "sayı = ٣٤ + 1.2.3 + 1. + .5a + .55 + 12abc\n\ta = 'aç\" + \"kapanmamış\n",
+    "x = 1  # yorum\n  # girintili yorum\n\u00a0y = 2\u3000+ 3\nz = 4\x0c\n€ $ ? ! != !== === <<= >>\n",
+    "if x:\r\n    y = 1\r\n\r\nelse:\n\ty\n",
+]
+
+# Rastgele satırların üretildiği parçalar (özel durumları sık tetikleyecek şekilde seçildi)
+_FUZZ_PIECES = [
+    'if', 'elif', 'else', 'pass', 'import', 'from', 'print', 'None', 'x', 'a1', '_', '1', '12', '3.', '.5', '.',
+    '٣', 'ş', 'é', '"', "'", '"s"', "'t'", '#', '=', '==', '!', '!=', '<', '<=', '>', '>=', '+', '-', '*', '/',
+    '%', '(', ')', ':', ',', ' ', '  ', '\t', '\u00a0', '€', '$',
+]
+
+
+def _token_key(token):
+    return token.type, token.value, token.line, token.column
+
+
+def _run(lexer, source):
+    diagnostics = DiagnosticCollector(max_diagnostics=sys.maxsize)
+    try:
+        tokens = lexer.tokenize(source, diagnostics)
+    except RuntimeError as e:
+        return 'error', str(e)
+    return ([_token_key(token) for token in tokens],
+            [(d.message, d.line, d.column, d.end_column) for d in diagnostics])
+
+
+def fuzz_sources(count=200, lines=12, seed=42):
+    """Uyumluluk denetimi için tekrarlanabilir rastgele kaynaklar."""
+    import random
+
+    rng = random.Random(seed)
+    sources = []
+    for _ in range(count):
+        source_lines = []
+        for _ in range(lines):
+            indent = rng.choice(['', '', '    ', '        ', '\t'])
+            source_lines.append(indent + ''.join(rng.choice(_FUZZ_PIECES) for _ in range(rng.randrange(1, 10))))
+        sources.append('\n'.join(source_lines) + '\n')
+    return sources
+
+
+def check_conformance(backend, sources=None):
+    """
+    backend'in ürettiği tokenları ve tanıları başvuru (regex) arka ucuyla
+    karşılaştırır. Farklı çıkan kaynakların açıklamalarını döndürür; boş liste
+    tam uyum demektir. sources verilmezse sabit örnekler ve rastgele kaynaklar
+    kullanılır.
+    """
+    from lexer import Lexer
+
+    reference = Lexer(backend=RegexBackend.name)
+    candidate = Lexer(backend=backend)
+    if sources is None:
+        sources = _CONFORMANCE_SAMPLES + fuzz_sources()
+
+    failures = []
+    for source in sources:
+        expected = _run(reference, source)
+        actual = _run(candidate, source)
+        if expected != actual:
+            failures.append(f"{backend}: {source[:60]!r}... beklenen {str(expected)[:120]}, "
+                            f"üretilen {str(actual)[:120]}")
+    return failures
+
+
+def benchmark(source, backends=None, repeat=5):
+    """Her arka uç için source'un en iyi tokenleme süresi (saniye)."""
+    from lexer import Lexer
+
+    timings = {}
+    for name in backends or BACKENDS:
+        lexer = Lexer(backend=name)
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            lexer.tokenize(source)
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        timings[name] = best
+    return timings
+
+
+def select_backend(source=None, repeat=5):
+    """Uyumluluk denetiminden geçen arka uçlar arasında source'ta en hızlı olanın adı."""
+    if source is None:
+        source = ''.join(_CONFORMANCE_SAMPLES[:2]) * 200
+    candidates = [name for name in BACKENDS if name == RegexBackend.name or not check_conformance(name)]
+    timings = benchmark(source, candidates, repeat)
+    return min(timings, key=timings.get)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as f:
+            source = f.read()
+    else:
+        source = ''.join(_CONFORMANCE_SAMPLES[:2]) * 2000
+
+    for name in BACKENDS:
+        failures = check_conformance(name)
+        print(f"{name:10} uyumluluk: {'tamam' if not failures else f'{len(failures)} farklı kaynak'}")
+        for failure in failures[:3]:
+            print("    " + failure)
+
+    timings = benchmark(source)
+    for name, elapsed in sorted(timings.items(), key=lambda item: item[1]):
+        print(f"{name:10} {elapsed:.3f} sn ({len(source) / elapsed / 1e6:.2f} MB/sn)")
+    print(f"En hızlı: {select_backend(source)} (varsayılan: {DEFAULT_BACKEND})")
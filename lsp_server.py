@@ -0,0 +1,426 @@
+# lsp_server.py
+import json
+import os
+import re
+import select
+import sys
+
+from lexer import Lexer, IncrementalLexer, LexerError
+from parser import Parser, ParserError
+from tokens import TokenType
+from diagnostics import DiagnosticCollector, SEVERITY_ERROR, SEVERITY_WARNING
+
+# Semantik token lejantı doğrudan TokenType'tan türetilir; görsel karşılığı
+# olmayan yapısal tokenlar (NEWLINE, INDENT ...) lejanta girmez.
+_STRUCTURAL_TYPES = {TokenType.NEWLINE, TokenType.INDENT, TokenType.DEDENT, TokenType.EOF, TokenType.WHITESPACE}
+LEGEND_TYPES = [token_type for token_type in TokenType if token_type not in _STRUCTURAL_TYPES]
+TOKEN_LEGEND = [token_type.name.lower() for token_type in LEGEND_TYPES]
+_LEGEND_INDEX = {token_type: idx for idx, token_type in enumerate(LEGEND_TYPES)}
+
+_LSP_SEVERITY = {SEVERITY_ERROR: 1, SEVERITY_WARNING: 2}
+
+# LSP hata kodları
+ERROR_METHOD_NOT_FOUND = -32601
+ERROR_INVALID_PARAMS = -32602
+ERROR_INTERNAL = -32603
+
+# window/logMessage türü
+MESSAGE_TYPE_ERROR = 1
+
+# LSP yalnızca \r\n, \n ve \r'yi satır sonu sayar (str.splitlines \x0c, \u2028 ... ile de böler)
+_LINE_END = re.compile(r'(?<=\n)|(?<=\r)(?!\n)')
+
+
+def _split_lines(text):
+    """LSP satırları, satır sonlarıyla; son eleman satır sonu içermez (boş olabilir)."""
+    return _LINE_END.split(text)
+
+
+def _lexer_lines(lines):
+    """Belgenin son satırlarını Lexer.split_lines biçimine çevirir: son satır '\\n' ile biter, boşsa atılır."""
+    if lines and lines[-1]:
+        return lines[:-1] + [lines[-1] + '\n']
+    return lines[:-1]
+
+
+def _utf16_length(text):
+    return len(text) if text.isascii() else len(text.encode('utf-16-le')) // 2
+
+
+def _utf16_to_index(line, character):
+    """UTF-16 kod birimi cinsinden LSP sütununu Python string indeksine çevirir."""
+    if line.isascii():
+        return min(character, len(line))
+    units = 0
+    for idx, char in enumerate(line):
+        if units >= character:
+            return idx
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+
+class TextDocument:
+    """
+    Açık bir belgenin metni, artımlı lexer önbelleği ve satır bazlı semantik
+    token önbelleği. Her satırın semantik tokenları satır numarasından bağımsız
+    (başlangıç, uzunluk, tip) demetleri olarak tutulur; böylece değişmeyen
+    satırlar, satır numaraları kaysa bile yeniden kullanılır.
+    """
+
+    def __init__(self, uri, text, version, lexer):
+        self.uri = uri
+        self.version = version
+        self.lines = _split_lines(text)  # LSP satır numaralarıyla birebir; lexer satırları da aynı sırada
+        self.lexer = IncrementalLexer(lexer)
+        self.semantic_lines = []
+        self.lexer_error = None
+
+        # Son semantic token yanıtından beri değişmeyen önek/sonek satır sayıları
+        self.result_id = 0
+        self.result_lines = None
+        self.unchanged_prefix = 0
+        self.unchanged_suffix = 0
+        self.diagnostics_dirty = True
+        self._relex(0, 0, 0, self.lines)
+
+    def apply_change(self, change):
+        """
+        Tek bir contentChanges girdisini uygular (range'li artımlı veya tam metin).
+        Artımlı değişiklikte yalnızca düzenlemenin dokunduğu satırlar yeniden
+        bölünür ve lexer'a yalnızca o satır aralığı verilir.
+        """
+        old_count = len(self.lines)
+        if 'range' not in change:
+            first, end = 0, old_count
+            new_lines = _split_lines(change['text'])
+        else:
+            first, start_column = self._position(change['range']['start'])
+            last, end_column = self._position(change['range']['end'])
+            text = self.lines[first][:start_column] + change['text'] + self.lines[last][end_column:]
+            if first > 0 and self.lines[first - 1].endswith('\r'):
+                # Önceki satırın tek başına '\r'si, metnin başındaki '\n' ile birleşebilir
+                first -= 1
+                text = self.lines[first] + text
+            end = last + 1
+            new_lines = _split_lines(text)
+            if end < old_count:
+                new_lines.pop()  # Metin satır sonuyla bitti; ardından gelen satır değişmedi
+        self.lines[first:end] = new_lines
+        self._relex(first, end, old_count, new_lines)
+        self.diagnostics_dirty = True
+
+    def _position(self, position):
+        """LSP konumunu (satır indeksi, satır içi string indeksi) çiftine çevirir; belge sonunda sınırlanır."""
+        line_idx = position['line']
+        if line_idx >= len(self.lines):
+            return len(self.lines) - 1, len(self.lines[-1])
+        line = self.lines[line_idx]
+        return line_idx, _utf16_to_index(line.rstrip('\r\n'), position['character'])
+
+    def _relex(self, first, end, old_count, new_lines):
+        """Belgenin eski [first, end) satırları new_lines oldu; lexer'a yalnızca bu aralık verilir."""
+        lexer_end = end
+        if self.lexer_error is not None:
+            # Lexer önbelleği son geçerli metinde kaldı; bu değişikliğin aralığı ona göre değil
+            first, lexer_end, new_lines = 0, len(self.lexer.lines), _lexer_lines(self.lines)
+        elif end == old_count:
+            # Son satır lexer'da '\n' ile biter (boşsa hiç yoktur)
+            lexer_end = len(self.lexer.lines)
+            new_lines = _lexer_lines(new_lines)
+        try:
+            changed = self.lexer.replace_lines(first, lexer_end, new_lines)
+            self.lexer_error = None
+        except LexerError as e:
+            # Lexer önbelleği son geçerli metinde kalır; semantik tokenlar da onunla
+            # eşleşmeye devam eder ve hata düzelince yalnızca değişen satırlar yenilenir
+            self.lexer_error = e
+            return
+        if changed is None:
+            return
+
+        start, old_end, new_end = changed
+        self.semantic_lines[start:old_end] = [self._encode_line(idx) for idx in range(start, new_end)]
+        self.unchanged_prefix = min(self.unchanged_prefix, start)
+        self.unchanged_suffix = min(self.unchanged_suffix, len(self.semantic_lines) - new_end)
+
+    def _encode_line(self, line_idx):
+        line = self.lexer.lines[line_idx]
+        ascii_line = line.isascii()
+        encoded = []
+        for token in self.lexer.line_tokens[line_idx]:
+            type_idx = _LEGEND_INDEX.get(token.type)
+            if type_idx is None or not token.value:
+                continue
+            if ascii_line:
+                encoded.append((token.column, len(token.value), type_idx))
+            else:
+                encoded.append((_utf16_length(line[:token.column]), _utf16_length(token.value), type_idx))
+        return tuple(encoded)
+
+    @staticmethod
+    def _encode(lines, first_line, previous_line):
+        """Satır listesini LSP'nin göreli (deltaLine, deltaStart, ...) biçimine çevirir."""
+        data = []
+        for offset, encoded in enumerate(lines):
+            line_idx = first_line + offset
+            previous_start = 0
+            for start, length, type_idx in encoded:
+                if line_idx != previous_line:
+                    data.extend((line_idx - previous_line, start, length, type_idx, 0))
+                    previous_line = line_idx
+                else:
+                    data.extend((0, start - previous_start, length, type_idx, 0))
+                previous_start = start
+        return data
+
+    def _remember_result(self):
+        self.result_id += 1
+        self.result_lines = list(self.semantic_lines)
+        self.unchanged_prefix = self.unchanged_suffix = len(self.semantic_lines)
+        return str(self.result_id)
+
+    def semantic_tokens_full(self):
+        data = self._encode(self.semantic_lines, 0, 0)
+        return {'resultId': self._remember_result(), 'data': data}
+
+    def semantic_tokens_delta(self, previous_result_id):
+        """
+        Son yanıttan bu yana yalnızca değişen satırların tokenlarını içeren tek bir
+        düzenleme döndürür. Önceki yanıt bilinmiyorsa tam yanıta düşer.
+        """
+        if self.result_lines is None or previous_result_id != str(self.result_id):
+            return self.semantic_tokens_full()
+
+        old_lines, new_lines = self.result_lines, self.semantic_lines
+        prefix = min(self.unchanged_prefix, len(old_lines), len(new_lines))
+        suffix = min(self.unchanged_suffix, len(old_lines) - prefix, len(new_lines) - prefix)
+
+        # Değişen bölgeden önceki son tokenlı satır (göreli kodlamanın başlangıcı)
+        previous_line = prefix - 1
+        while previous_line >= 0 and not new_lines[previous_line]:
+            previous_line -= 1
+        previous_line = max(previous_line, 0)
+
+        old_mid = old_lines[prefix:len(old_lines) - suffix]
+        new_mid = new_lines[prefix:len(new_lines) - suffix]
+        start = 5 * sum(map(len, new_lines[:prefix]))
+        delete_count = 5 * sum(map(len, old_mid))
+        data = self._encode(new_mid, prefix, previous_line)
+
+        # Bölgeden sonraki ilk tokenın deltaLine değeri değişmiş olabilir; onu da yeniden yaz
+        old_next = self._first_token_line(old_lines, len(old_lines) - suffix)
+        new_next = self._first_token_line(new_lines, len(new_lines) - suffix)
+        if new_next is not None:
+            last_line = previous_line
+            for line_idx in range(len(new_lines) - suffix - 1, prefix - 1, -1):
+                if new_lines[line_idx]:
+                    last_line = line_idx
+                    break
+            first = new_lines[new_next][0]
+            data.extend((new_next - last_line, first[0], first[1], first[2], 0))
+            if old_next is not None:
+                delete_count += 5
+
+        result_id = self._remember_result()
+        edits = [] if not delete_count and not data else [{'start': start, 'deleteCount': delete_count, 'data': data}]
+        return {'resultId': result_id, 'edits': edits}
+
+    @staticmethod
+    def _first_token_line(lines, start):
+        for line_idx in range(start, len(lines)):
+            if lines[line_idx]:
+                return line_idx
+        return None
+
+    def diagnostics(self):
+        collector = DiagnosticCollector()
+        if self.lexer_error is not None:
+            line = (self.lexer_error.line or 1) - 1
+            return [self._lsp_diagnostic(SEVERITY_ERROR, 'L002', str(self.lexer_error), line, 0, 0)]
+
+        self.lexer.collect_diagnostics(collector)
+        try:
+            Parser(self.lexer.tokens(), collector).parse()
+        except ParserError:
+            pass  # Hata tanı listesine eklendi
+        return [self._lsp_diagnostic(d.severity, d.code, d.message, d.line - 1, d.column, d.end_column)
+                for d in collector if d.line and d.line > 0]
+
+    def _lsp_diagnostic(self, severity, code, message, line_idx, column, end_column):
+        line = self.lexer.lines[line_idx] if 0 <= line_idx < len(self.lexer.lines) else ''
+        return {
+            'range': {'start': {'line': line_idx, 'character': _utf16_length(line[:column])},
+                      'end': {'line': line_idx, 'character': _utf16_length(line[:end_column])}},
+            'severity': _LSP_SEVERITY.get(severity, 3),
+            'code': code,
+            'source': 'python-syntax-highlighter',
+            'message': message,
+        }
+
+
+class LanguageServer:
+    """
+    stdio üzerinden çalışan LSP sunucusu: artımlı didChange senkronizasyonu,
+    semanticTokens/full ve /full/delta, ParserError ve lexer tanıları.
+
+    Tanılar her tuş vuruşunda değil, bekleyen mesajlar bittiğinde yayınlanır;
+    böylece hızlı yazarken belge her seferinde ayrıştırılmaz.
+    """
+
+    def __init__(self, stdin=None, stdout=None):
+        self.stdin = stdin or sys.stdin.buffer
+        self.stdout = stdout or sys.stdout.buffer
+        self.lexer = Lexer()
+        self.documents = {}
+        self.running = True
+        self.shutdown_requested = False
+
+    # --- Mesaj katmanı ---
+    def read_message(self):
+        headers = {}
+        while True:
+            line = self.stdin.readline()
+            if not line:
+                return None
+            line = line.strip()
+            if not line:
+                break
+            name, _, value = line.decode('ascii').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        body = self.stdin.read(int(headers['content-length']))
+        return json.loads(body.decode('utf-8'))
+
+    def send(self, message):
+        message['jsonrpc'] = '2.0'
+        body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+        self.stdout.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+        self.stdout.flush()
+
+    def log_message(self, message_type, text):
+        self.send({'method': 'window/logMessage', 'params': {'type': message_type, 'message': text}})
+
+    def _input_pending(self):
+        # Python'un tamponuna alınmış veri select'e görünmez: ardışık gelen mesajlar
+        # tek okumada tampona dolabilir. Önce engellemeyen peek ile tampona (ve
+        # gerekirse dosya tanıtıcısına) bakılır; peek yoksa select kullanılır.
+        try:
+            fd = self.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            return False
+        peek = getattr(self.stdin, 'peek', None)
+        if peek is not None:
+            try:
+                blocking = os.get_blocking(fd)
+                os.set_blocking(fd, False)
+            except OSError:
+                pass
+            else:
+                try:
+                    return bool(peek(1))
+                except OSError:
+                    return False
+                finally:
+                    os.set_blocking(fd, blocking)
+        try:
+            return bool(select.select([fd], [], [], 0)[0])
+        except (OSError, ValueError):
+            return False
+
+    def serve(self):
+        while self.running:
+            if not self._input_pending():
+                self.publish_pending_diagnostics()
+            message = self.read_message()
+            if message is None:
+                break
+            self.handle(message)
+
+    # --- İstek işleme ---
+    def handle(self, message):
+        method = message.get('method')
+        # '$/' ile başlayan isteğe bağlı bildirimler (örn. $/cancelRequest) için işleyici yok; yok sayılır
+        handler = getattr(self, 'on_' + method.replace('/', '_'), None) if method else None
+        params = message.get('params') or {}
+        if 'id' in message and method is not None:
+            if handler is None:
+                self.send({'id': message['id'], 'error': {'code': ERROR_METHOD_NOT_FOUND,
+                                                          'message': f"Bilinmeyen metot: {method}"}})
+                return
+            try:
+                result = handler(params)
+            except (KeyError, TypeError) as e:
+                # Eksik alan, açık olmayan belge ya da yanlış türde parametre
+                self.send({'id': message['id'], 'error': {'code': ERROR_INVALID_PARAMS, 'message': str(e)}})
+                return
+            except Exception as e:
+                self.send({'id': message['id'], 'error': {'code': ERROR_INTERNAL, 'message': repr(e)}})
+                return
+            self.send({'id': message['id'], 'result': result})
+        elif handler is not None:
+            # Bildirimlere yanıt gönderilemez: hata günlüğe yazılır, mesaj atlanır ve sunucu çalışmaya devam eder
+            try:
+                handler(params)
+            except Exception as e:
+                self.log_message(MESSAGE_TYPE_ERROR, f"{method} işlenemedi: {e!r}")
+
+    def on_initialize(self, params):
+        return {
+            'capabilities': {
+                'textDocumentSync': {'openClose': True, 'change': 2},  # 2 = artımlı
+                'semanticTokensProvider': {
+                    'legend': {'tokenTypes': TOKEN_LEGEND, 'tokenModifiers': []},
+                    'full': {'delta': True},
+                },
+            },
+            'serverInfo': {'name': 'python-syntax-highlighter'},
+        }
+
+    def on_initialized(self, params):
+        pass
+
+    def on_shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def on_exit(self, params):
+        self.running = False
+
+    def on_textDocument_didOpen(self, params):
+        item = params['textDocument']
+        self.documents[item['uri']] = TextDocument(item['uri'], item['text'], item.get('version'), self.lexer)
+
+    def on_textDocument_didChange(self, params):
+        document = self.documents[params['textDocument']['uri']]
+        for change in params['contentChanges']:
+            document.apply_change(change)
+        document.version = params['textDocument'].get('version')
+
+    def on_textDocument_didClose(self, params):
+        uri = params['textDocument']['uri']
+        self.documents.pop(uri, None)
+        self.send({'method': 'textDocument/publishDiagnostics', 'params': {'uri': uri, 'diagnostics': []}})
+
+    def on_textDocument_semanticTokens_full(self, params):
+        return self.documents[params['textDocument']['uri']].semantic_tokens_full()
+
+    def on_textDocument_semanticTokens_full_delta(self, params):
+        document = self.documents[params['textDocument']['uri']]
+        return document.semantic_tokens_delta(params.get('previousResultId'))
+
+    def publish_pending_diagnostics(self):
+        for document in self.documents.values():
+            if document.diagnostics_dirty:
+                document.diagnostics_dirty = False
+                self.send({'method': 'textDocument/publishDiagnostics',
+                           'params': {'uri': document.uri, 'version': document.version,
+                                      'diagnostics': document.diagnostics()}})
+
+
+def main():
+    server = LanguageServer()
+    server.serve()
+    sys.exit(0 if server.shutdown_requested else 1)
+
+
+if __name__ == '__main__':
+    main()
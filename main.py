@@ -1,40 +1,115 @@
 # main.py
+import os
+import re
+import time
+from bisect import bisect_right
 import tkinter as tk
-from tkinter import scrolledtext
-from lexer import Lexer
+from tkinter import scrolledtext, ttk
+from weakref import WeakValueDictionary
+from lexer import Lexer, IncrementalLexer, LexerError
 from parser import Parser, ParserError
+from highlight_policy import HighlightPolicy
+from diagnostics import DiagnosticCollector
+from themes import TOKEN_TAGS, TOKEN_TAG_NAMES, DEFAULT_THEME, ThemeError, available_themes, load_theme
+from symbols import SymbolIndex, KIND_FUNCTION, KIND_PARAMETER
+from occurrences import OccurrenceIndex, is_identifier, rename_targets, rename_text
+from completion import CompletionIndex, complete, keyword_words
 from tokens import TokenType
-from syntax_tree import *
+from cooperative import CooperativeTask, SliceScheduler, PRIORITY_BACKGROUND, PRIORITY_FOCUSED, labelled_steps
+from snapshots import SnapshotHistory
+from syntax_tree import (ProgramNode, AssignmentNode, ExpressionStatementNode, IfNode, WhileNode, FunctionDefNode,
+                         ReturnNode, CallNode, BinaryOpNode, UnaryOpNode)
 
-class SyntaxHighlighterGUI:
-    def __init__(self, master):
-        self.master = master
-        master.title("Python Syntax Highlighter")
+# Tek bir tag_add çağrısına verilen en fazla indeks sayısı (başlangıç/bitiş çiftleri)
+TAG_ADD_BATCH = 20000
+# Renklendirmenin bir iş biriminde yenilediği satır sayısı
+TAG_STEP_LINES = 200
+# Geri al/yinele anlık görüntülerinin bellek bütçesi (bayt) ve en fazla sürüm sayısı
+SNAPSHOT_BUDGET = 64 * 1024 * 1024
+SNAPSHOT_VERSIONS = 200
+# Tembel fonksiyon gövdesi denetiminin tek seferde çalışacağı en uzun süre (saniye)
+BODY_CHECK_SLICE = 0.02
+# Dosya açılırken tek adımda eklenip renklendirilen parça (bayt); bir dilime sığacak kadar küçük
+LOAD_CHUNK_BYTES = 16 * 1024
+# Kaydederken metnin Tk'den tek seferde alınan satır sayısı (tüm metnin tek kopyası oluşmasın)
+SAVE_CHUNK_LINES = 5000
 
-        self.lexer = Lexer()
-        self.parser = Parser([])  # Başlangıçta boş token listesi ile oluştur
+APP_TITLE = "Python Syntax Highlighter"
+
+# İmleçten önce yazılmakta olan isim (tamamlama öneki)
+_WORD_BEFORE_CURSOR = re.compile(r'[A-Za-z_][A-Za-z0-9_]*$')
+_WORD_AFTER_CURSOR = re.compile(r'[A-Za-z0-9_]*')
+
+
+class EditorTab:
+    """
+    Tek bir belgenin sekmesi: metin alanı, satır numaraları, anahat ve AST
+    paneli ile belgenin kendi token/AST durumu (artımlı lexer, indeksler,
+    anlık görüntüler). Lexer, vurgulama politikası, satır önbelleği ve analiz
+    zamanlayıcısı pencereyle (SyntaxHighlighterGUI) paylaşılır; odakta olmayan
+    sekmenin işleri arka plan önceliğinde çalışır.
+    """
 
-        self.main_frame = tk.Frame(master)
-        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    def __init__(self, window, parent):
+        self.window = window
+        self.master = window.master
+
+        self.lexer = window.lexer
+        self.incremental_lexer = IncrementalLexer(self.lexer)  # Satır bazlı token önbelleği ve yapı indeksi
+        self.highlight_policy = window.highlight_policy  # Büyük dosyalarda analizi kademeli olarak kıs
+        self.diagnostics = DiagnosticCollector()  # Lexer/Parser uyarıları (stdout'a yazılmaz)
+        self.theme = window.theme
+        self.symbol_index = SymbolIndex()  # Tanım/referans indeksi (üst seviye deyim bazında güncellenir)
+        self.occurrence_index = OccurrenceIndex()  # İsim -> IDENTIFIER tokenları (değişen satır bazında güncellenir)
+        self.completion_index = CompletionIndex()  # Önek -> en sık isimler (değişen isim bazında güncellenir)
+        self._completion_popup = None  # Tamamlama listesi penceresi (ilk kullanımda oluşturulur)
+        self._completion_context = None  # Liste açıkken (satır, önek başlangıç sütunu, önek)
+        self._find_name = None  # Son aranan isim (F3 ile sonraki geçişe gidilir)
+        self.lazy_ast_nodes = {}  # AST panelindeki "Gövdeyi göster" tag'i -> (FunctionDefNode, girinti)
+        self._body_check_job = None  # Tembel fonksiyon gövdelerini arka planda denetleyen after işi
+        self._highlight_task = None  # Dilimler halinde çalışan vurgulama işi (CooperativeTask)
+        self._load_task = None  # Dosyayı parça parça ekleyen iş (CooperativeTask)
+        self.file_path = None  # Açık dosya (yoksa None)
+        self.file_newline = None  # Açılan dosyanın satır sonu biçimi; kayıtta korunur
+        self.dirty = False  # Son açma/kaydetmeden bu yana düzenlendi mi
+        self.status = ("", "lightgreen")  # Son durum mesajı ve rengi (sekme seçilince gösterilir)
+        self._indexed_revision = 0  # Sembol indeksinin yansıttığı lexer önbelleği revizyonu
+        self._tagged_revision = None  # Token tag'lerinin eksiksiz uygulandığı lexer önbelleği revizyonu
+        # Analiz edilmiş metin sürümleri; geri al/yinele bunlara dönünce lexer ve parser çalışmaz.
+        # Satır önbelleği sekmeler arasında ortaktır
+        self.snapshots = SnapshotHistory(max_bytes=SNAPSHOT_BUDGET, max_versions=SNAPSHOT_VERSIONS,
+                                         line_cache=window.line_cache)
+
+        self.frame = tk.Frame(parent)
+        self.main_frame = tk.Frame(self.frame)
+        self.main_frame.pack(fill=tk.BOTH, expand=True)
 
         self.line_numbers = tk.Text(self.main_frame, width=4, padx=3, pady=3, takefocus=0,
                                     border=0, background='#f0f0f0', state='disabled',
                                     wrap='none', font=("Consolas", 10))
         self.line_numbers.pack(side=tk.LEFT, fill=tk.Y)
 
+        # Anahat paneli: fonksiyonlar (parametreleriyle) ve üst seviye if/while blokları
+        self.outline = tk.Listbox(self.main_frame, width=30, activestyle='none', exportselection=False,
+                                  font=("Consolas", 9))
+        self.outline.pack(side=tk.RIGHT, fill=tk.Y)
+        self.outline_entries = []  # Panel satırlarıyla aynı sırada OutlineEntry'ler
+        self._outline_counts = []  # Sembol indeksindeki her deyim kaydının panelde kapladığı satır sayısı
+        self._outline_version = None  # Panelin yansıttığı sembol indeksi sürümü
+
         self.text_area = scrolledtext.ScrolledText(self.main_frame, wrap=tk.WORD,
                                                    font=("Consolas", 10),
                                                    undo=True)
         self.text_area.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        self.error_label = tk.Label(master, text="", fg="white", bg="lightgreen")
-        self.error_label.pack(side=tk.TOP, fill=tk.X, pady=2)
-
         # AST çıktısı ve hata mesajları için Text widget'ı, başlangıçta DISABLED
-        self.ast_output = scrolledtext.ScrolledText(master, wrap=tk.WORD,
+        self.ast_output = scrolledtext.ScrolledText(self.frame, wrap=tk.WORD,
                                                     font=("Consolas", 10),
                                                     height=15, state='disabled')
-        self.ast_output.pack(fill=tk.BOTH, expand=True)
+        self.ast_output.pack(fill=tk.BOTH, expand=True, pady=(5, 0))
+        self.ast_output.tag_config("lazy_body", foreground="#0000FF", underline=True)
+        self.ast_output.tag_config("lazy_body_error", foreground="red")
+        self.ast_output.tag_bind("lazy_body", "<Button-1>", self.expand_lazy_body)
 
         self.define_tags()
 
@@ -43,6 +118,28 @@ class SyntaxHighlighterGUI:
         self.text_area.bind("<MouseWheel>", self.on_text_scroll)
         self.text_area.bind("<Button-4>", self.on_text_scroll)
         self.text_area.bind("<Button-5>", self.on_text_scroll)
+        self.text_area.bind("<ButtonRelease-1>", self.update_bracket_match)
+        self.text_area.bind("<ButtonRelease-1>", self.update_cursor_info, add='+')
+        self.text_area.bind("<Control-bracketright>", self.jump_to_block_end)
+        self.text_area.bind("<Control-bracketleft>", self.toggle_fold_at_cursor)
+        self.text_area.bind("<F12>", self.go_to_definition)
+        self.text_area.bind("<Shift-F12>", self.show_usages)
+        self.text_area.bind("<Control-f>", self.find_identifier)
+        self.text_area.bind("<F3>", self.find_next)
+        self.text_area.bind("<F2>", self.rename_symbol)
+        self.text_area.bind("<Control-space>", self.show_completions)
+        for sequence in ("<Up>", "<Down>", "<Return>", "<Tab>", "<Escape>"):
+            self.text_area.bind(sequence, self.on_completion_key)
+        self.text_area.bind("<ButtonRelease-1>", self.hide_completions, add='+')
+        self.text_area.bind("<FocusOut>", self.on_text_focus_out)
+        # Text sınıfının kendi Ctrl+O (satır aç) bağlamasından önce yakalanır
+        self.text_area.bind("<Control-o>", window.open_file)
+        self.text_area.bind("<Control-s>", self.save_file)
+        self.text_area.bind("<Control-S>", self.save_file_as)
+        self.text_area.bind("<Control-n>", window.new_tab)
+        self.text_area.bind("<Control-w>", window.close_tab)
+        self.line_numbers.bind("<Button-1>", self.on_line_number_click)
+        self.outline.bind("<<ListboxSelect>>", self.on_outline_select)
 
         # text_area'nın kaydırma çubuğunu hem kendi yview'ine hem de line_numbers'ın yview'ine bağla
         self.text_area.vbar.config(command=self.yview_text_and_numbers)
@@ -50,7 +147,8 @@ class SyntaxHighlighterGUI:
         self.update_line_numbers()  # Başlangıçta satır numaralarını oluştur
 
         self.text_area.edit_modified(False)
-        self.highlight_syntax()  # Başlangıçta sözdizimini vurgula
+        # İlk vurgulama pencere çizildikten sonra; açılış onu beklemez
+        self._initial_highlight_job = self.master.after_idle(self.highlight_syntax)
 
         # ---KAYDIRMA METODLARI ---
 
@@ -63,47 +161,160 @@ class SyntaxHighlighterGUI:
 
         line_count = int(self.text_area.index('end-1c').split('.')[0])
 
-        # Her satır için numara ekle
-        for i in range(1, line_count + 1):
-            self.line_numbers.insert(tk.END, f"{i}\n")
+        # Tüm numaraları tek seferde ekle (satır başına ayrı insert büyük dosyalarda çok yavaş)
+        self.line_numbers.insert(tk.END, "".join(f"{i}\n" for i in range(1, line_count + 1)))
+
+        # Katlanmış satırların numaralarını da gizle ki hizalama bozulmasın
+        for first_line, last_line in self.folded_line_ranges():
+            self.line_numbers.tag_add("folded", f"{first_line}.0", f"{last_line + 1}.0")
 
         # Satır numarası alanını, ana metin alanının kaydırma konumuna eşitle
         self.line_numbers.yview_moveto(self.text_area.yview()[0])
         self.line_numbers.config(state='disabled')
 
     def define_tags(self):
-        # Genişletilmiş renk tag'leri listesi, highlight_syntax ile tam uyumlu
-        self.text_area.tag_config("keyword", foreground="#0000FF")  # Mavi (if, else, while, def, return için)
-        self.text_area.tag_config("operator", foreground="#FF8C00")  # Turuncu (+, -, *, /, =, ==, >, < vb.)
-        self.text_area.tag_config("number", foreground="#8B0000")  # Koyu Kırmızı (Sayılar için)
-        self.text_area.tag_config("string", foreground="#008000")  # Yeşil (Metinler için)
-        self.text_area.tag_config("comment", foreground="#808080",
-                                  font=("Consolas", 10, "italic"))  # Gri ve İtalik (# yorumlar için)
-
-        self.text_area.tag_config("identifier", foreground="#000000")  # Siyah (Varsayılan tanımlayıcılar için)
-        self.text_area.tag_config("variable", foreground="#333333")  # Koyu Gri (Değişken isimleri için)
-        self.text_area.tag_config("function_call", foreground="#8A2BE2")  # Mor (print gibi fonksiyon çağrıları için)
-        self.text_area.tag_config("boolean", foreground="#FF00FF")  # Magenta (True, False, None için)
-        self.text_area.tag_config("lparen", foreground="#8B008B")  # Koyu Mor (( ) için)
-        self.text_area.tag_config("rparen", foreground="#8B008B")  # Koyu Mor (( ) için)
-        self.text_area.tag_config("colon", foreground="#8B008B")  # Koyu Mor (: için)
-        self.text_area.tag_config("comma", foreground="#8B008B")  # Koyu Mor (, için)
-        self.text_area.tag_config("mismatch", foreground="red",
-                                  background="yellow")  # Tanınmayan karakterler için (uyarı)
-
-        # Hata işaretleyici tag'leri
-        self.text_area.tag_config("error_line", background="#FFCCCC", underline=True)
-        self.text_area.tag_config("error_char", background="#FF9999", foreground="red")
+        # Renkler temadan gelir (themes/*.json); burada yalnızca renk dışı tag'ler tanımlanır
+        self.apply_theme(self.theme)
+
+        # Kod katlama: gizlenen gövde
+        self.text_area.tag_config("folded", elide=True)
+        self.line_numbers.tag_config("folded", elide=True)
+
+    def apply_theme(self, theme):
+        """
+        Temayı uygular. Yalnızca tag stilleri ve editör renkleri yeniden
+        yapılandırılır; tokenlar ve tag aralıkları olduğu gibi kalır.
+        """
+        if isinstance(theme, str):
+            theme = load_theme(theme)
+        self.theme = theme
+        for tag in theme.tags:
+            self.text_area.tag_config(tag, **theme.tk_options(tag))
+
+        editor = theme.editor
+        self.text_area.config(background=editor['background'], foreground=editor['foreground'],
+                              insertbackground=editor['insert'])
+        self.line_numbers.config(background=editor['line_numbers_background'],
+                                 foreground=editor['line_numbers_foreground'])
 
     def on_text_modified(self, event=None):
+        if self.loading:
+            return  # Yükleme bitince bayrak sıfırlanır ve vurgulama bir kez çalışır
         if self.text_area.edit_modified():
+            self.set_dirty(True)
+            self.text_area.tag_remove("symbol_usage", "1.0", tk.END)  # Kullanım işaretleri metin değişince geçersiz
             self.highlight_syntax()
             self.update_line_numbers()
             self.text_area.edit_modified(False)
 
     def on_key_release(self, event):
+        if self.loading:
+            return
         self.highlight_syntax()
         self.update_line_numbers()
+        self.update_bracket_match()
+        self.update_cursor_info()
+        if self._completion_context is not None:
+            self.update_completions()
+
+    def update_cursor_info(self, event=None):
+        """Durum satırına imlecin konumunu ve altındaki tokenı yazar."""
+        if not self.focused:
+            return
+        line, column = map(int, self.text_area.index(tk.INSERT).split('.'))
+        token = self.incremental_lexer.token_at(line, column)
+        if token is None and column > 0:
+            token = self.incremental_lexer.token_at(line, column - 1)  # Kelimenin hemen sonundaysa
+        info = f"Satır {line}, Sütun {column}"
+        if token is not None:
+            info += f" — {token.type.name} {token.value!r}"
+        self.window.cursor_label.config(text=info)
+
+    def update_bracket_match(self, event=None):
+        """
+        İmlecin yanındaki parantezi ve eşini vurgular. Eşler yapı indeksinde
+        hazır tutulduğu için token listesi yeniden taranmaz.
+        """
+        self.text_area.tag_remove("bracket_match", "1.0", tk.END)
+        self.text_area.tag_remove("bracket_unmatched", "1.0", tk.END)
+
+        line, column = map(int, self.text_area.index(tk.INSERT).split('.'))
+        structure = self.incremental_lexer.structure
+
+        # Önce imlecin sağındaki, sonra solundaki karaktere bak
+        for col in (column, column - 1):
+            if structure.is_bracket(line, col):
+                partner = structure.partner(line, col)
+                if partner is None:
+                    self.text_area.tag_add("bracket_unmatched", f"{line}.{col}")
+                else:
+                    self.text_area.tag_add("bracket_match", f"{line}.{col}")
+                    self.text_area.tag_add("bracket_match", f"{partner[0]}.{partner[1]}")
+                break
+
+    def jump_to_block_end(self, event=None):
+        """İmleci, içinde bulunduğu bloğun son satırının sonuna taşır (Ctrl+])."""
+        line = int(self.text_area.index(tk.INSERT).split('.')[0])
+        block = self.incremental_lexer.structure.block_at(line)
+
+        # Zaten bloğun sonundaysak bir üst bloğun sonuna atla
+        if block is not None and block.end_line == line and block.parent is not None:
+            block = block.parent
+
+        if block is not None:
+            self.text_area.mark_set(tk.INSERT, f"{block.end_line}.end")
+            self.text_area.see(tk.INSERT)
+            self.update_bracket_match()
+        return "break"
+
+    def folded_line_ranges(self):
+        """Katlanmış (elide) satır aralıklarını (ilk satır, son satır) olarak döndürür."""
+        ranges = self.text_area.tag_ranges("folded")
+        result = []
+        for i in range(0, len(ranges), 2):
+            first_line = int(str(ranges[i]).split('.')[0])
+            end_line, end_column = map(int, str(ranges[i + 1]).split('.'))
+            # Aralık bir sonraki satırın başında bitiyorsa o satır gizli değildir
+            result.append((first_line, end_line - 1 if end_column == 0 else end_line))
+        return result
+
+    def toggle_fold(self, header_line):
+        """Başlığı header_line olan bloğu katlar veya açar. Blok yoksa False döner."""
+        block = self.incremental_lexer.structure.block_for_header(header_line)
+        if block is None:
+            return False
+
+        body_start = f"{header_line + 1}.0"
+        body_end = f"{block.end_line + 1}.0"
+        if "folded" in self.text_area.tag_names(body_start):
+            self.text_area.tag_remove("folded", body_start, body_end)
+            self.text_area.tag_remove("fold_header", f"{header_line}.0", f"{header_line}.end")
+            # Gizliyken vurgulanmayan satırları şimdi renklendir
+            self.highlight_syntax()
+        else:
+            self.text_area.tag_add("folded", body_start, body_end)
+            self.text_area.tag_add("fold_header", f"{header_line}.0", f"{header_line}.end")
+            # İmleç gizlenen bölgede kalmasın
+            if self.text_area.compare(tk.INSERT, ">=", body_start) and \
+                    self.text_area.compare(tk.INSERT, "<", body_end):
+                self.text_area.mark_set(tk.INSERT, f"{header_line}.end")
+
+        self.update_line_numbers()
+        return True
+
+    def toggle_fold_at_cursor(self, event=None):
+        """İmleç bir blok başlığındaysa o bloğu, değilse içinde bulunduğu bloğu katlar/açar (Ctrl+[)."""
+        line = int(self.text_area.index(tk.INSERT).split('.')[0])
+        if not self.toggle_fold(line):
+            block = self.incremental_lexer.structure.block_at(line)
+            if block is not None:
+                self.toggle_fold(block.header_line)
+        return "break"
+
+    def on_line_number_click(self, event):
+        line = int(self.line_numbers.index(f"@{event.x},{event.y}").split('.')[0])
+        self.toggle_fold(line)
+        return "break"
 
     def on_text_scroll(self, event):
         self.update_line_numbers()
@@ -121,80 +332,131 @@ class SyntaxHighlighterGUI:
         self.update_line_numbers()  # Kaydırma sonrası satır numaralarını güncelle
 
     def highlight_syntax(self):
+        """
+        Vurgulama hattını (tokenleme, renklendirme, ayrıştırma, AST paneli)
+        dilimlenmiş bir iş olarak başlatır. Önceki iş henüz bitmediyse iptal
+        edilir; küçük belgelerde iş ilk dilimde, eşzamanlı olarak biter.
+        """
+        if self.loading:
+            return
+        if self._highlight_task is not None:
+            self._highlight_task.cancel()
         code = self.text_area.get("1.0", tk.END)
+        mode = self.highlight_policy.choose_mode(code.count('\n'), len(code))
+        self._highlight_task = CooperativeTask(
+            self.master, self._highlight_steps(code, mode), on_progress=self.show_highlight_progress,
+            on_done=lambda task: self._highlight_done(task, mode, len(code)),
+            scheduler=self.window.scheduler, priority=self.priority)
+        self._highlight_task.start()
 
+    def _highlight_done(self, task, mode, char_count):
+        # Süre bütçesi dilimler arasındaki beklemeyi değil, yapılan işi ölçer
+        self.highlight_policy.record_timing(mode, char_count, task.busy_time)
+        if task.slices > 1 and self.focused:
+            # İş birden fazla dilime yayıldıysa imleç bilgisi eski yapıya göre hesaplanmıştı
+            self.update_bracket_match()
+            self.update_cursor_info()
+        if self._completion_context is not None:
+            self.update_completions(force=True)  # İndeksler artık metinle güncel
+
+    def show_highlight_progress(self, progress):
+        stage, done, total = progress
+        percent = done * 100 // total if total else 100
+        self.show_error(f"{stage}… %{percent}", color="steelblue")
+
+    def _highlight_steps(self, code, mode):
+        self.schedule_body_check([])  # Önceki çalıştırmanın gövde denetimi artık geçersiz
+
+        # Token tag'leri renklendirme sırasında satır dilimi bazında yenilenir; böylece
+        # uzun bir iş sürerken (veya yeni düzenlemeyle kesilince) metin renksiz kalmaz
         for tag in self.text_area.tag_names():
-            if tag not in ['sel', 'insert']:
+            if tag not in ['sel', 'insert', 'folded', 'fold_header', 'symbol_usage'] and tag not in TOKEN_TAG_NAMES:
                 self.text_area.tag_remove(tag, "1.0", tk.END)
 
+        if mode == HighlightPolicy.MODE_PLAIN:
+            # Çok büyük belgede hiç analiz yapma; önbelleği de boşalt ki bellekte tutulmasın
+            for tag in TOKEN_TAG_NAMES:
+                self.text_area.tag_remove(tag, "1.0", tk.END)
+            self.incremental_lexer.reset()
+            self.snapshots.clear()
+            self._tagged_revision = None
+            self.symbol_index.invalidate()
+            self.occurrence_index.clear()
+            self.completion_index.clear()
+            self.clear_outline()
+            self.show_ast_message(self.highlight_policy.describe(mode))
+            self.show_error(self.highlight_policy.describe(mode), color="orange")
+            return
+
+        self.diagnostics.clear()
+
         try:
-            tokens = self.lexer.tokenize(code)
+            # Geri al/yinele daha önce analiz edilmiş bir sürüme dönerse satırlar
+            # anlık görüntüden alınır (yeniden taranmaz), AST de saklandıysa ayrıştırılmaz
+            snapshot = self.snapshots.find(code)
 
-            # Syntax Vurgulama
-            for token in tokens:
-                # NEWLINE, INDENT, DEDENT, EOF gibi görsel olarak renklendirilmeyen token'ları atla
-                if token.type in [TokenType.NEWLINE, TokenType.INDENT, TokenType.DEDENT, TokenType.EOF,
-                                  TokenType.WHITESPACE]:
-                    continue  # WHITESPACE'i de atla
-
-                # Token'ın satır ve sütun bilgisi yoksa atla (olmamalı ama önlem)
-                if token.line is None or token.column is None:
-                    continue
-
-                start = f"{token.line}.{token.column}"
-                end = f"{token.line}.{token.column + len(str(token.value))}"
-
-                # Token tipine göre doğru tag'i belirle ve uygula
-                if token.type in [TokenType.KEYWORD_IF, TokenType.KEYWORD_ELIF,
-                                  TokenType.KEYWORD_ELSE,TokenType.KEYWORD_WHILE,
-                                  TokenType.KEYWORD_DEF,TokenType.KEYWORD_RETURN,
-                                  TokenType.KEYWORD_AND, TokenType.KEYWORD_OR, TokenType.KEYWORD_NOT]:
-                    self.text_area.tag_add("keyword", start, end)
-                elif token.type == TokenType.KEYWORD_PRINT:
-                    self.text_area.tag_add("function_call", start, end)
-                elif token.type in [TokenType.KEYWORD_TRUE, TokenType.KEYWORD_FALSE,
-                                    TokenType.KEYWORD_NONE]:
-                    self.text_area.tag_add("boolean", start, end)
-                elif token.type == TokenType.OPERATOR:
-                    self.text_area.tag_add("operator", start, end)
-                elif token.type == TokenType.NUMBER:
-                    self.text_area.tag_add("number", start, end)
-                elif token.type == TokenType.STRING:
-                    self.text_area.tag_add("string", start, end)
-                elif token.type == TokenType.COMMENT:
-                    self.text_area.tag_add("comment", start, end)
-                elif token.type == TokenType.IDENTIFIER:
-                    self.text_area.tag_add("variable", start, end)  # Tanımlayıcılar için 'variable' tag'ını kullan
-                elif token.type == TokenType.LPAREN:
-                    self.text_area.tag_add("lparen", start, end)
-                elif token.type == TokenType.RPAREN:
-                    self.text_area.tag_add("rparen", start, end)
-                elif token.type == TokenType.COLON:
-                    self.text_area.tag_add("colon", start, end)
-                elif token.type == TokenType.COMMA:
-                    self.text_area.tag_add("comma", start, end)
-                elif token.type == TokenType.MISMATCH:
-                    self.text_area.tag_add("mismatch", start, end)
-                # Başka bir token tipi varsa ve renklendirmek isterseniz buraya ekleyin
-                # else:
-                #     print(f"Uyarı: {token.type.name} için tanımlı renk tag'i yok.") # Teşhis için
-
-            # AST Oluşturma ve Gösterme
-            parser = Parser(tokens)
-            ast = parser.parse()
-            self.update_ast_output(ast)
-
-            # --- Hata yoksa: Yeşil renk ve "Kod Hatasız!" mesajı ---
-            self.show_error("Kod Hatasız!", color="green")
+            # Lexer önbelleği yalnızca tarama bitince güncellenir; iş burada kesilirse eski hali geçerli kalır
+            lexing = self.incremental_lexer.update_steps(code, line_cache=self.snapshots.line_cache)
+            change = yield from labelled_steps("Tokenleme", lexing)
+            revision = self.incremental_lexer.revision
+            self.snapshots.note_change(change, revision)
+            if change is not None and revision != self._indexed_revision + 1:
+                # Önceki bir iş sembol indeksine ulaşmadan kesildi; o değişikliğin aralığı kayboldu
+                self.symbol_index.invalidate()
+            # Bul/yeniden adlandır indeksi yalnızca yeniden taranan satırları işler
+            self.occurrence_index.update(self.incremental_lexer, change)
+            self.completion_index.update(self.occurrence_index)
+            yield from labelled_steps("Tanılar", self.incremental_lexer.collect_diagnostics_steps(self.diagnostics))
+
+            if snapshot is not None and change is not None and self._tagged_revision == revision - 1:
+                # Tk tag'leri metinle birlikte kaydığı için yalnızca değişen satırlar yeniden renklendirilir
+                yield from self._tag_steps(change[0], change[2])
+            else:
+                yield from self._tag_steps()
+            self._tagged_revision = revision
+
+            if mode == HighlightPolicy.MODE_FULL:
+                # AST Oluşturma ve Gösterme
+                if snapshot is not None and snapshot.statements is not None:
+                    ast = snapshot.program()
+                    lazy_functions = []
+                else:
+                    # Fonksiyon gövdeleri atlanır; panelde açılınca veya arka plan denetiminde ayrıştırılır
+                    parser = Parser(self.incremental_lexer.tokens(), self.diagnostics, lazy=True)
+                    ast = yield from labelled_steps("Ayrıştırma", parser.parse_steps())
+                    lazy_functions = parser.lazy_functions
+                yield from self._ast_output_steps(ast)
+
+                # Sembol indeksi yalnızca değişen üst seviye deyimleri yeniden dolaşır
+                self.symbol_index.update(ast, change)
+                self._indexed_revision = revision
+                self.apply_semantic_tags()
+                self.update_outline()
+
+                # --- Hata yoksa: Yeşil renk ve "Kod Hatasız!" mesajı ---
+                self.show_error(self.with_diagnostics("Kod Hatasız!"), color="green")
+                # AST, tüm gövdeler ayrıştırılınca (hatasızsa) anlık görüntüye eklenir
+                self.schedule_body_check(lazy_functions, on_done=lambda error_free: self.snapshots.record(
+                    code, self.incremental_lexer, ast.statements if error_free else None))
+            else:
+                # Büyük dosyada parser, AST paneli ve anahat devre dışı
+                self.symbol_index.invalidate()
+                self.clear_outline()
+                yield from labelled_steps("Geçmiş", self.snapshots.record_steps(code, self.incremental_lexer))
+                self.show_ast_message(self.highlight_policy.describe(mode))
+                self.show_error(self.with_diagnostics(self.highlight_policy.describe(mode)), color="orange")
 
         except ParserError as e:
+            self.symbol_index.invalidate()  # Bu düzenleme indekse yansımadı; sonraki başarılı ayrıştırmada yeniden kur
+            self.snapshots.record(code, self.incremental_lexer)  # Tokenlar geçerli; yalnızca AST saklanmaz
             self.ast_output.config(state=tk.NORMAL)
             self.ast_output.delete("1.0", tk.END)
             self.ast_output.insert("1.0", f"❌ Parser Hatası: {str(e)}\n\n")
             self.ast_output.config(state=tk.DISABLED)
-            self.show_error(f"Parser Hatası: {e}", color="red")
+            self.show_error(self.with_diagnostics(f"Parser Hatası: {e}"), color="red")
 
         except Exception as e:
+            self.symbol_index.invalidate()
             self.ast_output.config(state=tk.NORMAL)
             self.ast_output.delete("1.0", tk.END)
             self.ast_output.insert("1.0", f"❌ Genel Hata: {str(e)}\n\n")
@@ -204,88 +466,889 @@ class SyntaxHighlighterGUI:
             self.ast_output.config(state=tk.DISABLED)
             self.show_error(f"Genel Hata: {str(e)}", color="red")
 
-    def update_ast_output(self, ast_nodes):
-        self.ast_output.config(state=tk.NORMAL)
-        self.ast_output.delete("1.0", tk.END)
-        self.ast_output.insert("1.0", "Abstract Syntax Tree:\n\n")
-
-        def print_node(node, indent_level=0):  # <-- Burası 'indent_level' olarak tanımlanmış, doğru.
-            indent_str = "  " * indent_level
-            self.ast_output.insert(tk.END, f"{indent_str}• {node.__class__.__name__}")
-
-            if isinstance(node, ProgramNode):
-                # ...
-                for stmt in node.statements:
-                    print_node(stmt, indent_level + 1)
-
-            elif isinstance(node, AssignmentNode):
-                # ...
-                print_node(node.expression, indent_level + 1)
-
-            elif isinstance(node, ExpressionStatementNode):
-                # ...
-                print_node(node.expression, indent_level + 1)
-
-            elif isinstance(node, IfNode):
-                # ...
-                self.ast_output.insert(tk.END, f"{indent_str}  Condition:\n")
-                print_node(node.condition, indent_level + 2)
-                self.ast_output.insert(tk.END, f"{indent_str}  Body:\n")
-                for stmt in node.body:
-                    print_node(stmt, indent_level + 2)
-                if node.else_body:
-                    self.ast_output.insert(tk.END, f"{indent_str}  Else Body:\n")
-                    for stmt in node.else_body:
-                        print_node(stmt, indent_level + 2)
-
-            elif isinstance(node, WhileNode):
-                # ...
-                self.ast_output.insert(tk.END, f"{indent_str}  Condition:\n")
-                print_node(node.condition, indent_level + 2)
-                self.ast_output.insert(tk.END, f"{indent_str}  Body:\n")
-                for stmt in node.body:
-                    print_node(stmt, indent_level + 2)
-
-            elif isinstance(node, FunctionDefNode):
-                # ...
-                self.ast_output.insert(tk.END, f"{indent_str}  Params: {', '.join(node.params)}\n")
-                self.ast_output.insert(tk.END, f"{indent_str}  Body:\n")
-                for stmt in node.body:
-                    print_node(stmt, indent_level + 2)
-
-            elif isinstance(node, ReturnNode):
-                # ...
-                if node.expression:
-                    print_node(node.expression, indent_level + 1)
-
-            elif isinstance(node, CallNode):
-                # ...
-                self.ast_output.insert(tk.END, f"{indent_str}  Args:\n")
-                for arg in node.arguments:
-                    print_node(arg, indent_level + 2)
-
-            elif isinstance(node, BinaryOpNode):
-                # ...
-                print_node(node.left, indent_level + 1)
-                print_node(node.right, indent_level + 1)
-
-            elif isinstance(node, UnaryOpNode):
-                # ...
-                print_node(node.operand, indent_level + 1)
-
-        # Ana AST düğümünü yazdırmaya başla (ProgramNode beklenir)
-        if isinstance(ast_nodes, ProgramNode):
-            print_node(ast_nodes)
+    def _tag_steps(self, start=0, end=None):
+        """
+        [start, end) (0 tabanlı) satırlarının token tag'lerini TAG_STEP_LINES
+        satırlık dilimler halinde yeniler (katlanmış satırlar vurgulanmaz).
+        Ekranda görünen satırları içeren dilimler önce renklendirilir.
+        """
+        line_tokens = self.incremental_lexer.line_tokens
+        line_count = len(line_tokens)
+        end = line_count if end is None else min(end, line_count)
+        hidden = bytearray(line_count)
+        for first_line, last_line in self.folded_line_ranges():
+            hidden[first_line - 1:last_line] = b'\x01' * len(hidden[first_line - 1:last_line])
+
+        blocks = range(start, end, TAG_STEP_LINES)
+        first_visible, last_visible = self.visible_lines()
+        visible = [first for first in blocks if first < last_visible and first + TAG_STEP_LINES >= first_visible]
+        visible_set = set(visible)
+        done = 0
+        for first in visible + [first for first in blocks if first not in visible_set]:
+            last = min(first + TAG_STEP_LINES, end)
+            for tag in TOKEN_TAG_NAMES:
+                self.text_area.tag_remove(tag, f"{first + 1}.0", f"{last + 1}.0")
+            self.add_token_tags(line_tokens[idx] for idx in range(first, last) if not hidden[idx])
+            done += last - first
+            yield "Renklendirme", done, end - start
+
+    def visible_lines(self):
+        """Metin alanında görünen ilk ve son satır (1 tabanlı)."""
+        first = int(self.text_area.index("@0,0").split('.')[0])
+        last = int(self.text_area.index(f"@0,{self.text_area.winfo_height()}").split('.')[0])
+        return first, last
+
+    def add_token_tags(self, token_lines):
+        """
+        token_lines'daki (satır token listeleri) tokenların tag'lerini ekler. Token
+        tipi -> tag tek bir sözlük aramasıdır; aralıklar tag başına toplanıp
+        TAG_ADD_BATCH'lik tag_add çağrılarıyla eklenir.
+        """
+        tag_for_type = TOKEN_TAGS.get
+        tag_ranges = {}
+        for tokens in token_lines:
+            for token in tokens:
+                tag = tag_for_type(token.type)
+                if tag is None or not token.value:
+                    continue  # NEWLINE, INDENT, DEDENT, EOF gibi renklendirilmeyen tokenlar
+                ranges = tag_ranges.get(tag)
+                if ranges is None:
+                    ranges = tag_ranges[tag] = []
+                ranges.append(f"{token.line}.{token.column}")
+                ranges.append(f"{token.line}.{token.column + len(token.value)}")
+        for tag, ranges in tag_ranges.items():
+            for idx in range(0, len(ranges), TAG_ADD_BATCH):
+                self.text_area.tag_add(tag, *ranges[idx:idx + TAG_ADD_BATCH])
+
+    def apply_semantic_tags(self):
+        """Sembol indeksine göre fonksiyon adlarını ve parametreleri değişkenlerden ayrı renklendirir."""
+        semantic_tags = {KIND_FUNCTION: "function_name", KIND_PARAMETER: "parameter"}
+        tag_ranges = {}
+        for symbol in self.symbol_index:
+            tag = semantic_tags.get(self.symbol_index.semantic_kind(symbol))
+            if tag is not None:
+                line = symbol.line
+                tag_ranges.setdefault(tag, []).extend((f"{line}.{symbol.column}", f"{line}.{symbol.end_column}"))
+        for tag, ranges in tag_ranges.items():
+            for idx in range(0, len(ranges), TAG_ADD_BATCH):
+                self.text_area.tag_add(tag, *ranges[idx:idx + TAG_ADD_BATCH])
+
+    def symbol_at_cursor(self):
+        line, column = map(int, self.text_area.index(tk.INSERT).split('.'))
+        symbol = self.symbol_index.symbol_at(line, column)
+        if symbol is None and column > 0:
+            symbol = self.symbol_index.symbol_at(line, column - 1)  # İmleç ismin hemen sonundaysa
+        return symbol
+
+    def go_to_definition(self, event=None):
+        """İmleçteki ismin tanımına gider (F12)."""
+        symbol = self.symbol_at_cursor()
+        definition = self.symbol_index.definition_of(symbol) if symbol is not None else None
+        if definition is None:
+            self.show_error("Tanım bulunamadı", color="orange")
+            return "break"
+        self.text_area.mark_set(tk.INSERT, f"{definition.line}.{definition.column}")
+        self.text_area.see(tk.INSERT)
+        self.update_bracket_match()
+        return "break"
+
+    def show_usages(self, event=None):
+        """İmleçteki ismin tüm tanım ve kullanımlarını işaretler (Shift+F12)."""
+        self.text_area.tag_remove("symbol_usage", "1.0", tk.END)
+        symbol = self.symbol_at_cursor()
+        if symbol is None:
+            return "break"
+        usages = self.symbol_index.usages_of(symbol)
+        for usage in usages:
+            self.text_area.tag_add("symbol_usage", f"{usage.line}.{usage.column}", f"{usage.line}.{usage.end_column}")
+        self.show_error(f"'{symbol.name}': {len(usages)} kullanım", color="green")
+        return "break"
+
+    # --- Sekme durumu ---
+    @property
+    def focused(self):
+        return self.window.current_tab is self
+
+    @property
+    def priority(self):
+        """Analiz işlerinin paylaşılan zamanlayıcıdaki önceliği: odaktaki sekme önce."""
+        return PRIORITY_FOCUSED if self.focused else PRIORITY_BACKGROUND
+
+    def update_priority(self):
+        """Odak değişince bu sekmenin süren işlerini yeni önceliğe taşır."""
+        for task in (self._load_task, self._highlight_task):
+            if task is not None and task.running:
+                self.window.scheduler.set_priority(task, self.priority)
+
+    @property
+    def display_name(self):
+        return os.path.basename(self.file_path) if self.file_path else "Adsız"
+
+    @property
+    def is_blank(self):
+        """Yeni açılmış, düzenlenmemiş boş sekme (dosya açılırken yeniden kullanılır)."""
+        return (self.file_path is None and not self.dirty and not self.loading and
+                self.text_area.compare("end-1c", "==", "1.0"))
+
+    def set_dirty(self, dirty):
+        if self.dirty != dirty:
+            self.dirty = dirty
+            self.window.update_title(self)
+
+    def close(self):
+        """Sekmenin işlerini durdurur ve widget'larını yok eder."""
+        self.master.after_cancel(self._initial_highlight_job)
+        for task in (self._load_task, self._highlight_task):
+            if task is not None:
+                task.cancel()
+        self.schedule_body_check([])
+        if self._completion_popup is not None:
+            self._completion_popup.destroy()
+        self.frame.destroy()
+
+    # --- Dosya işlemleri ---
+    @property
+    def loading(self):
+        return self._load_task is not None and self._load_task.running
+
+    def open_file(self, event=None, path=None):
+        """
+        Dosyayı parçalar halinde açar (Ctrl+O). Her parça ayrı bir dilimde metne
+        eklenir ve satır satır taşınan girinti durumuyla hemen renklendirilir;
+        ilk ekran beklemeden görünür, arayüz yükleme boyunca yanıt verir. Yükleme
+        bitince normal vurgulama hattı (ayrıştırma, indeksler) bir kez çalışır.
+        """
+        if path is None:
+            from tkinter import filedialog
+            path = filedialog.askopenfilename(parent=self.master)
+            if not path:
+                return "break"
+        from file_io import ChunkedReader
+
+        try:
+            reader = ChunkedReader(path, chunk_bytes=LOAD_CHUNK_BYTES)
+        except OSError as e:
+            self.show_error(f"Dosya açılamadı: {e}", color="red")
+            return "break"
+
+        for task in (self._load_task, self._highlight_task):
+            if task is not None:
+                task.cancel()
+        self.schedule_body_check([])
+        # Önceki belgenin analiz durumu geçersiz
+        self.incremental_lexer.reset()
+        self.snapshots.clear()
+        self._tagged_revision = None
+        self.symbol_index.invalidate()
+        self.occurrence_index.clear()
+        self.completion_index.clear()
+        self.clear_outline()
+        # Yükleme başarısız olursa boş metin önceki dosyanın üzerine kaydedilmesin
+        self.file_path = None
+        self.file_newline = None
+        self.dirty = False
+        self.window.update_title(self)
+
+        # Yükleme geri alınabilir bir düzenleme değildir; kullanıcı yazamaz ama kaydırabilir
+        self.text_area.config(undo=False, state=tk.NORMAL)
+        self.text_area.delete("1.0", tk.END)
+        self.text_area.config(state=tk.DISABLED)
+        self.line_numbers.config(state='normal')
+        self.line_numbers.delete("1.0", tk.END)
+        self.line_numbers.config(state='disabled')
+
+        mode = self.highlight_policy.choose_mode(0, reader.size)
+        errors = []
+        self._load_task = CooperativeTask(
+            self.master, self._load_steps(reader, mode != HighlightPolicy.MODE_PLAIN, errors),
+            on_progress=self.show_highlight_progress,
+            on_done=lambda task: self._load_done(reader, path, errors),
+            scheduler=self.window.scheduler, priority=self.priority)
+        self._load_task.start()
+        return "break"
+
+    def _load_steps(self, reader, highlight, errors):
+        """Okuma hatası errors listesine eklenir ve yükleme durur (yarım metin kaydedilmesin diye)."""
+        chunks = iter(reader)
+        indent_stack = [0] if highlight else None
+        loaded_lines = 0
+        while True:
+            try:
+                chunk = next(chunks, None)
+            except (OSError, UnicodeDecodeError) as e:
+                errors.append(e)
+                return
+            if chunk is None:
+                return
+            lines = self.lexer.split_lines(chunk)
+            self.text_area.config(state=tk.NORMAL)
+            self.text_area.insert("end-1c", chunk)
+            self.text_area.config(state=tk.DISABLED)
+
+            if indent_stack is not None:
+                try:
+                    self.add_token_tags(self.lexer.tokenize_line(line, loaded_lines + idx + 1, indent_stack)
+                                        for idx, line in enumerate(lines))
+                except LexerError:
+                    indent_stack = None  # Girinti hatası: kalan parçalar renksiz eklenir, hatayı son vurgulama bildirir
+
+            numbers = "".join(f"{num}\n" for num in range(loaded_lines + 1, loaded_lines + len(lines) + 1))
+            self.line_numbers.config(state='normal')
+            self.line_numbers.insert(tk.END, numbers)
+            self.line_numbers.config(state='disabled')
+            loaded_lines += len(lines)
+            yield "Yükleniyor", reader.bytes_read, reader.size
+
+    def _load_done(self, reader, path, errors):
+        self._load_task = None
+        self.text_area.config(state=tk.NORMAL, undo=True)
+        if errors:
+            self.text_area.delete("1.0", tk.END)
+        self.text_area.edit_reset()
+        self.text_area.edit_modified(False)
+        if not errors:
+            self.file_path = path
+            self.file_newline = reader.newline
+            self.window.update_title(self)
+        self.update_line_numbers()
+        self.highlight_syntax()
+        if errors:
+            self.show_error(f"Dosya okunamadı: {errors[0]}", color="red")
+
+    def save_file(self, event=None):
+        """Metni açık dosyaya atomik olarak kaydeder (Ctrl+S); dosya yoksa konum sorulur."""
+        if self.file_path is None:
+            return self.save_file_as()
+        self.write_file(self.file_path)
+        return "break"
+
+    def save_file_as(self, event=None):
+        from tkinter import filedialog
+
+        path = filedialog.asksaveasfilename(parent=self.master)
+        if path:
+            self.write_file(path)
+        return "break"
+
+    def write_file(self, path):
+        if self.loading:
+            self.show_error("Dosya yüklenirken kaydedilemez", color="orange")
+            return
+        from file_io import atomic_write
+
+        try:
+            atomic_write(path, self._text_chunks(), newline=self.file_newline or '\n')
+        except (OSError, UnicodeEncodeError) as e:
+            self.show_error(f"Kaydedilemedi: {e}", color="red")
+            return
+        self.file_path = path
+        self.set_dirty(False)
+        self.window.update_title(self)
+        self.show_error(f"Kaydedildi: {path}", color="green")
+
+    def _text_chunks(self):
+        """Metni SAVE_CHUNK_LINES satırlık parçalar halinde üretir (Tk'nin sona eklediği '\\n' hariç)."""
+        last_line = int(self.text_area.index("end-1c").split('.')[0])
+        for first in range(1, last_line + 1, SAVE_CHUNK_LINES):
+            stop = first + SAVE_CHUNK_LINES
+            yield self.text_area.get(f"{first}.0", f"{stop}.0" if stop <= last_line else "end-1c")
+
+    def update_outline(self):
+        """
+        Anahat panelini sembol indeksiyle eşitler. İndeks panelin gösterdiği
+        sürümden bir adım ilerideyse yalnızca değişen deyim kayıtlarının satırları
+        silinip yeniden yazılır; AST yeniden dolaşılmaz.
+        """
+        index = self.symbol_index
+        if self._outline_version == index.version:
+            return
+        if self._outline_version == index.version - 1:
+            start, old_stop, new_stop = index.record_change
         else:
-            self.ast_output.insert(tk.END, f"• {ast_nodes.__class__.__name__}: {ast_nodes}\n")
+            start, old_stop, new_stop = 0, len(self._outline_counts), len(index.records)
+        self._outline_version = index.version
+        if start == old_stop == new_stop:
+            return
+
+        first_row = sum(self._outline_counts[:start])
+        old_rows = sum(self._outline_counts[start:old_stop])
+        entries = list(index.outline(start, new_stop))
+        if old_rows:
+            self.outline.delete(first_row, first_row + old_rows - 1)
+        if entries:
+            self.outline.insert(first_row, *(self.outline_label(entry) for entry in entries))
+        self.outline_entries[first_row:first_row + old_rows] = entries
+        self._outline_counts[start:old_stop] = [len(record.outline) for record in index.records[start:new_stop]]
 
+    def clear_outline(self):
+        if self._outline_version is None and not self.outline_entries:
+            return
+        self.outline.delete(0, tk.END)
+        self.outline_entries = []
+        self._outline_counts = []
+        self._outline_version = None
+
+    def outline_label(self, entry):
+        indent = "  " * entry.depth
+        if entry.kind == KIND_FUNCTION:
+            return f"{indent}ƒ {entry.name}({', '.join(entry.params)})"
+        # if/while bloğunda başlık satırının kendisi gösterilir
+        header = self.text_area.get(f"{entry.line}.0", f"{entry.line}.end").strip()
+        return f"{indent}{header[:40]}"
+
+    def on_outline_select(self, event=None):
+        """Anahatta seçilen tanımın satırına gider."""
+        selection = self.outline.curselection()
+        if not selection:
+            return
+        entry = self.outline_entries[selection[0]]
+        self.text_area.mark_set(tk.INSERT, f"{entry.line}.0")
+        self.text_area.see(tk.INSERT)
+        self.text_area.focus_set()
+        self.update_bracket_match()
+        self.update_cursor_info()
+
+    def identifier_at_cursor(self):
+        """İmleçteki IDENTIFIER token'ı (yoksa None)."""
+        line, column = map(int, self.text_area.index(tk.INSERT).split('.'))
+        token = self.incremental_lexer.token_at(line, column)
+        if (token is None or token.type is not TokenType.IDENTIFIER) and column > 0:
+            token = self.incremental_lexer.token_at(line, column - 1)  # İmleç ismin hemen sonundaysa
+        return token if token is not None and token.type is TokenType.IDENTIFIER else None
+
+    def analysis_pending(self):
+        """Dilimli vurgulama işi sürüyorsa indeksler metnin gerisinde olabilir."""
+        if self._highlight_task is not None and self._highlight_task.running:
+            self.show_error("Analiz sürüyor, biraz sonra tekrar deneyin", color="orange")
+            return True
+        return False
+
+    def find_identifier(self, event=None):
+        """Bir ismin kod içindeki geçişlerini işaretler; string ve yorumlar atlanır (Ctrl+F)."""
+        from tkinter import simpledialog
+
+        if self.analysis_pending():
+            return "break"
+        token = self.identifier_at_cursor()
+        name = simpledialog.askstring("Bul", "İsim:", parent=self.master,
+                                      initialvalue=token.value if token is not None else self._find_name or "")
+        if not name:
+            return "break"
+        self._find_name = name.strip()
+        self.text_area.tag_remove("symbol_usage", "1.0", tk.END)
+        positions = self.occurrence_index.occurrences(self._find_name)
+        ranges = []
+        for line, column in positions:
+            ranges.extend((f"{line}.{column}", f"{line}.{column + len(self._find_name)}"))
+        for idx in range(0, len(ranges), TAG_ADD_BATCH):
+            self.text_area.tag_add("symbol_usage", *ranges[idx:idx + TAG_ADD_BATCH])
+        if not positions:
+            self.show_error(f"'{self._find_name}' bulunamadı", color="orange")
+            return "break"
+        self.show_error(f"'{self._find_name}': {len(positions)} geçiş (sonraki: F3)", color="green")
+        return self.find_next()
+
+    def find_next(self, event=None):
+        """Son aranan ismin imleçten sonraki ilk geçişine gider; sona gelince başa döner (F3)."""
+        if self._find_name is None or self.analysis_pending():
+            return "break"
+        positions = self.occurrence_index.occurrences(self._find_name)
+        if not positions:
+            return "break"
+        line, column = map(int, self.text_area.index(tk.INSERT).split('.'))
+        idx = bisect_right(positions, (line, column))
+        target_line, target_column = positions[idx % len(positions)]
+        self.text_area.mark_set(tk.INSERT, f"{target_line}.{target_column + len(self._find_name)}")
+        self.text_area.see(tk.INSERT)
+        self.update_cursor_info()
+        return "break"
+
+    def rename_symbol(self, event=None):
+        """
+        İmleçteki ismi yeniden adlandırır (F2). Fonksiyon parametresi veya yerel
+        isimde yalnızca o kapsam değişir. Tüm geçişler tek bir replace ile
+        (tek geri alma adımı olarak) metne uygulanır.
+        """
+        from tkinter import simpledialog
+
+        if self.analysis_pending():
+            return "break"
+        token = self.identifier_at_cursor()
+        if token is None:
+            self.show_error("Yeniden adlandırılacak isim yok", color="orange")
+            return "break"
+        old_name = token.value
+        new_name = simpledialog.askstring("Yeniden Adlandır", f"'{old_name}' için yeni isim:",
+                                          parent=self.master, initialvalue=old_name)
+        if not new_name or new_name.strip() == old_name:
+            return "break"
+        new_name = new_name.strip()
+        if not is_identifier(self.lexer, new_name):
+            self.show_error(f"Geçersiz isim: '{new_name}'", color="red")
+            return "break"
+
+        # Kapsam bilgisi yalnızca sembol indeksi bu metinle güncelse kullanılır
+        scoped = self.symbol_index.valid and self._indexed_revision == self.incremental_lexer.revision
+        symbol = self.symbol_index.symbol_at(token.line, token.column) if scoped else None
+        positions = rename_targets(self.occurrence_index, self.symbol_index if scoped else None, old_name, symbol)
+        if not positions:
+            return "break"
+
+        first_line, last_line = positions[0][0], positions[-1][0]
+        try:
+            new_text = rename_text(self.text_area.get(f"{first_line}.0", f"{last_line}.end"),
+                                   first_line, positions, old_name, new_name)
+        except ValueError as e:
+            self.show_error(f"Yeniden adlandırma yapılamadı: {e}", color="red")
+            return "break"
+
+        # İmleç, aynı satırda kendinden önceki geçişlerin uzunluk farkı kadar kayar
+        line, column = map(int, self.text_area.index(tk.INSERT).split('.'))
+        shift = sum(1 for pos_line, pos_column in positions if pos_line == line and pos_column < column)
+        self.text_area.edit_separator()
+        self.text_area.replace(f"{first_line}.0", f"{last_line}.end", new_text)
+        self.text_area.edit_separator()
+        self.text_area.mark_set(tk.INSERT, f"{line}.{column + shift * (len(new_name) - len(old_name))}")
+
+        note = "" if scoped else " (kapsam bilgisi yok: tüm geçişler)"
+        self.show_error(f"'{old_name}' → '{new_name}': {len(positions)} yer{note}", color="green")
+        return "break"
+
+    def schedule_body_check(self, functions, on_done=None):
+        """
+        Tembel fonksiyon gövdelerini boşta kalan zamanda dilimler halinde
+        ayrıştırır; ilk sözdizimi hatası durum çubuğunda gösterilir. Tüm
+        gövdeler denetlenince on_done(hatasız_mı) çağrılır.
+        """
+        if self._body_check_job is not None:
+            self.master.after_cancel(self._body_check_job)
+            self._body_check_job = None
+        if functions or on_done is not None:
+            self._body_check_job = self.master.after_idle(self._check_bodies, iter(functions), on_done, True)
+
+    def _check_bodies(self, pending, on_done, error_free):
+        self._body_check_job = None
+        deadline = time.perf_counter() + BODY_CHECK_SLICE
+        for node in pending:
+            try:
+                node.body
+            except ParserError as e:
+                if error_free:
+                    self.show_error(self.with_diagnostics(f"Parser Hatası: {e}"), color="red")
+                    error_free = False
+            if time.perf_counter() > deadline:
+                # Arayüz donmasın: kalan gövdeleri bir sonraki dilime bırak
+                self._body_check_job = self.master.after(1, self._check_bodies, pending, on_done, error_free)
+                return
+        if on_done is not None:
+            on_done(error_free)
+
+    def with_diagnostics(self, message):
+        """Durum mesajına tanı sayılarını ekler (örn. 'Kod Hatasız! (3 uyarı)')."""
+        summary = self.diagnostics.summary()
+        return f"{message} ({summary})" if summary else message
+
+    def show_ast_message(self, message):
+        self.ast_output.config(state=tk.NORMAL)
+        self.ast_output.delete("1.0", tk.END)
+        self.ast_output.insert("1.0", f"ℹ {message}\n")
         self.ast_output.config(state=tk.DISABLED)
+
+    def _ast_output_steps(self, ast_nodes):
+        """AST panelini her üst seviye deyimden sonra ilerleme üreterek yazar."""
+        self.ast_output.config(state=tk.NORMAL)
+        try:
+            self.ast_output.delete("1.0", tk.END)
+            self.ast_output.insert("1.0", "Abstract Syntax Tree:\n\n")
+            self.lazy_ast_nodes = {}
+
+            # Ana AST düğümünü yazdırmaya başla (ProgramNode beklenir)
+            if isinstance(ast_nodes, ProgramNode):
+                self.ast_output.insert(tk.END, f"• {ast_nodes.__class__.__name__}")
+                statements = ast_nodes.statements
+                for idx, stmt in enumerate(statements):
+                    self.print_ast_node(stmt, 1)
+                    # Dilimler arasında panel kullanıcı düzenlemesine kapalı kalsın
+                    self.ast_output.config(state=tk.DISABLED)
+                    yield "AST", idx + 1, len(statements)
+                    self.ast_output.config(state=tk.NORMAL)
+            else:
+                self.ast_output.insert(tk.END, f"• {ast_nodes.__class__.__name__}: {ast_nodes}\n")
+        finally:
+            self.ast_output.config(state=tk.DISABLED)
         self.ast_output.see(tk.END)
 
+    def print_ast_node(self, node, indent_level=0, where=tk.END):
+        """Düğümü AST paneline where indeksinden (varsayılan: sona) itibaren yazar."""
+        indent_str = "  " * indent_level
+        self.ast_output.insert(where, f"{indent_str}• {node.__class__.__name__}")
+
+        if isinstance(node, ProgramNode):
+            # ...
+            for stmt in node.statements:
+                self.print_ast_node(stmt, indent_level + 1, where)
+
+        elif isinstance(node, AssignmentNode):
+            # ...
+            self.print_ast_node(node.expression, indent_level + 1, where)
+
+        elif isinstance(node, ExpressionStatementNode):
+            # ...
+            self.print_ast_node(node.expression, indent_level + 1, where)
+
+        elif isinstance(node, IfNode):
+            # ...
+            self.ast_output.insert(where, f"{indent_str}  Condition:\n")
+            self.print_ast_node(node.condition, indent_level + 2, where)
+            self.ast_output.insert(where, f"{indent_str}  Body:\n")
+            for stmt in node.body:
+                self.print_ast_node(stmt, indent_level + 2, where)
+            if node.else_body:
+                self.ast_output.insert(where, f"{indent_str}  Else Body:\n")
+                for stmt in node.else_body:
+                    self.print_ast_node(stmt, indent_level + 2, where)
+
+        elif isinstance(node, WhileNode):
+            # ...
+            self.ast_output.insert(where, f"{indent_str}  Condition:\n")
+            self.print_ast_node(node.condition, indent_level + 2, where)
+            self.ast_output.insert(where, f"{indent_str}  Body:\n")
+            for stmt in node.body:
+                self.print_ast_node(stmt, indent_level + 2, where)
+
+        elif isinstance(node, FunctionDefNode):
+            # ...
+            self.ast_output.insert(where, f"{indent_str}  Params: {', '.join(node.params)}\n")
+            self.ast_output.insert(where, f"{indent_str}  Body:\n")
+            if not node.is_body_parsed and node.body_error is None:
+                # Tembel gövde: tıklanınca ayrıştırılıp yerine yazılır
+                tag = f"lazy_body_{len(self.lazy_ast_nodes)}"
+                self.lazy_ast_nodes[tag] = (node, indent_level + 2)
+                self.ast_output.insert(where, f"{indent_str}    ▸ Gövdeyi göster\n", ("lazy_body", tag))
+            else:
+                self.print_ast_body(node, indent_level + 2, where)
+
+        elif isinstance(node, ReturnNode):
+            # ...
+            if node.expression:
+                self.print_ast_node(node.expression, indent_level + 1, where)
+
+        elif isinstance(node, CallNode):
+            # ...
+            self.ast_output.insert(where, f"{indent_str}  Args:\n")
+            for arg in node.arguments:
+                self.print_ast_node(arg, indent_level + 2, where)
+
+        elif isinstance(node, BinaryOpNode):
+            # ...
+            self.print_ast_node(node.left, indent_level + 1, where)
+            self.print_ast_node(node.right, indent_level + 1, where)
+
+        elif isinstance(node, UnaryOpNode):
+            # ...
+            self.print_ast_node(node.operand, indent_level + 1, where)
+
+    def print_ast_body(self, node, indent_level, where=tk.END):
+        """Fonksiyon gövdesini yazar; tembel gövde burada ayrıştırılır, hata varsa satır içinde gösterilir."""
+        try:
+            body = node.body
+        except ParserError as e:
+            self.ast_output.insert(where, f"{'  ' * indent_level}❌ Parser Hatası: {e}\n", "lazy_body_error")
+            return
+        for stmt in body:
+            self.print_ast_node(stmt, indent_level, where)
+
+    def expand_lazy_body(self, event=None):
+        """AST panelinde tıklanan tembel fonksiyon gövdesini ayrıştırıp yerine yazar."""
+        for tag in self.ast_output.tag_names("current"):
+            if tag in self.lazy_ast_nodes:
+                break
+        else:
+            return
+        node, indent_level = self.lazy_ast_nodes.pop(tag)
+        start, end = self.ast_output.tag_ranges(tag)[:2]
+        self.ast_output.config(state=tk.NORMAL)
+        self.ast_output.delete(start, end)
+        self.ast_output.mark_set("lazy_insert", start)
+        self.print_ast_body(node, indent_level, "lazy_insert")
+        self.ast_output.mark_unset("lazy_insert")
+        self.ast_output.config(state=tk.DISABLED)
+        if node.body_error is not None:
+            self.show_error(self.with_diagnostics(f"Parser Hatası: {node.body_error}"), color="red")
+
     def show_error(self, message, color="green"):
+        """Durum mesajını saklar; sekme odaktaysa durum çubuğunda gösterir."""
+        self.status = (message, color)
+        if self.focused:
+            self.window.show_status(message, color)
+
+    def insert_spaces(self, event):
+        self.text_area.insert(tk.INSERT, "    ")
+        return "break"
+
+    # --- Otomatik tamamlama ---
+    def completion_prefix(self):
+        """İmleçten önce yazılmakta olan isim: (satır, başlangıç sütunu, önek); isim yoksa önek boştur."""
+        line, column = map(int, self.text_area.index(tk.INSERT).split('.'))
+        match = _WORD_BEFORE_CURSOR.search(self.text_area.get(f"{line}.0", f"{line}.{column}"))
+        return (line, match.start(), match.group()) if match else (line, column, "")
+
+    def show_completions(self, event=None):
+        """
+        İmleçteki önek için tamamlama listesini açar (Ctrl+Space). Adaylar önce
+        imlecin fonksiyon kapsamındaki isimler, sonra anahtar kelimeler, sonra
+        kodda en sık geçen isimlerdir; liste yazdıkça süzülür.
+        """
+        self._completion_context = None  # Yeni liste: önceki seçim korunmaz
+        self.update_completions(self.completion_prefix(), force=True)
+        return "break"
+
+    def update_completions(self, context=None, force=False):
+        """Önek değiştiyse (veya force ise) adayları yeniler; imleç başka bir isme geçtiyse listeyi kapatır."""
+        context = context or self.completion_prefix()
+        previous = self._completion_context
+        if not force and context == previous:
+            return  # Ör. listede gezinen ok tuşunun bırakılması
+        line, start, prefix = context
+        if previous is not None and (line, start) != previous[:2]:
+            self.hide_completions()  # İmleç başka bir isme geçti
+            return
+        # Sembol indeksi metnin biraz gerisinde olabilir; kapsam sıralaması için yeterlidir
+        symbols = self.symbol_index if self.symbol_index.valid else None
+        candidates = complete(prefix, self.completion_index, self.window.completion_keywords, symbols, line)
+        # İmleçteki ismin kendisi aday olmaz
+        word = prefix + _WORD_AFTER_CURSOR.match(self.text_area.get(tk.INSERT, f"{tk.INSERT} lineend")).group()
+        candidates = [name for name in candidates if name != word]
+        bbox = self.text_area.bbox(tk.INSERT)
+        if not candidates or not bbox:
+            self.hide_completions()
+            return
+
+        if self._completion_popup is None:
+            self._completion_popup = tk.Toplevel(self.text_area)
+            self._completion_popup.overrideredirect(True)
+            self._completion_list = tk.Listbox(self._completion_popup, activestyle='none', exportselection=False,
+                                               font=("Consolas", 10))
+            self._completion_list.pack(fill=tk.BOTH, expand=True)
+            self._completion_list.bind("<ButtonRelease-1>", self.accept_completion)
+        listbox = self._completion_list
+        # Yenilenen listede önceki seçim (hâlâ adaysa) korunur
+        selection = listbox.curselection() if previous is not None else ()
+        selected = listbox.get(selection[0]) if selection else None
+        listbox.delete(0, tk.END)
+        listbox.insert(tk.END, *candidates)
+        listbox.config(height=len(candidates))
+        idx = candidates.index(selected) if selected in candidates else 0
+        listbox.selection_set(idx)
+        listbox.see(idx)
+        x, y, _, height = bbox
+        x += self.text_area.winfo_rootx()
+        y += self.text_area.winfo_rooty() + height
+        self._completion_popup.geometry(f"+{x}+{y}")
+        self._completion_popup.deiconify()
+        self._completion_popup.lift()
+        self._completion_context = context
+
+    def hide_completions(self, event=None):
+        self._completion_context = None
+        if self._completion_popup is not None:
+            self._completion_popup.withdraw()
+
+    def on_completion_key(self, event):
+        """Liste açıkken ok tuşları seçimi değiştirir, Enter/Tab seçileni ekler, Esc kapatır."""
+        if self._completion_context is None:
+            return None  # Metin alanının kendi davranışı
+        if event.keysym == "Escape":
+            self.hide_completions()
+        elif event.keysym in ("Return", "Tab"):
+            self.accept_completion()
+        else:
+            listbox = self._completion_list
+            selection = listbox.curselection()
+            step = -1 if event.keysym == "Up" else 1
+            idx = ((selection[0] if selection else 0) + step) % listbox.size()
+            listbox.selection_clear(0, tk.END)
+            listbox.selection_set(idx)
+            listbox.see(idx)
+        return "break"
+
+    def accept_completion(self, event=None):
+        """Seçili adayı imleçteki ismin (önek ve imleçten sonraki kısmı) yerine koyar; tek geri alma adımıdır."""
+        if self._completion_context is None:
+            return
+        selection = self._completion_list.curselection()
+        line, start, _ = self._completion_context
+        self.hide_completions()
+        if not selection:
+            return
+        name = self._completion_list.get(selection[0])
+        rest = _WORD_AFTER_CURSOR.match(self.text_area.get(tk.INSERT, f"{tk.INSERT} lineend")).group()
+        self.text_area.edit_separator()
+        self.text_area.delete(f"{line}.{start}", f"{tk.INSERT}+{len(rest)}c")
+        self.text_area.insert(f"{line}.{start}", name)
+        self.text_area.edit_separator()
+        self.text_area.mark_set(tk.INSERT, f"{line}.{start + len(name)}")
+        self.text_area.focus_set()
+        self.update_cursor_info()
+
+    def on_text_focus_out(self, event=None):
+        # Odak listeye geçtiyse (tıklama) liste açık kalır
+        self.master.after_idle(self._hide_completions_unless_focused)
+
+    def _hide_completions_unless_focused(self):
+        try:
+            focus = self.master.focus_get()
+        except (KeyError, tk.TclError):
+            focus = None  # Odak başka bir uygulamada veya yok edilmiş bir pencerede
+        if self._completion_context is not None and focus not in (self.text_area, self._completion_list):
+            self.hide_completions()
+
+
+class SyntaxHighlighterGUI:
+    """
+    Ana pencere: sekmeli belgeler, menüler ve durum çubuğu.
+
+    Her sekme (EditorTab) kendi token/AST durumunu tutar; lexer, vurgulama
+    politikası, tema, satır önbelleği ve analiz zamanlayıcısı (SliceScheduler)
+    ortaktır. Tuş vuruşu yalnızca odaktaki sekmeyi yeniden analiz eder; arka
+    plandaki sekmelerin süren işleri (ör. dosya yükleme) kısılarak sürer.
+    """
+
+    def __init__(self, master):
+        self.master = master
+        master.title(APP_TITLE)
+
+        self.lexer = Lexer()
+        self.completion_keywords = keyword_words(self.lexer)
+        self.highlight_policy = HighlightPolicy()
+        self.theme = load_theme(DEFAULT_THEME)
+        self.scheduler = SliceScheduler(master)  # Bütün sekmelerin vurgulama/yükleme işleri
+        self.line_cache = WeakValueDictionary()  # Sekmelerin anlık görüntülerinin paylaştığı satır kayıtları
+        self.tabs = []
+        self.current_tab = None
+        self._error_clear_job = None
+
+        # İmleç konumu ve altındaki token (satır tablosunda ikili arama ile bulunur)
+        self.cursor_label = tk.Label(master, text="", anchor='w', font=("Consolas", 9))
+        self.cursor_label.pack(side=tk.BOTTOM, fill=tk.X)
+        self.error_label = tk.Label(master, text="", fg="white", bg="lightgreen")
+        self.error_label.pack(side=tk.BOTTOM, fill=tk.X, pady=2)
+
+        self.notebook = ttk.Notebook(master)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.notebook.enable_traversal()  # Ctrl+Tab / Ctrl+Shift+Tab
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+
+        self.create_menu()
+        self.new_tab()
+
+    def create_menu(self):
+        menu_bar = tk.Menu(self.master)
+        file_menu = tk.Menu(menu_bar, tearoff=0)
+        file_menu.add_command(label="Yeni", accelerator="Ctrl+N", command=self.new_tab)
+        file_menu.add_command(label="Aç…", accelerator="Ctrl+O", command=self.open_file)
+        file_menu.add_command(label="Kaydet", accelerator="Ctrl+S", command=lambda: self.current_tab.save_file())
+        file_menu.add_command(label="Farklı Kaydet…", accelerator="Ctrl+Shift+S",
+                              command=lambda: self.current_tab.save_file_as())
+        file_menu.add_command(label="Kapat", accelerator="Ctrl+W", command=self.close_tab)
+        menu_bar.add_cascade(label="Dosya", menu=file_menu)
+        theme_menu = tk.Menu(menu_bar, tearoff=0)
+        self.theme_var = tk.StringVar(value=self.theme.key)
+        for key, name in available_themes():
+            theme_menu.add_radiobutton(label=name, value=key, variable=self.theme_var,
+                                       command=lambda key=key: self.switch_theme(key))
+        menu_bar.add_cascade(label="Tema", menu=theme_menu)
+        self.master.config(menu=menu_bar)
+
+    def switch_theme(self, key):
+        try:
+            self.theme = load_theme(key)
+        except ThemeError as e:
+            self.theme_var.set(self.theme.key)
+            self.show_status(str(e), color="red")
+            return
+        for tab in self.tabs:
+            tab.apply_theme(self.theme)
+
+    # --- Sekmeler ---
+    def new_tab(self, event=None):
+        tab = EditorTab(self, self.notebook)
+        self.tabs.append(tab)
+        self.notebook.add(tab.frame, text=tab.display_name)
+        self.notebook.select(tab.frame)
+        self.on_tab_changed()
+        return "break" if event is not None else tab
+
+    def close_tab(self, event=None, tab=None):
+        """Sekmeyi kapatır (Ctrl+W); kaydedilmemiş değişiklik varsa sorar. Son sekme boş bir sekmeyle değişir."""
+        tab = tab or self.current_tab
+        if tab.dirty:
+            from tkinter import messagebox
+
+            answer = messagebox.askyesnocancel("Kaydedilmemiş değişiklikler",
+                                               f"{tab.display_name} kaydedilsin mi?", parent=self.master)
+            if answer is None:
+                return "break"
+            if answer:
+                tab.save_file()
+                if tab.dirty:
+                    return "break"  # Kayıt iptal edildi veya başarısız oldu
+        self.tabs.remove(tab)
+        if tab is self.current_tab:
+            self.current_tab = None
+        tab.close()
+        if not self.tabs:
+            self.new_tab()
+        else:
+            self.on_tab_changed()
+        return "break"
+
+    def on_tab_changed(self, event=None):
+        selected = self.notebook.select()
+        tab = next((tab for tab in self.tabs if str(tab.frame) == selected), None)
+        if tab is None or tab is self.current_tab:
+            return
+        self.current_tab = tab
+        # Odaktaki sekmenin işleri öne, diğerlerininki arka plana
+        for other in self.tabs:
+            other.update_priority()
+        self.update_title(tab)
+        message, color = tab.status
+        # Kalıcı olmayan (yeşil/ilerleme) mesajlar sekme değişince gösterilmez
+        self.show_status(message if color in ("red", "orange") else "", color)
+        tab.update_cursor_info()
+        tab.text_area.focus_set()
+
+    def update_title(self, tab):
+        """Sekme başlığını (kaydedilmemişse '*' ile) ve odaktaysa pencere başlığını günceller."""
+        label = ("*" if tab.dirty else "") + tab.display_name
+        self.notebook.tab(tab.frame, text=label)
+        if tab is self.current_tab:
+            self.master.title(f"{label} — {APP_TITLE}" if tab.file_path or tab.dirty else APP_TITLE)
+
+    def open_file(self, event=None, path=None):
+        """
+        Dosyayı yeni bir sekmede açar (Ctrl+O); odaktaki sekme boşsa o kullanılır,
+        dosya zaten açıksa sekmesine geçilir.
+        """
+        if path is None:
+            from tkinter import filedialog
+            path = filedialog.askopenfilename(parent=self.master)
+            if not path:
+                return "break"
+        for tab in self.tabs:
+            if tab.file_path is not None and os.path.abspath(tab.file_path) == os.path.abspath(path):
+                self.notebook.select(tab.frame)
+                self.on_tab_changed()
+                return "break"
+        tab = self.current_tab if self.current_tab is not None and self.current_tab.is_blank else self.new_tab()
+        tab.open_file(path=path)
+        return "break"
+
+    def show_status(self, message, color="green"):
         self.error_label.config(text=message, fg="white", bg=color)
 
-        if color == "red":
+        if color in ("red", "orange"):
             if hasattr(self, '_error_clear_job') and self._error_clear_job is not None:
                 self.master.after_cancel(self._error_clear_job)
             self._error_clear_job = None  # Hata varken otomatik temizleme yok
@@ -305,25 +1368,15 @@ class SyntaxHighlighterGUI:
             self._error_clear_job = None
             self.error_label.config(bg="lightgreen")
 
-    def insert_spaces(self, event):
-        self.text_area.insert(tk.INSERT, "    ")
-        return "break"
-
-    def auto_complete(self, event):
-        word = self.text_area.get("insert-1c wordstart", "insert-1c wordend")
-        matches = [w for w in self.autocomplete_list if w.startswith(word)]
 
-        if len(matches) == 1:
-            self.text_area.delete("insert-1c wordstart", "insert-1c wordend")
-            self.text_area.insert("insert", matches[0])
-        return "break"
-
-def main():
+def main(paths=()):
     root = tk.Tk()
     app = SyntaxHighlighterGUI(root)
+    for path in paths:
+        app.open_file(path=path)
     root.mainloop()
 
 if __name__ == "__main__":
-    root = tk.Tk()
-    app = SyntaxHighlighterGUI(root)
-    root.mainloop()
+    import sys
+
+    main(sys.argv[1:])
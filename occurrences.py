@@ -0,0 +1,135 @@
+# occurrences.py
+from tokens import TokenType
+
+
+class OccurrenceIndex:
+    """
+    İsim -> IDENTIFIER tokenları indeksi (token düzeyinde bul/yeniden adlandır).
+
+    IncrementalLexer'ın satır tokenlarından kurulur ve her güncellemede yalnızca
+    yeniden taranan satırların tokenları çıkarılıp eklenir. STRING ve COMMENT
+    tokenları indekse girmez; arama metin içinde veya yorumlarda eşleşmez.
+    Tokenlar lexer önbelleğiyle paylaşılır: satırlar kayınca tokenların satır
+    numarası lexer tarafından güncellendiği için indekste kaydırma yapılmaz.
+    """
+
+    def __init__(self):
+        self._names = {}  # isim -> {Token: None} (ekleme sıralı küme)
+        self._line_identifiers = []  # Her satırın IDENTIFIER tokenları
+        self.revision = None  # İndeksin yansıttığı lexer önbelleği revizyonu
+        # Son artımlı güncellemede geçiş sayısı değişen isimler; baştan kurulduysa None
+        self.changed_names = None
+
+    def clear(self):
+        self.__init__()
+
+    def update(self, lexer, change):
+        """
+        İndeksi IncrementalLexer'ın güncel haline getirir. change, lexer.update'in
+        döndürdüğü (başlangıç, eski_bitiş, yeni_bitiş) aralığıdır; önceki
+        revizyondan gelinmiyorsa (ör. bir güncelleme kaçırıldıysa) indeks baştan kurulur.
+        """
+        if self.revision == lexer.revision:
+            return
+        if change is None or self.revision != lexer.revision - 1:
+            self.rebuild(lexer)
+            return
+
+        start, old_end, new_end = change
+        changed = self.changed_names = set()
+        for line_tokens in self._line_identifiers[start:old_end]:
+            for token in line_tokens:
+                changed.add(token.value)
+                bucket = self._names[token.value]
+                del bucket[token]
+                if not bucket:
+                    del self._names[token.value]
+        new_identifiers = [self._add_line(line_tokens) for line_tokens in lexer.line_tokens[start:new_end]]
+        for line_tokens in new_identifiers:
+            changed.update(token.value for token in line_tokens)
+        self._line_identifiers[start:old_end] = new_identifiers
+        self.revision = lexer.revision
+
+    def rebuild(self, lexer):
+        self._names = {}
+        self.changed_names = None
+        self._line_identifiers = [self._add_line(line_tokens) for line_tokens in lexer.line_tokens]
+        self.revision = lexer.revision
+
+    def _add_line(self, line_tokens):
+        identifiers = [token for token in line_tokens if token.type is TokenType.IDENTIFIER]
+        for token in identifiers:
+            bucket = self._names.get(token.value)
+            if bucket is None:
+                bucket = self._names[token.value] = {}
+            bucket[token] = None
+        return identifiers
+
+    # --- Sorgular ---
+    def occurrences(self, name):
+        """İsmin geçtiği (satır, sütun) konumları, konum sırasıyla."""
+        return sorted((token.line, token.column) for token in self._names.get(name, ()))
+
+    def count(self, name):
+        return len(self._names.get(name, ()))
+
+    def names(self):
+        return self._names.keys()
+
+    def __contains__(self, name):
+        return name in self._names
+
+
+def is_identifier(lexer, name):
+    """name, lexer'ın tek bir IDENTIFIER olarak tanıdığı bir isim mi (anahtar kelime değil)?"""
+    try:
+        tokens = lexer.tokenize(name)
+    except RuntimeError:
+        return False
+    return len(tokens) == 3 and tokens[0].type is TokenType.IDENTIFIER and tokens[0].value == name
+
+
+def rename_targets(occurrences, symbols, name, symbol=None):
+    """
+    name yeniden adlandırılırken değişecek (satır, sütun) konumları.
+
+    symbol bir fonksiyon kapsamına aitse (parametre veya yerel isim) yalnızca o
+    kapsamdaki kullanımlar döner. Aksi halde ismin tüm tokenlarından, bir
+    fonksiyon kapsamında gölgelenmiş olanlar çıkarılır. symbols (SymbolIndex)
+    None ise kapsam bilgisi yoktur ve tüm tokenlar döner.
+    """
+    if symbols is None:
+        return occurrences.occurrences(name)
+    if symbol is not None and symbol.scope is not None:
+        return [(usage.line, usage.column) for usage in symbols.usages_of(symbol)]
+    targets = []
+    for line, column in occurrences.occurrences(name):
+        local = symbols.symbol_at(line, column)
+        if local is None or local.scope is None:
+            targets.append((line, column))
+    return targets
+
+
+def rename_text(text, first_line, positions, old_name, new_name):
+    """
+    first_line'dan başlayan text'te positions'daki (satır sırasıyla) old_name
+    geçişlerini new_name ile değiştirir; değiştirilmiş metni döndürür. Bir
+    konumda old_name yoksa (indeks metinle uyuşmuyorsa) ValueError fırlatır.
+    """
+    lines = text.split('\n')
+    by_line = {}
+    for line, column in positions:
+        by_line.setdefault(line - first_line, []).append(column)
+    for idx, columns in by_line.items():
+        line_text = lines[idx]
+        parts = []
+        previous = 0
+        for column in sorted(columns):
+            if line_text[column:column + len(old_name)] != old_name:
+                raise ValueError(f"Satır {first_line + idx}, Sütun {column}: '{old_name}' bulunamadı")
+            parts.append(line_text[previous:column])
+            parts.append(new_name)
+            previous = column + len(old_name)
+        parts.append(line_text[previous:])
+        lines[idx] = ''.join(parts)
+    return '\n'.join(lines)
@@ -0,0 +1,117 @@
+# parallel_lexer.py
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lexer import Lexer
+from tokens import Token, TokenType
+
+# Süreçler arasında Token nesneleri yerine (tip indeksi, değer, satır, sütun)
+# demetleri taşınır; bu, pickle maliyetini belirgin şekilde düşürür.
+_TOKEN_TYPES = list(TokenType)
+_TOKEN_TYPE_INDEX = {token_type: idx for idx, token_type in enumerate(_TOKEN_TYPES)}
+
+_worker_lexer = None
+
+
+def find_cut_points(lines):
+    """
+    Girintisi 0 olan kod satırlarının indekslerini döndürür. Lexer bu satırlarda
+    girinti yığınını her zaman [0]'a indirdiği için dosya buralardan bağımsız
+    parçalara bölünebilir. Boş ve yorum satırları girintiyi değiştirmediği için
+    kesim noktası olamaz.
+    """
+    return [idx for idx, line in enumerate(lines)
+            if line[0] not in ' \t#' and line.strip()]
+
+
+def split_chunks(lines, chunk_count, min_chunk_lines):
+    """Satırları yaklaşık eşit, en az min_chunk_lines uzunluğunda (başlangıç, bitiş) parçalarına böler."""
+    target = max(min_chunk_lines, len(lines) // max(chunk_count, 1))
+    chunks = []
+    chunk_start = 0
+    for idx in find_cut_points(lines):
+        if idx - chunk_start >= target:
+            chunks.append((chunk_start, idx))
+            chunk_start = idx
+    chunks.append((chunk_start, len(lines)))
+    return chunks
+
+
+def _lex_chunk(lines, first_line_num):
+    """Süreç havuzunda çalışır: bir parçayı [0] girinti yığınıyla tokenlar."""
+    global _worker_lexer
+    if _worker_lexer is None:
+        _worker_lexer = Lexer()
+
+    indent_stack = [0]
+    packed = []
+    for offset, line in enumerate(lines):
+        for token in _worker_lexer.tokenize_line(line, first_line_num + offset, indent_stack):
+            packed.append((_TOKEN_TYPE_INDEX[token.type], token.value, token.line, token.column))
+    return packed, indent_stack
+
+
+def tokenize_parallel(code, workers=None, min_chunk_lines=2000, executor=None):
+    """
+    Lexer.tokenize ile birebir aynı token listesini, büyük dosyayı girintisi 0
+    olan satırlardan bölüp parçaları bir süreç havuzunda tokenlayarak üretir.
+    Küçük dosyalarda veya tek parça çıktığında sıradan tokenize kullanılır.
+    Tekrarlanan çağrılarda süreç başlatma maliyeti olmasın diye hazır bir
+    executor verilebilir.
+    """
+    lexer = Lexer()
+    lines = lexer.split_lines(code)
+    workers = workers or os.cpu_count() or 1
+
+    chunks = split_chunks(lines, workers * 4, min_chunk_lines)
+    if workers == 1 or len(chunks) == 1:
+        return lexer.tokenize(code)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_lex_chunk, lines[start:end], start + 1) for start, end in chunks]
+
+        tokens = []
+        indent_stack = [0]
+        # Sonuçlar sırayla alınır; böylece ilk hatalı parçanın RuntimeError'ı, sıralı lexer'daki gibi yükselir
+        for (start, end), future in zip(chunks, futures):
+            packed, chunk_stack = future.result()
+
+            # Önceki parçada açık kalan bloklar, bu parçanın ilk satırında kapanır
+            for level in reversed(indent_stack[1:]):
+                tokens.append(Token(TokenType.DEDENT, '', start + 1, level))
+
+            tokens.extend(Token(_TOKEN_TYPES[type_idx], value, line, column)
+                          for type_idx, value, line, column in packed)
+            indent_stack = chunk_stack
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    tokens.extend(lexer.finish_tokens(indent_stack, len(lines) + 1))
+    return tokens
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Kullanım: python parallel_lexer.py <dosya> [işçi sayısı]")
+        sys.exit(1)
+
+    with open(sys.argv[1], encoding='utf-8') as f:
+        source = f.read()
+    worker_count = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    started = time.perf_counter()
+    sequential_tokens = Lexer().tokenize(source)
+    sequential_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parallel_tokens = tokenize_parallel(source, workers=worker_count)
+    parallel_time = time.perf_counter() - started
+
+    print(f"Sıralı:   {len(sequential_tokens)} token, {sequential_time:.3f} sn")
+    print(f"Paralel:  {len(parallel_tokens)} token, {parallel_time:.3f} sn")
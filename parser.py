@@ -1,13 +1,25 @@
 # parser.py
+from operator import attrgetter
 from tokens import TokenType, Token
 from syntax_tree import *
+from diagnostics import SEVERITY_ERROR, CODE_PARSER
+
+_token_type = attrgetter('type')
 
 class ParserError(Exception):
-    pass
+    def __init__(self, message, line=None, column=None):
+        super().__init__(message)
+        self.line = line  # Hatanın bulunduğu token'ın konumu (biliniyorsa)
+        self.column = column
 
 class Parser:
-    def __init__(self, tokens):
+    def __init__(self, tokens, diagnostics=None, lazy=False):
         self.tokens = tokens
+        self.diagnostics = diagnostics  # Hatalar print() yerine buraya bildirilir (DiagnosticCollector)
+        # lazy=True iken fonksiyon gövdeleri atlanır ve ilk erişimde ayrıştırılır
+        self.lazy = lazy
+        self.lazy_functions = []  # Gövdesi tembel ayrıştırılan FunctionDefNode'lar (kaynak sırasıyla)
+        self._block_ends = None  # INDENT indeksi -> eşleşen DEDENT indeksi (ilk atlamada hesaplanır)
         self.current = 0
         self.lookahead = None  # Sonraki anlamlı tokenı tutacak
         self._prime_lookahead()  # lookahead'i başlat
@@ -28,6 +40,18 @@ class Parser:
             self.lookahead = Token(TokenType.EOF, '', -1, -1)
 
     def parse(self):
+        steps = self.parse_steps()
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+    def parse_steps(self):
+        """
+        parse'ın dilimlenebilir hali: her üst seviye deyimden sonra (tüketilen
+        token, toplam token) ilerlemesi üretir ve sonunda ProgramNode döndürür.
+        """
         statements = []
         while self.peek().type != TokenType.EOF:
             self.skip_whitespace_and_comments()
@@ -37,15 +61,24 @@ class Parser:
 
             # Hata toparlama için bir checkpoint oluştur
             start_index = self.current
+            start_token = self.peek()
             try:
                 stmt = self.parse_statement()
                 if stmt:
+                    # Üst seviye deyimlerin satır aralığı (sembol indeksi bunu kullanır)
+                    stmt.line = start_token.line
+                    stmt.end_line = self._last_consumed_line()
                     statements.append(stmt)
                 self.skip_newlines()  # Her statement'tan sonra NEWLINE'ları atla
+                yield self.current, len(self.tokens)
             except ParserError as e:
                 # Hata durumunda parser'ın akışını iyileştirmek için
-                # Geçerli token'ı logla ve bir sonraki güvenli noktaya atla.
-                print(f"Parser Hatası: {e} - Hata Anındaki Token: {self.peek()}")
+                # Hatayı tanı listesine bildir ve bir sonraki güvenli noktaya atla.
+                if self.diagnostics is not None:
+                    error_token = self.peek()
+                    self.diagnostics.report(SEVERITY_ERROR, CODE_PARSER, str(e),
+                                            e.line if e.line is not None else error_token.line,
+                                            e.column if e.column is not None else error_token.column)
 
                 # Mevcut satırın sonuna atla
                 while self.peek().type not in [TokenType.NEWLINE, TokenType.EOF]:
@@ -61,6 +94,19 @@ class Parser:
 
         return ProgramNode(statements)
 
+    def _last_consumed_line(self):
+        """Son tüketilen tokenın satırı; DEDENT'ler sonraki satırda durduğu için atlanır."""
+        idx = self.current - 1
+        while idx >= 0 and self.tokens[idx].type in (TokenType.DEDENT, TokenType.INDENT):
+            idx -= 1
+        return self.tokens[idx].line if idx >= 0 else None
+
+    def _at(self, node, token):
+        """Düğüme tokenın konumunu ekler (isim içeren düğümler için)."""
+        node.line = token.line
+        node.column = token.column
+        return node
+
     def skip_whitespace_and_comments(self):
         while True:
             if self.match(TokenType.NEWLINE):
@@ -130,7 +176,7 @@ class Parser:
         # consume metoduna ikinci parametre olarak beklenen değeri GİRMEYİN.
         # Bu, consume metodunun TokenType.IDENTIFIER türünde herhangi bir IDENTIFIER'ı kabul etmesini sağlar.
         identifier_token = self.consume(TokenType.IDENTIFIER)  # <-- Sadece TokenType.IDENTIFIER gönderin!
-        variable_node = VariableNode(identifier_token.value)
+        variable_node = self._at(VariableNode(identifier_token.value), identifier_token)
 
         self.consume(TokenType.ASSIGN,
                      "=")  # Burada '=' değeri göndermek mantıklı, çünkü ASSIGN tokenının değeri genelde hep '='dır.
@@ -204,20 +250,24 @@ class Parser:
                 args = self.parse_arguments()
                 self.consume(TokenType.RPAREN, ')')
                 if name_token.type == TokenType.KEYWORD_PRINT:
-                    return CallNode("print", args)
-                return CallNode(name_token.value, args)
+                    return self._at(CallNode("print", args), name_token)
+                return self._at(CallNode(name_token.value, args), name_token)
 
-            return VariableNode(name_token.value)
+            return self._at(VariableNode(name_token.value), name_token)
 
         if self.match(TokenType.LPAREN):
             expr = self.parse_expression()
             self.consume(TokenType.RPAREN, ')')
             return expr
 
+        raise self.expected_expression_error()
+
+    def expected_expression_error(self):
         current_token = self.peek()
-        raise ParserError(f"Beklenen bir ifade (sayı, string, değişken, parantezli ifade vb.) bulunamadı. "
-                          f"Ancak '{current_token.value}' ({current_token.type.name}) bulundu. "
-                          f"(Satır {current_token.line}, Sütun {current_token.column})")
+        return ParserError(f"Beklenen bir ifade (sayı, string, değişken, parantezli ifade vb.) bulunamadı. "
+                           f"Ancak '{current_token.value}' ({current_token.type.name}) bulundu. "
+                           f"(Satır {current_token.line}, Sütun {current_token.column})",
+                           current_token.line, current_token.column)
 
     def parse_arguments(self):
         args = []
@@ -253,15 +303,64 @@ class Parser:
 
         return statements
 
+    def parse_indented_block(self):
+        """INDENT ... DEDENT ile çevrili bir bloğu ayrıştırır (if, elif, else, while, def gövdeleri)."""
+        self.skip_newlines()  # Başlık ile gövde arasındaki yorum satırları
+        self.consume(TokenType.INDENT)
+        body = self.parse_block()
+        self.consume(TokenType.DEDENT)
+        return body
+
+    def skip_indented_block(self):
+        """
+        Bloğu ayrıştırmadan atlar: INDENT'e karşılık gelen DEDENT dengeli bir
+        taramayla bulunur. Gövdenin (ilk, son) ham token indeks aralığını döndürür.
+        """
+        self.skip_newlines()
+        if not self.check(TokenType.INDENT):
+            self.consume(TokenType.INDENT)  # Anlamlı hata mesajı için
+        indent_index = self.current
+
+        if self._block_ends is None:
+            self._block_ends = self._match_blocks()
+        end_index = self._block_ends.get(indent_index, len(self.tokens))
+        self.current = end_index
+        self._prime_lookahead()
+        self.consume(TokenType.DEDENT)
+        return indent_index + 1, end_index
+
+    def _match_blocks(self):
+        """Tüm INDENT indekslerini eşleşen DEDENT indekslerine bağlar (tek geçiş)."""
+        indent, dedent = TokenType.INDENT, TokenType.DEDENT
+        structural = [(idx, token_type) for idx, token_type in enumerate(map(_token_type, self.tokens))
+                      if token_type is indent or token_type is dedent]
+        block_ends = {}
+        open_blocks = []
+        for idx, token_type in structural:
+            if token_type is indent:
+                open_blocks.append(idx)
+            elif open_blocks:
+                block_ends[open_blocks.pop()] = idx
+        return block_ends
+
+    def _parse_lazy_body(self, node):
+        """Tembel bir fonksiyon gövdesini ayrıştırır; hatalar o anda tanı olarak bildirilir."""
+        start, end = node.body_range
+        body_parser = self.__class__(self.tokens[start:end], self.diagnostics)  # Alt sınıflar da kendi motorunu kullanır
+        try:
+            return body_parser.parse_block()
+        except ParserError as e:
+            if self.diagnostics is not None:
+                self.diagnostics.report(SEVERITY_ERROR, CODE_PARSER, str(e), e.line, e.column)
+            raise
+
     def parse_if_statement(self):
         self.consume(TokenType.KEYWORD_IF)  # 'if' tüket
         condition = self.parse_expression()
         self.consume(TokenType.COLON)  # ':' tüket
         self.consume(TokenType.NEWLINE)  # '\n' tüket
 
-        self.consume(TokenType.INDENT)  # <-- BURADA INDENT tüket
-        body = self.parse_block()  # Bloğu parse et
-        self.consume(TokenType.DEDENT)  # <-- BURADA DEDENT tüket
+        body = self.parse_indented_block()
 
         elif_clauses = []
         while self.check(TokenType.KEYWORD_ELIF):  # 'elif' tokenını kontrol et
@@ -270,9 +369,7 @@ class Parser:
             self.consume(TokenType.COLON)  # ':' tüket
             self.consume(TokenType.NEWLINE)  # '\n' tüket
 
-            self.consume(TokenType.INDENT)  # <-- HER ELIF BLOĞU İÇİN INDENT tüket
-            elif_body = self.parse_block()
-            self.consume(TokenType.DEDENT)  # <-- HER ELIF BLOĞU İÇİN DEDENT tüket
+            elif_body = self.parse_indented_block()
             elif_clauses.append((elif_condition, elif_body))  # Veya IfNode'daki yapınıza göre ekleyin
 
         else_body = None
@@ -281,9 +378,7 @@ class Parser:
             self.consume(TokenType.COLON)  # ':' tüket
             self.consume(TokenType.NEWLINE)  # '\n' tüket
 
-            self.consume(TokenType.INDENT)  # <-- ELSE BLOĞU İÇİN INDENT tüket
-            else_body = self.parse_block()
-            self.consume(TokenType.DEDENT)  # <-- ELSE BLOĞU İÇİN DEDENT tüket
+            else_body = self.parse_indented_block()
 
         return IfNode(condition, body, elif_clauses, else_body)  # IfNode'unuza elif_clauses'ı da geçirin
 
@@ -292,7 +387,7 @@ class Parser:
         condition = self.parse_expression()
         self.consume(TokenType.COLON, ':')
         self.consume(TokenType.NEWLINE)
-        body = self.parse_block()
+        body = self.parse_indented_block()
         return WhileNode(condition, body)
 
     def parse_or_expression(self):
@@ -323,21 +418,49 @@ class Parser:
         self.consume_keyword(TokenType.KEYWORD_DEF)
         name = self.consume(TokenType.IDENTIFIER, None)
         self.consume(TokenType.LPAREN, '(')
-        params = self.parse_parameters()
+        param_tokens = self.parse_parameter_tokens()
         self.consume(TokenType.RPAREN, ')')
         self.consume(TokenType.COLON, ':')
         self.consume(TokenType.NEWLINE)
-        body = self.parse_block()
-        return FunctionDefNode(name.value, params, body)
+        params = [token.value for token in param_tokens]
+        if self.lazy:
+            node = FunctionDefNode(name.value, params, None, body_range=self.skip_indented_block(),
+                                   body_loader=self._parse_lazy_body)
+            self.lazy_functions.append(node)
+        else:
+            body = self.parse_indented_block()
+            node = FunctionDefNode(name.value, params, body)
+        # line/column fonksiyon adının konumudur
+        node.param_positions = [(token.line, token.column) for token in param_tokens]
+        return self._at(node, name)
 
     def parse_parameters(self):
+        return [token.value for token in self.parse_parameter_tokens()]
+
+    def parse_parameter_tokens(self):
         params = []
         if not self.check(TokenType.RPAREN):
-            params.append(self.consume(TokenType.IDENTIFIER, None).value)
+            params.append(self.consume(TokenType.IDENTIFIER, None))
             while self.match(TokenType.COMMA):
-                params.append(self.consume(TokenType.IDENTIFIER, None).value)
+                params.append(self.consume(TokenType.IDENTIFIER, None))
         return params
 
+    def parse_import_statement(self):
+        self.consume(TokenType.KEYWORD_IMPORT)
+        return ImportNode(self.parse_name_list())
+
+    def parse_from_import_statement(self):
+        self.consume(TokenType.KEYWORD_FROM)
+        module = self.consume(TokenType.IDENTIFIER)
+        self.consume(TokenType.KEYWORD_IMPORT)
+        return ImportNode(self.parse_name_list(), module.value)
+
+    def parse_name_list(self):
+        names = [self.consume(TokenType.IDENTIFIER).value]
+        while self.match(TokenType.COMMA):
+            names.append(self.consume(TokenType.IDENTIFIER).value)
+        return names
+
     def parse_return_statement(self):
         self.consume_keyword(TokenType.KEYWORD_RETURN)
         # Return ifadesi opsiyoneldir, ancak hemen NEWLINE gelirse ifade yoktur
@@ -365,17 +488,22 @@ class Parser:
                 message is None or token.value == message):  # message'ı expected_value olarak kullanın
             self.advance()
             return token
+        raise self.expected_token_error(message if message else type_.name)
 
-        raise ParserError(f"Beklenen '{message if message else type_.name}' bulunamadı. "
-                          f"Ancak '{token.value}' ({token.type.name}) bulundu. "
-                          f"(Satır {token.line}, Sütun {token.column})")
+    def expected_token_error(self, expected):
+        token = self.peek()
+        return ParserError(f"Beklenen '{expected}' bulunamadı. "
+                           f"Ancak '{token.value}' ({token.type.name}) bulundu. "
+                           f"(Satır {token.line}, Sütun {token.column})",
+                           token.line, token.column)
 
     def consume_keyword(self, keyword_type):
         if self.check_keyword(keyword_type):
             return self.advance()
         actual = self.peek()
         raise ParserError(
-            f"Beklenen anahtar kelime {keyword_type.name} ancak bulundu: {actual.type.name} ('{actual.value}') (Satır {actual.line}, Sütun {actual.column})")
+            f"Beklenen anahtar kelime {keyword_type.name} ancak bulundu: {actual.type.name} ('{actual.value}') (Satır {actual.line}, Sütun {actual.column})",
+            actual.line, actual.column)
 
     def check(self, type_, value_to_check=None):
         token = self.peek()
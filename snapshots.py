@@ -0,0 +1,257 @@
+# snapshots.py
+import sys
+from collections import OrderedDict
+from weakref import WeakValueDictionary
+
+from syntax_tree import ASTNode, ProgramNode
+
+# Bellek tahmini için yaklaşık boyutlar (bayt); kesin değil, bütçe karşılaştırması için yeterli
+_LINE_ENTRY_OVERHEAD = 120  # Nesne + önbellek anahtarı + girinti durumu
+_TOKEN_SIZE = 100  # Düz demetteki üç alan ve değer stringi
+_NODE_SIZE = 200  # AST düğümü ve __dict__'i
+_SNAPSHOT_OVERHEAD = 200
+_POINTER_SIZE = 8
+# record_steps'in bir iş biriminde kaydettiği satır sayısı
+RECORD_STEP_LINES = 512
+
+
+class LineEntry:
+    """
+    Tek bir satırın tokenları; satır metni ve başındaki girinti durumuyla
+    anahtarlanır. Satır numarası içermediği için satırı aynı kalan bütün
+    sürümler aynı kaydı paylaşır. IncrementalLexer'ın line_cache'i olarak da
+    kullanılır: tokens token başına (tip, değer, sütun) alanlarını art arda
+    tutan düz bir demettir (token başına ayrı demet çöp toplayıcıyı
+    yavaşlatır), end_state satır sonrası girinti yığınıdır.
+    """
+
+    __slots__ = ('text', 'state', 'tokens', 'end_state', 'size', 'history', '__weakref__')
+
+    def __init__(self, history, text, state, tokens, end_state):
+        self.text = text
+        self.state = state
+        fields = []
+        for token in tokens:
+            fields += (token.type, token.value, token.column)
+        self.tokens = tuple(fields)
+        self.end_state = end_state
+        self.size = sys.getsizeof(text) + _LINE_ENTRY_OVERHEAD + _TOKEN_SIZE * len(tokens)
+        self.history = history
+        history.shared_bytes += self.size
+
+    def __del__(self):
+        # Kayda hiçbir anlık görüntü başvurmadığında bellek hesabından düşülür
+        self.history.shared_bytes -= self.size
+
+
+class StatementEntry:
+    """Bir üst seviye deyimin AST'si; aynı konumda değişmeden kalan deyim sürümler arasında paylaşılır."""
+
+    __slots__ = ('node', 'line', 'end_line', 'size', 'history', '__weakref__')
+
+    def __init__(self, history, node):
+        self.node = node
+        self.line = node.line
+        self.end_line = node.end_line
+        self.size = _NODE_SIZE * _node_count(node)
+        self.history = history
+        history.shared_bytes += self.size
+
+    def __del__(self):
+        self.history.shared_bytes -= self.size
+
+
+class Snapshot:
+    """Bir metin sürümünün analiz sonucu: satır kayıtları ve (tam analizde) üst seviye deyimler."""
+
+    __slots__ = ('key', 'length', 'lines', 'statements', 'size')
+
+    def __init__(self, key, length, lines, statements):
+        self.key = key
+        self.length = length
+        self.lines = lines  # [LineEntry]
+        self.statements = statements  # [StatementEntry] veya None (AST saklanmadı)
+        self.size = _SNAPSHOT_OVERHEAD + _POINTER_SIZE * (len(lines) + len(statements or ()))
+
+    def matches(self, code):
+        return self.length == len(code) and ''.join([entry.text for entry in self.lines]) == code
+
+    def program(self):
+        return ProgramNode([entry.node for entry in self.statements])
+
+
+class SnapshotHistory:
+    """
+    Geri al/yinele için sınırlı sayıda analiz anlık görüntüsü.
+
+    Her tamamlanan analizden sonra metnin sürümü kaydedilir. Geri alma bir
+    önceki sürümün metnini geri getirdiğinde find() o sürümü döndürür: satır
+    tokenları line_cache üzerinden hazır alınır (lexer çalışmaz), AST de
+    saklanmışsa parser çalışmaz.
+
+    Sürümler arasında ortak olan satır kayıtları ve deyimler bir kez saklanır.
+    Bellek tahmini max_bytes'ı veya sürüm sayısı max_versions'ı aşınca en uzun
+    süredir kullanılmayan sürümler atılır; hiçbir sürümün başvurmadığı satır
+    kayıtları da kendiliğinden serbest kalır.
+
+    line_cache verilirse birden çok geçmiş (ör. sekmeler) aynı satır önbelleğini
+    paylaşır: bir belgede taranmış satır diğerinde yeniden taranmaz. Paylaşılan
+    kayıt, onu oluşturan geçmişin bellek hesabına yazılır.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_versions=200, line_cache=None):
+        self.max_bytes = max_bytes
+        self.max_versions = max_versions
+        self.snapshots = OrderedDict()  # anahtar -> Snapshot (en son kullanılan sonda)
+        # (satır metni, girinti durumu) -> LineEntry
+        self.line_cache = line_cache if line_cache is not None else WeakValueDictionary()
+        self.shared_bytes = 0  # Yaşayan LineEntry ve StatementEntry'lerin toplam tahmini boyutu
+        self.current = None  # Lexer'ın son kaydedilen hali
+        self.revision = 0  # current + pending_change'in yansıttığı lexer revizyonu
+        self.pending_change = None  # current'tan bu yana birleştirilmiş satır değişikliği
+
+    @property
+    def total_bytes(self):
+        return self.shared_bytes + sum(snapshot.size for snapshot in self.snapshots.values())
+
+    def clear(self):
+        self.snapshots.clear()
+        self.current = None
+        self.pending_change = None
+
+    def find(self, code):
+        """code'un kayıtlı sürümü; yoksa None."""
+        snapshot = self.snapshots.get(hash(code))
+        if snapshot is None or not snapshot.matches(code):
+            return None
+        return snapshot
+
+    def note_change(self, change, revision):
+        """
+        IncrementalLexer.update'in döndürdüğü değişikliği kaydeder. Aradaki bir
+        revizyon kaçırıldıysa zincir kopar ve bir sonraki kayıt tam kurulur.
+        """
+        if change is None:
+            return
+        if self.current is None or revision != self.revision + 1:
+            self.current = None
+            self.pending_change = None
+        elif self.pending_change is None:
+            self.pending_change = change
+        else:
+            self.pending_change = _compose(self.pending_change, change)
+        self.revision = revision
+
+    def record(self, code, lexer, statements=None):
+        """
+        Lexer'ın şu anki halini code'un sürümü olarak kaydeder. statements
+        verilirse (tüm tembel gövdeleri ayrıştırılmış üst seviye deyimler) AST
+        de saklanır.
+        """
+        steps = self.record_steps(code, lexer, statements)
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+    def record_steps(self, code, lexer, statements=None, step_lines=RECORD_STEP_LINES):
+        """
+        record'un dilimlenebilir hali: her step_lines satır kaydından sonra
+        (yapılan, toplam) üretir. Sürüm yalnızca sonunda eklenir; iş yarıda
+        kesilirse geçmiş değişmez.
+        """
+        key = hash(code)
+        snapshot = self.snapshots.get(key)
+        if snapshot is not None and snapshot.matches(code):
+            self.snapshots.move_to_end(key)
+            if snapshot.statements is None and statements is not None:
+                snapshot.statements = self._statement_entries(statements, None, None)
+                snapshot.size += _POINTER_SIZE * len(snapshot.statements)
+        else:
+            base = self.current if lexer.revision == self.revision else None
+            if base is not None and self.pending_change is not None:
+                start, old_end, new_end = self.pending_change
+                lines = yield from self._line_entries_steps(lexer, start, new_end, step_lines)
+                lines = base.lines[:start] + lines + base.lines[old_end:]
+                change = self.pending_change
+            elif base is not None:
+                lines = base.lines
+                change = (0, 0, 0)
+            else:
+                lines = yield from self._line_entries_steps(lexer, 0, len(lexer.lines), step_lines)
+                change = None
+            if statements is not None:
+                statements = self._statement_entries(statements, base, change)
+            snapshot = Snapshot(key, len(code), lines, statements)
+            self.snapshots[key] = snapshot
+
+        self.current = snapshot
+        self.revision = lexer.revision
+        self.pending_change = None
+        self._enforce_budget()
+        return snapshot
+
+    def _line_entries_steps(self, lexer, start, end, step_lines):
+        """[start, end) satırlarının kayıtları; ortak satırlar line_cache'ten alınır."""
+        entries = []
+        line_cache = self.line_cache
+        last = len(lexer.lines) - 1
+        for first in range(start, end, step_lines):
+            for idx in range(first, min(first + step_lines, end)):
+                text, state = lexer.lines[idx], lexer.line_states[idx]
+                entry = line_cache.get((text, state))
+                if entry is None:
+                    end_state = lexer.line_states[idx + 1] if idx < last else lexer.final_state
+                    entry = LineEntry(self, text, state, lexer.line_tokens[idx], end_state)
+                    line_cache[(text, state)] = entry
+                entries.append(entry)
+            yield len(entries), end - start
+        return entries
+
+    def _statement_entries(self, statements, base, change):
+        """
+        Deyim kayıtlarını kurar. Değişiklikten önceki (ve satır sayısı değişmediyse
+        sonraki) deyimler aynı konumda aynı tokenlardan oluştuğu için önceki
+        sürümün kaydı yeniden kullanılır.
+        """
+        reusable = {}
+        if base is not None and base.statements is not None and change is not None:
+            start, old_end, new_end = change
+            for entry in base.statements:
+                if entry.end_line <= start or (old_end == new_end and entry.line > new_end):
+                    reusable[(entry.line, entry.end_line)] = entry
+        entries = []
+        for stmt in statements:
+            entry = reusable.get((stmt.line, stmt.end_line))
+            entries.append(entry if entry is not None else StatementEntry(self, stmt))
+        return entries
+
+    def _enforce_budget(self):
+        while len(self.snapshots) > 1 and (len(self.snapshots) > self.max_versions or
+                                           self.total_bytes > self.max_bytes):
+            key, snapshot = next(iter(self.snapshots.items()))
+            if snapshot is self.current:
+                self.snapshots.move_to_end(key)
+                continue
+            del self.snapshots[key]
+
+
+def _compose(first, second):
+    """
+    Art arda iki satır değişikliğini (başlangıç, eski_bitiş, yeni_bitiş) tek
+    değişiklik olarak birleştirir: ilk sürümden üçüncü sürüme değişen aralık.
+    """
+    start1, old_end1, new_end1 = first
+    start2, old_end2, new_end2 = second
+    start = min(start1, start2)
+    end = max(new_end1, old_end2)  # Ara sürümde değişen bölgelerin birleşimi
+    return start, end - new_end1 + old_end1, end - old_end2 + new_end2
+
+
+def _node_count(value):
+    if isinstance(value, ASTNode):
+        return 1 + sum(_node_count(item) for item in vars(value).values())
+    if isinstance(value, (list, tuple)):
+        return sum(_node_count(item) for item in value)
+    return 0
@@ -0,0 +1,243 @@
+# structure.py
+from tokens import TokenType
+
+
+class Block:
+    """INDENT ile açılıp DEDENT ile kapanan bir kod bloğu."""
+
+    def __init__(self, header_line, start_line, parent=None):
+        self.header_line = header_line  # Bloğu açan satır (if/while/def ...)
+        self.start_line = start_line  # INDENT token'ının bulunduğu satır
+        self.end_line = start_line  # Bloğun son kod satırı
+        self.parent = parent
+
+    def __repr__(self):
+        return f"Block(Header:{self.header_line}, Start:{self.start_line}, End:{self.end_line})"
+
+
+class StructureIndex:
+    """
+    Parantez eşleri ve girinti blokları için satır bazlı indeks.
+
+    Her satır için ayrı bir sözlük/liste tutulur; böylece eşleşen parantez ve
+    imlecin bulunduğu blok O(1) ile bulunur. Bir düzenlemeden sonra değişen
+    ilk satırdan itibaren yeniden kurulur; o satırın başındaki yığın durumu
+    saklandığı için önceki satırlara dokunulmaz. Değişen aralıktan sonra durum
+    eski taramayla aynı olunca durulur, kalan satırların kayıtları kaydırılarak
+    yeniden kullanılır. Parantez eşleri ve satır durumları satır numarasına
+    göreli tutulur; kayan satırlarda yalnızca Block satırları güncellenir.
+    """
+
+    def __init__(self):
+        self.line_pairs = []  # satır -> {sütun: (eşin satır farkı, eş sütun) veya None}
+        self.line_blocks = []  # satır -> satırı içeren en içteki Block (veya None)
+        self.line_opens = []  # satır -> bu satırda INDENT ile açılan Block (veya None)
+        self.line_has_code = []  # satır -> satırda token var mı
+        # satır başındaki (parantez yığını, blok yığını, son kod satırı); parantez satırları
+        # ve son kod satırı durumun ait olduğu satırdan geriye doğru uzaklık olarak saklanır
+        self.line_states = []
+        self.end_state = ((), (), 1)  # son satırdan sonraki durum (aynı göreli biçimde)
+
+    def rebuild_from(self, start, line_tokens, old_end=None, new_end=None):
+        """line_tokens listesindeki start (0 tabanlı) satırından itibaren indeksi yeniden kurar."""
+        for _ in self.rebuild_steps(start, line_tokens, old_end=old_end, new_end=new_end):
+            pass
+
+    def rebuild_steps(self, start, line_tokens, step_lines=256, old_end=None, new_end=None):
+        """
+        rebuild_from'un dilimlenebilir hali; her step_lines satırda bir (kurulan,
+        toplam) ilerlemesi üretir. Yarıda bırakılırsa indeks kurulan son satıra
+        kadar geçerlidir ve end_state o satırın sonrasını tutar; bir sonraki
+        rebuild_from kaldığı yerden (veya daha önceki bir satırdan) devam eder.
+
+        old_end ve new_end, IncrementalLexer'ın döndürdüğü aralıktır: eski
+        [start, old_end) satırları yeni [start, new_end) satırlarıyla değişmiş,
+        sonrakiler aynı kalmıştır. Verilirse new_end'den sonraki ilk satırda
+        parantez yığını boş, blok yığını ve son kod satırı eskisiyle aynıysa
+        tarama orada biter.
+        """
+        old_count = len(self.line_states)
+        delta = new_end - old_end if old_end is not None else 0
+        # Eski kayıtlar yalnızca indeks tamsa (önceki kurulum yarıda kalmadıysa) yeniden kullanılır
+        reusable = old_end is not None and start <= old_count == len(line_tokens) - delta
+        start = min(start, old_count)
+        state = self.line_states[start] if start < old_count else self.end_state
+        paren_stack, block_stack, last_code_line = _absolute(state, start + 1)
+
+        # Yeniden kullanılabilirse yeni kayıtlar ayrı listelere yazılır ve eski kayıtlar yerinde
+        # kalır; durulunca yalnızca değişen aralık yerine konur. İlk ilerleme bildiriminden önce
+        # (yarıda bırakılabilecek noktada) eski sonek kopyalanır ve indeks kurulan satıra kadar
+        # kısaltılır; kayıtlar bundan sonra doğrudan indekse eklenir.
+        indexes = (self.line_pairs, self.line_blocks, self.line_opens, self.line_has_code, self.line_states)
+        committed = not reusable
+        if reusable:
+            old = indexes
+            old_base = 0  # Yeni idx. satıra karşılık gelen eski kayıt old[...][idx - delta - old_base]
+            old_end_state = self.end_state
+            # Yeniden taramada üzerine yazılacak eski bitiş satırları (durulunca kaydırılıp geri yüklenir)
+            old_block_ends = {block: block.end_line for block in block_stack}
+            records = ([], [], [], [], [])
+            base = start
+        else:
+            for index in indexes:
+                del index[start:]
+            records = indexes
+            base = 0
+
+        # Hâlâ açık olan parantezlerin eşleri değişen bölgede; eşleşene kadar eşsiz say
+        for line, column in paren_stack:
+            self.line_pairs[line - 1][column] = None
+        for block in block_stack:
+            block.end_line = last_code_line
+
+        line_pairs, line_blocks, line_opens, line_has_code, line_states = records
+        for idx in range(start, len(line_tokens)):
+            line_num = idx + 1
+            if reusable and idx >= new_end and not paren_stack:
+                old_idx = idx - delta - old_base
+                old_parens, old_stack, old_last = old[4][old_idx]
+                old_last = idx - delta + 1 - old_last
+                if (not old_parens and old_stack == tuple(block_stack)
+                        and last_code_line == (old_last + delta if old_last > start else old_last)):
+                    self._reuse_suffix(start, idx, delta, records, committed, old, old_idx, old_end_state,
+                                       old_block_ends, block_stack)
+                    return
+
+            line_states.append(_relative(paren_stack, block_stack, last_code_line, line_num))
+            pairs = {}
+            line_pairs.append(pairs)
+            opened = None
+
+            for token in line_tokens[idx]:
+                token_type = token.type
+                if token_type == TokenType.LPAREN:
+                    paren_stack.append((line_num, token.column))
+                    pairs[token.column] = None
+                elif token_type == TokenType.RPAREN:
+                    if paren_stack:
+                        open_line, open_column = paren_stack.pop()
+                        if open_line == line_num:
+                            partner_pairs = pairs
+                        elif open_line > base:
+                            partner_pairs = line_pairs[open_line - 1 - base]
+                        else:
+                            partner_pairs = self.line_pairs[open_line - 1]
+                        partner_pairs[open_column] = (line_num - open_line, token.column)
+                        pairs[token.column] = (open_line - line_num, open_column)
+                    else:
+                        pairs[token.column] = None
+                elif token_type == TokenType.INDENT:
+                    opened = Block(last_code_line, line_num, block_stack[-1] if block_stack else None)
+                    block_stack.append(opened)
+                elif token_type == TokenType.DEDENT:
+                    if block_stack:
+                        block_stack.pop().end_line = last_code_line
+
+            if line_tokens[idx]:
+                last_code_line = line_num
+            for block in block_stack:
+                block.end_line = last_code_line
+
+            line_opens.append(opened)
+            line_blocks.append(block_stack[-1] if block_stack else None)
+            line_has_code.append(bool(line_tokens[idx]))
+
+            if (idx - start + 1) % step_lines == 0:
+                if not committed:
+                    old = tuple(index[old_end:] for index in indexes)
+                    old_base = old_end
+                    for index, new_records in zip(indexes, records):
+                        del index[start:]
+                        index.extend(new_records)
+                    records = indexes
+                    line_pairs, line_blocks, line_opens, line_has_code, line_states = records
+                    committed = True
+                    base = 0
+                self.end_state = _relative(paren_stack, block_stack, last_code_line, line_num + 1)
+                yield idx - start + 1, len(line_tokens) - start
+
+        if not committed:
+            for index, new_records in zip(indexes, records):
+                index[start:] = new_records
+        self.end_state = _relative(paren_stack, block_stack, last_code_line, len(line_tokens) + 1)
+
+    def _reuse_suffix(self, start, idx, delta, records, committed, old, old_idx, old_end_state, old_block_ends,
+                      block_stack):
+        """
+        Tarama yeni idx. satırda durulduğunda eski kayıtları (old listelerinde old_idx'ten
+        itibaren) yeniden kullanır ve satırlarını kaydırır. Kayıtlar indekse eklenmişse
+        (committed) eski sonek ardına eklenir, eklenmemişse yalnızca değişen aralık yerine konur.
+        """
+        def shift(line):
+            return line + delta if line > start else line
+
+        old_pairs, old_blocks, old_opens, old_has_code, old_states = old
+        if delta:
+            # Son kod satırı değişen aralıktan önceyse göreli uzaklığı kayma kadar değişir;
+            # bu yalnızca sonekteki ilk kod satırına kadar sürer
+            first_old_line = idx + 1 - delta  # old_states[old_idx]'in eski satır numarası
+            for offset in range(len(old_states) - old_idx):
+                parens, stack, last = old_states[old_idx + offset]
+                if first_old_line + offset - last > start:
+                    break
+                old_states[old_idx + offset] = (parens, stack, last + delta)
+            parens, stack, last = old_end_state
+            if first_old_line + len(old_states) - old_idx - last <= start:
+                old_end_state = (parens, stack, last + delta)
+            for block in old_opens[old_idx:]:
+                if block is not None:
+                    block.header_line = shift(block.header_line)
+                    block.start_line += delta
+                    block.end_line = shift(block.end_line)
+        for block in block_stack:
+            block.end_line = shift(old_block_ends[block])
+
+        indexes = (self.line_pairs, self.line_blocks, self.line_opens, self.line_has_code, self.line_states)
+        if committed:
+            for index, old_records in zip(indexes, old):
+                index.extend(old_records[old_idx:])
+        else:
+            for index, new_records in zip(indexes, records):
+                index[start:old_idx] = new_records
+        self.end_state = old_end_state
+
+    def partner(self, line, column):
+        """(line, column) konumundaki parantezin eşini döndürür; eşsizse veya parantez değilse None."""
+        if 0 < line <= len(self.line_pairs):
+            pair = self.line_pairs[line - 1].get(column)
+            if pair is not None:
+                return line + pair[0], pair[1]
+        return None
+
+    def is_bracket(self, line, column):
+        return 0 < line <= len(self.line_pairs) and column in self.line_pairs[line - 1]
+
+    def block_at(self, line):
+        """Verilen satırı içeren en içteki bloğu döndürür."""
+        if 0 < line <= len(self.line_blocks):
+            return self.line_blocks[line - 1]
+        return None
+
+    def block_for_header(self, line):
+        """Başlığı verilen satırda olan bloğu (örn. 'def f():' satırının gövdesi) döndürür."""
+        idx = line  # Bir sonraki satırın 0 tabanlı indeksi
+        while idx < len(self.line_opens):
+            block = self.line_opens[idx]
+            if block is not None:
+                return block if block.header_line == line else None
+            if self.line_has_code[idx]:
+                return None
+            idx += 1
+        return None
+
+
+def _relative(paren_stack, block_stack, last_code_line, line_num):
+    """line_num satırının başındaki durumu satır numarasından bağımsız (göreli) biçime çevirir."""
+    return (tuple((line_num - line, column) for line, column in paren_stack), tuple(block_stack),
+            line_num - last_code_line)
+
+
+def _absolute(state, line_num):
+    """_relative'in tersi: (parantez yığını, blok yığını, son kod satırı) listeleri/değeri."""
+    parens, blocks, last = state
+    return [(line_num - distance, column) for distance, column in parens], list(blocks), line_num - last
@@ -0,0 +1,441 @@
+# symbols.py
+from bisect import bisect_right
+
+from parser import ParserError
+from syntax_tree import (AssignmentNode, BinaryOpNode, CallNode, ExpressionStatementNode, FunctionDefNode,
+                         IfNode, ReturnNode, UnaryOpNode, VariableNode, WhileNode)
+
+# Tanım türleri
+KIND_FUNCTION = 'function'
+KIND_PARAMETER = 'parameter'
+KIND_VARIABLE = 'variable'
+
+# Referans türleri
+REF_CALL = 'call'
+REF_READ = 'read'
+
+# Anahat (outline) girdisi türleri (fonksiyonlar KIND_FUNCTION ile gösterilir)
+OUTLINE_IF = 'if'
+OUTLINE_WHILE = 'while'
+
+# Sembol indeksinde yer almayan yerleşik isimler
+_BUILTINS = frozenset({'print'})
+
+
+class Symbol:
+    """
+    Bir ismin kaynakta geçtiği tek bir yer (tanım veya referans). Satır, ait
+    olduğu üst seviye deyime göre göreli saklanır; böylece düzenlemeden sonra
+    kayan deyimlerin sembollerine dokunmadan yalnızca deyimin satırı güncellenir.
+    """
+
+    __slots__ = ('name', 'kind', 'record', 'line_offset', 'column', 'scope', 'is_definition')
+
+    def __init__(self, name, kind, record, line, column, scope, is_definition):
+        self.name = name
+        self.kind = kind
+        self.record = record
+        self.line_offset = line - record.line
+        self.column = column
+        self.scope = scope  # Tanımlandığı/çözümlendiği fonksiyon kapsamı; global ise None
+        self.is_definition = is_definition
+
+    @property
+    def line(self):
+        return self.record.line + self.line_offset
+
+    @property
+    def end_column(self):
+        return self.column + len(self.name)
+
+    def __repr__(self):
+        role = 'Tanım' if self.is_definition else 'Referans'
+        return f"Symbol({role}, {self.kind}, '{self.name}', Line:{self.line}, Col:{self.column})"
+
+
+class Scope:
+    """Bir fonksiyon gövdesinin kapsamı: parametreler, yerel tanımlar ve onlara yapılan referanslar."""
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+        self.definitions = {}  # isim -> [Symbol]
+        self.references = {}  # isim -> [Symbol]
+
+    def resolve(self, name):
+        """İsmin tanımlandığı en yakın fonksiyon kapsamı; global ise None."""
+        scope = self
+        while scope is not None:
+            if name in scope.definitions:
+                return scope
+            scope = scope.parent
+        return None
+
+
+class OutlineEntry:
+    """
+    Anahat panelindeki bir satır: fonksiyon (parametreleriyle) veya üst seviye
+    if/while bloğu. Satır, Symbol gibi deyim kaydına göre göreli saklanır.
+    """
+
+    __slots__ = ('kind', 'name', 'params', 'depth', 'record', 'line_offset')
+
+    def __init__(self, kind, name, params, depth, record, line):
+        self.kind = kind
+        self.name = name
+        self.params = params
+        self.depth = depth  # İç içe fonksiyonlarda girinti düzeyi
+        self.record = record
+        self.line_offset = line - record.line
+
+    @property
+    def line(self):
+        return self.record.line + self.line_offset
+
+    def __repr__(self):
+        return f"OutlineEntry({self.kind}, '{self.name}', Line:{self.line})"
+
+
+class StatementRecord:
+    """Tek bir üst seviye deyimin sembolleri, anahat girdileri ve satır aralığı."""
+
+    __slots__ = ('line', 'end_line', 'symbols', 'global_definitions', 'global_references', 'outline', 'scopes')
+
+    def __init__(self, line, end_line):
+        self.line = line
+        self.end_line = end_line
+        self.symbols = []  # Konum sırasıyla bu deyimdeki tüm semboller
+        self.global_definitions = []
+        self.global_references = []
+        self.outline = []  # Konum sırasıyla OutlineEntry'ler
+        # Dıştakiler önce olmak üzere [Scope, ilk satır, son satır]; satırlar kayda göre görelidir
+        self.scopes = []
+
+
+class SymbolIndex:
+    """
+    AST'den kurulan kapsamlı sembol ve çapraz referans indeksi.
+
+    İsim -> tanımlar ve isim -> referanslar sözlüklerde tutulur (O(1) arama).
+    Her üst seviye deyimin sembolleri ayrı bir kayıtta saklanır; update()
+    yalnızca değişen satırlara dokunan deyimleri yeniden dolaşır, diğer
+    kayıtların yalnızca satırı kaydırılır.
+    """
+
+    def __init__(self):
+        self.records = []  # Satır sırasıyla StatementRecord'lar
+        self._record_lines = []  # bisect için kayıtların ilk satırları
+        self._definitions = {}  # isim -> {Symbol: None} (global tanımlar, ekleme sıralı küme)
+        self._references = {}  # isim -> {Symbol: None} (global isme çözümlenen referanslar)
+        self.valid = False  # False ise bir sonraki update tamamen yeniden kurar
+        self.reindexed = 0  # Son update'te yeniden dolaşılan deyim sayısı
+        self.version = 0  # Her rebuild/update'te artar
+        # Son rebuild/update'te değişen kayıt aralığı: eski records[start:old_stop]
+        # yerine yeni records[start:new_stop] geldi, diğer kayıtlar aynı nesneler
+        self.record_change = (0, 0, 0)
+
+    def invalidate(self):
+        """Değişiklikler izlenemediğinde (ör. ayrıştırma başarısız) bir sonraki update'i tam kuruluma zorlar."""
+        self.valid = False
+
+    def rebuild(self, program):
+        old_count = len(self.records)
+        self.records = []
+        self._definitions = {}
+        self._references = {}
+        self.reindexed = 0
+        for stmt in program.statements:
+            self.records.append(self._index_statement(stmt))
+        self._record_lines = [record.line for record in self.records]
+        self.valid = True
+        self.version += 1
+        self.record_change = (0, old_count, len(self.records))
+
+    def update(self, program, change):
+        """
+        Yeni AST'ye göre indeksi günceller. change, IncrementalLexer.update'in
+        döndürdüğü (başlangıç, eski_bitiş, yeni_bitiş) 0 tabanlı satır aralığıdır.
+        """
+        if not self.valid or not self.records:
+            self.rebuild(program)
+            return
+        if change is None:
+            self.version += 1
+            self.record_change = (0, 0, 0)
+            return
+
+        start, old_end, new_end = change
+        delta = new_end - old_end
+        # 1 tabanlı: eski [start + 1, old_end] satırları yeni [start + 1, new_end] oldu
+        reusable = {}
+        for record in self.records:
+            if record.end_line <= start:
+                reusable[(record.line, record.end_line)] = record
+            elif record.line > old_end:
+                reusable[(record.line + delta, record.end_line + delta)] = record
+            else:
+                self._drop(record)
+
+        records = []
+        self.reindexed = 0
+        for stmt in program.statements:
+            record = reusable.pop((stmt.line, stmt.end_line), None)
+            if record is not None and (stmt.end_line <= start or stmt.line > new_end):
+                record.line, record.end_line = stmt.line, stmt.end_line
+            else:
+                if record is not None:
+                    self._drop(record)
+                record = self._index_statement(stmt)
+            records.append(record)
+
+        for record in reusable.values():
+            self._drop(record)
+        self.record_change = _changed_span(self.records, records)
+        self.records = records
+        self._record_lines = [record.line for record in records]
+        self.version += 1
+
+    # --- Sorgular ---
+    def definitions(self, name):
+        """Global kapsamdaki tanımlar (konum sırasıyla)."""
+        return sorted(self._definitions.get(name, ()), key=_position)
+
+    def references(self, name):
+        """Global isme çözümlenen referanslar (konum sırasıyla)."""
+        return sorted(self._references.get(name, ()), key=_position)
+
+    def is_function(self, name):
+        return any(symbol.kind == KIND_FUNCTION for symbol in self._definitions.get(name, ()))
+
+    def symbol_at(self, line, column):
+        """Verilen konumdaki sembol (yoksa None)."""
+        idx = bisect_right(self._record_lines, line) - 1
+        if idx < 0:
+            return None
+        record = self.records[idx]
+        if line > record.end_line:
+            return None
+        for symbol in record.symbols:
+            if symbol.line == line and symbol.column <= column < symbol.end_column:
+                return symbol
+        return None
+
+    def scope_at(self, line):
+        """Satırı kapsayan en içteki fonksiyon kapsamı (global ise None)."""
+        idx = bisect_right(self._record_lines, line) - 1
+        if idx < 0:
+            return None
+        record = self.records[idx]
+        if line > record.end_line:
+            return None
+        offset = line - record.line
+        innermost = None
+        for scope, first, last in record.scopes:
+            if first <= offset <= last:
+                innermost = scope
+        return innermost
+
+    def definition_of(self, symbol):
+        """Sembolün bağlandığı ilk tanım (tanımın kendisi için kendisi)."""
+        if symbol.is_definition:
+            return symbol
+        if symbol.scope is not None:
+            candidates = symbol.scope.definitions.get(symbol.name, [])
+        else:
+            candidates = self.definitions(symbol.name)
+        return candidates[0] if candidates else None
+
+    def usages_of(self, symbol):
+        """Aynı isme bağlı tüm tanım ve referanslar (konum sırasıyla)."""
+        if symbol.scope is not None:
+            scope = symbol.scope
+            usages = scope.definitions.get(symbol.name, []) + scope.references.get(symbol.name, [])
+        else:
+            usages = list(self._definitions.get(symbol.name, ())) + list(self._references.get(symbol.name, ()))
+        return sorted(usages, key=_position)
+
+    def semantic_kind(self, symbol):
+        """Vurgulama için: 'function', 'parameter' veya 'variable'."""
+        if symbol.kind == REF_CALL or symbol.kind == KIND_FUNCTION:
+            return KIND_FUNCTION
+        if symbol.is_definition:
+            return symbol.kind
+        if symbol.scope is not None:
+            definitions = symbol.scope.definitions.get(symbol.name)
+            return definitions[0].kind if definitions else KIND_VARIABLE
+        return KIND_FUNCTION if self.is_function(symbol.name) else KIND_VARIABLE
+
+    def __iter__(self):
+        for record in self.records:
+            yield from record.symbols
+
+    def outline(self, start=0, stop=None):
+        """records[start:stop] kayıtlarının anahat girdileri (konum sırasıyla)."""
+        for record in self.records[start:stop]:
+            yield from record.outline
+
+    # --- İndeks kurulumu ---
+    def _drop(self, record):
+        for symbol in record.global_definitions:
+            bucket = self._definitions.get(symbol.name)
+            if bucket is not None:
+                bucket.pop(symbol, None)
+                if not bucket:
+                    del self._definitions[symbol.name]
+        for symbol in record.global_references:
+            bucket = self._references.get(symbol.name)
+            if bucket is not None:
+                bucket.pop(symbol, None)
+                if not bucket:
+                    del self._references[symbol.name]
+
+    def _index_statement(self, stmt):
+        record = StatementRecord(stmt.line, stmt.end_line)
+        self.reindexed += 1
+        self._visit(stmt, record, None)
+        if isinstance(stmt, FunctionDefNode):
+            record.scopes[0][2] = record.end_line - record.line  # Üst seviye fonksiyon tüm deyimi kaplar
+        record.symbols.sort(key=_position)
+        if isinstance(stmt, (IfNode, WhileNode)):
+            kind = OUTLINE_IF if isinstance(stmt, IfNode) else OUTLINE_WHILE
+            record.outline.append(OutlineEntry(kind, kind, None, 0, record, stmt.line))
+        _collect_functions(stmt, record, 0, record.outline)
+        return record
+
+    def _define(self, record, scope, name, kind, line, column):
+        if line is None:
+            return None
+        symbol = Symbol(name, kind, record, line, column, scope, True)
+        record.symbols.append(symbol)
+        if scope is None:
+            record.global_definitions.append(symbol)
+            self._definitions.setdefault(name, {})[symbol] = None
+        else:
+            scope.definitions.setdefault(name, []).append(symbol)
+        return symbol
+
+    def _refer(self, record, scope, name, kind, line, column):
+        if line is None or name in _BUILTINS:
+            return
+        target = scope.resolve(name) if scope is not None else None
+        symbol = Symbol(name, kind, record, line, column, target, False)
+        record.symbols.append(symbol)
+        if target is None:
+            record.global_references.append(symbol)
+            self._references.setdefault(name, {})[symbol] = None
+        else:
+            target.references.setdefault(name, []).append(symbol)
+
+    def _visit(self, node, record, scope):
+        if isinstance(node, AssignmentNode):
+            self._visit(node.expression, record, scope)
+            if scope is None:  # Fonksiyon içindeki atamalar _visit_function'da önceden tanımlanır
+                target = node.identifier
+                self._define(record, scope, target.name, KIND_VARIABLE, target.line, target.column)
+        elif isinstance(node, FunctionDefNode):
+            if scope is None:
+                self._define(record, scope, node.name, KIND_FUNCTION, node.line, node.column)
+            self._visit_function(node, record, scope)
+        elif isinstance(node, CallNode):
+            self._refer(record, scope, node.func_name, REF_CALL, node.line, node.column)
+            for argument in node.arguments:
+                self._visit(argument, record, scope)
+        elif isinstance(node, VariableNode):
+            self._refer(record, scope, node.name, REF_READ, node.line, node.column)
+        elif isinstance(node, (ExpressionStatementNode, ReturnNode)):
+            if node.expression is not None:
+                self._visit(node.expression, record, scope)
+        elif isinstance(node, IfNode):
+            self._visit(node.condition, record, scope)
+            self._visit_block(node.body, record, scope)
+            for condition, body in node.elif_clauses:
+                self._visit(condition, record, scope)
+                self._visit_block(body, record, scope)
+            self._visit_block(node.else_body, record, scope)
+        elif isinstance(node, WhileNode):
+            self._visit(node.condition, record, scope)
+            self._visit_block(node.body, record, scope)
+        elif isinstance(node, BinaryOpNode):
+            self._visit(node.left, record, scope)
+            self._visit(node.right, record, scope)
+        elif isinstance(node, UnaryOpNode):
+            self._visit(node.operand, record, scope)
+
+    def _visit_block(self, statements, record, scope):
+        for stmt in statements or ():
+            self._visit(stmt, record, scope)
+
+    def _visit_function(self, node, record, parent_scope):
+        scope = Scope(node.name, parent_scope)
+        # İç fonksiyonların bitiş satırı AST'de yok; gövdedeki son sembolün satırı kullanılır
+        span = [scope, node.line - record.line, node.line - record.line]
+        record.scopes.append(span)
+        first_symbol = len(record.symbols)
+        for name, (line, column) in zip(node.params, node.param_positions):
+            self._define(record, scope, name, KIND_PARAMETER, line, column)
+        try:
+            body = node.body  # Tembel gövde burada ayrıştırılır
+        except ParserError:
+            return  # Hatalı gövde: yalnızca ad ve parametreler indekslenir
+
+        # Python kuralı: gövdede atanan isimler (iç fonksiyonlar dahil) baştan itibaren yereldir
+        for name, line, column, kind in _local_bindings(body):
+            self._define(record, scope, name, kind, line, column)
+        self._visit_block(body, record, scope)
+        span[2] = max((symbol.line_offset for symbol in record.symbols[first_symbol:]), default=span[2])
+
+
+def _local_bindings(statements):
+    """Bir gövdedeki yerel isim bağlamaları (iç fonksiyonların gövdelerine inmeden)."""
+    for stmt in statements or ():
+        if isinstance(stmt, AssignmentNode):
+            yield stmt.identifier.name, stmt.identifier.line, stmt.identifier.column, KIND_VARIABLE
+        elif isinstance(stmt, FunctionDefNode):
+            yield stmt.name, stmt.line, stmt.column, KIND_FUNCTION
+        elif isinstance(stmt, IfNode):
+            yield from _local_bindings(stmt.body)
+            for _, body in stmt.elif_clauses:
+                yield from _local_bindings(body)
+            yield from _local_bindings(stmt.else_body)
+        elif isinstance(stmt, WhileNode):
+            yield from _local_bindings(stmt.body)
+
+
+def _collect_functions(node, record, depth, entries):
+    """node ve altındaki fonksiyon tanımlarını anahat girdisi olarak ekler (gövdesi hatalı olanlar dahil)."""
+    if isinstance(node, FunctionDefNode):
+        entries.append(OutlineEntry(KIND_FUNCTION, node.name, node.params, depth, record, node.line))
+        try:
+            body = node.body
+        except ParserError:
+            return
+        for stmt in body or ():
+            _collect_functions(stmt, record, depth + 1, entries)
+    elif isinstance(node, IfNode):
+        for stmt in node.body or ():
+            _collect_functions(stmt, record, depth, entries)
+        for _, body in node.elif_clauses:
+            for stmt in body or ():
+                _collect_functions(stmt, record, depth, entries)
+        for stmt in node.else_body or ():
+            _collect_functions(stmt, record, depth, entries)
+    elif isinstance(node, WhileNode):
+        for stmt in node.body or ():
+            _collect_functions(stmt, record, depth, entries)
+
+
+def _changed_span(old, new):
+    """old ve new kayıt listelerinde aynı nesnelerden oluşan önek ve sonek dışındaki aralık."""
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] is new[start]:
+        start += 1
+    old_stop, new_stop = len(old), len(new)
+    while old_stop > start and new_stop > start and old[old_stop - 1] is new[new_stop - 1]:
+        old_stop -= 1
+        new_stop -= 1
+    return start, old_stop, new_stop
+
+
+def _position(symbol):
+    return symbol.line, symbol.column
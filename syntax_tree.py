@@ -1,6 +1,12 @@
 # syntax_tree.py
 
 class ASTNode:  # Eski 'Node' sınıfı, artık ana temel AST düğüm sınıfımız
+    # Kaynak konumu: isim içeren düğümlerde ismin satır/sütunu, üst seviye
+    # deyimlerde deyimin ilk ve son satırı (Parser tarafından atanır)
+    line = None
+    column = None
+    end_line = None
+
     def _str_recursive(self, level, indent_char='  '):
         """
         AST düğümünün ve alt düğümlerinin girintili string temsilini döndürür.
@@ -117,17 +123,48 @@ class WhileNode(ASTNode):  # ASTNode'dan miras alıyor
 
 
 class FunctionDefNode(ASTNode):  # ASTNode'dan miras alıyor
-    def __init__(self, name, params, body):
+    def __init__(self, name, params, body, body_range=None, body_loader=None):
         self.name = name
         self.params = params
-        self.body = body
+        self._body = body
+        # Tembel ayrıştırmada gövde (INDENT'ten sonraki ilk, DEDENT) ham token indeks aralığı
+        # ve gövdeyi ilk erişimde ayrıştıran fonksiyon
+        self.body_range = body_range
+        self._body_loader = body_loader
+        self.body_error = None  # Gövde ayrıştırılırken oluşan hata (tekrar erişimde yeniden fırlatılır)
+        self.param_positions = []  # Parametrelerin (satır, sütun) konumları
+
+    @property
+    def body(self):
+        if self._body is None and self._body_loader is not None:
+            if self.body_error is not None:
+                raise self.body_error
+            try:
+                self._body = self._body_loader(self)
+            except Exception as e:
+                self.body_error = e
+                raise
+            self._body_loader = None
+        return self._body
+
+    @body.setter
+    def body(self, statements):
+        self._body = statements
+        self._body_loader = None
+        self.body_error = None
+
+    @property
+    def is_body_parsed(self):
+        return self._body_loader is None
 
     def _str_recursive(self, level, indent_char='  '):
         prefix = indent_char * level
         s = f"{prefix}• Fonksiyon Tanımı (FunctionDefNode): '{self.name}'\n"
         s += f"{prefix}{indent_char}Parametreler: {', '.join(self.params) if self.params else '(Yok)'}\n"
         s += f"{prefix}{indent_char}Fonksiyon Gövdesi:\n"
-        if not self.body:
+        if not self.is_body_parsed:
+            s += f"{prefix}{indent_char * 2}(Henüz ayrıştırılmadı)\n"
+        elif not self.body:
             s += f"{prefix}{indent_char * 2}(Boş Blok)\n"
         else:
             for stmt in self.body:
@@ -150,6 +187,20 @@ class ReturnNode(ASTNode):  # ASTNode'dan miras alıyor
         return s
 
 
+class ImportNode(ASTNode):  # ASTNode'dan miras alıyor
+    def __init__(self, names, module=None):
+        self.names = names  # İçe aktarılan isimler
+        self.module = module  # 'from modül import ...' biçiminde modül adı, 'import ...' için None
+
+    def _str_recursive(self, level, indent_char='  '):
+        prefix = indent_char * level
+        s = f"{prefix}• İçe Aktarma (ImportNode)\n"
+        if self.module is not None:
+            s += f"{prefix}{indent_char}Modül: '{self.module}'\n"
+        s += f"{prefix}{indent_char}İsimler: {', '.join(self.names)}\n"
+        return s
+
+
 class CallNode(ASTNode):  # ASTNode'dan miras alıyor
     def __init__(self, func_name, arguments):
         self.func_name = func_name
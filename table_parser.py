@@ -0,0 +1,355 @@
+# table_parser.py
+import sys
+import time
+
+from grammar import Grammar, GrammarError, Terminal, Action, build_table
+from parser import Parser, ParserError
+from tokens import TokenType
+from syntax_tree import (AssignmentNode, BinaryOpNode, BooleanNode, CallNode, ExpressionStatementNode,
+                         FunctionDefNode, IfNode, ImportNode, NoneNode, NumberNode, ReturnNode, StringNode,
+                         UnaryOpNode, VariableNode, WhileNode)
+
+
+class _Expect:
+    """Yığındaki terminal: beklenen token tipi, hata metni ve değerin yığına konup konmayacağı."""
+
+    __slots__ = ('type', 'display', 'keep')
+
+    def __init__(self, token_type, display, keep):
+        self.type = token_type
+        self.display = display
+        self.keep = keep
+
+
+class _LazyRule:
+    """Tembel ayrıştırmada atlanabilen kural (%lazy); atlanırsa yığına gövdenin token aralığı konur."""
+
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+# --- Anlamsal eylemler: değer yığınını (values) yerinde günceller ---
+def _at(node, token):
+    node.line = token.line
+    node.column = token.column
+    return node
+
+
+def _list(parser, values):
+    values.append([])
+
+
+def _first_item(parser, values):
+    values[-1] = [values[-1]]
+
+
+def _append(parser, values):
+    item = values.pop()
+    values[-1].append(item)
+
+
+def _nothing(parser, values):
+    values.append(None)
+
+
+def _pass(parser, values):
+    values.append(ExpressionStatementNode(NoneNode()))
+
+
+def _expression_statement(parser, values):
+    values[-1] = ExpressionStatementNode(values[-1])
+
+
+def _assignment(parser, values):
+    expression = values.pop()
+    name = values[-1]
+    values[-1] = AssignmentNode(_at(VariableNode(name.value), name), expression)
+
+
+def _binary(parser, values):
+    right = values.pop()
+    operator = values.pop()
+    values[-1] = BinaryOpNode(values[-1], operator.value, right)
+
+
+def _unary(parser, values):
+    operand = values.pop()
+    values[-1] = UnaryOpNode(values[-1].value, operand)
+
+
+def _number(parser, values):
+    values[-1] = NumberNode(float(values[-1].value))
+
+
+def _string(parser, values):
+    values[-1] = StringNode(values[-1].value[1:-1])
+
+
+def _true(parser, values):
+    values.append(BooleanNode(True))
+
+
+def _false(parser, values):
+    values.append(BooleanNode(False))
+
+
+def _none(parser, values):
+    values.append(NoneNode())
+
+
+def _variable(parser, values):
+    name = values[-1]
+    values[-1] = _at(VariableNode(name.value), name)
+
+
+def _call(parser, values):
+    arguments = values.pop()
+    name = values[-1]
+    values[-1] = _at(CallNode(name.value, arguments), name)
+
+
+def _elif(parser, values):
+    body = values.pop()
+    condition = values.pop()
+    values[-1].append((condition, body))
+
+
+def _if(parser, values):
+    else_body = values.pop()
+    elif_clauses = values.pop()
+    body = values.pop()
+    values[-1] = IfNode(values[-1], body, elif_clauses, else_body)
+
+
+def _while(parser, values):
+    body = values.pop()
+    values[-1] = WhileNode(values[-1], body)
+
+
+def _function_def(parser, values):
+    body = values.pop()
+    param_tokens = values.pop()
+    name = values[-1]
+    params = [token.value for token in param_tokens]
+    if isinstance(body, tuple):
+        # Gövde atlandı; body, skip_indented_block'un döndürdüğü token aralığıdır
+        node = FunctionDefNode(name.value, params, None, body_range=body, body_loader=parser._parse_lazy_body)
+        parser.lazy_functions.append(node)
+    else:
+        node = FunctionDefNode(name.value, params, body)
+    node.param_positions = [(token.line, token.column) for token in param_tokens]
+    values[-1] = _at(node, name)
+
+
+def _return(parser, values):
+    values[-1] = ReturnNode(values[-1])
+
+
+def _import(parser, values):
+    values[-1] = ImportNode([token.value for token in values[-1]])
+
+
+def _from_import(parser, values):
+    names = values.pop()
+    values[-1] = ImportNode([token.value for token in names], values[-1].value)
+
+
+def _expected_expression(parser, values):
+    raise parser.expected_expression_error()
+
+
+_ACTIONS = {
+    'list': _list, 'first_item': _first_item, 'append': _append, 'nothing': _nothing, 'pass': _pass,
+    'expression_statement': _expression_statement, 'assignment': _assignment, 'binary': _binary,
+    'unary': _unary, 'number': _number, 'string': _string, 'true': _true, 'false': _false, 'none': _none,
+    'variable': _variable, 'call': _call, 'elif': _elif, 'if': _if, 'while': _while,
+    'function_def': _function_def, 'return': _return, 'import': _import, 'from_import': _from_import,
+}
+
+_ERRORS = {
+    'expected_expression': _expected_expression,
+}
+
+
+def compile_table(parse_table):
+    """
+    ParseTable'ı motorun çalışma biçimine çevirir: kural adı -> (terminal tipi ->
+    yığına ters sırayla konacak semboller, varsayılan semboller). Terminaller
+    _Expect, eylemler fonksiyon, tembel kurallar _LazyRule olur.
+    """
+    grammar = parse_table.grammar
+
+    def compile_symbol(symbol):
+        if isinstance(symbol, Terminal):
+            return _Expect(TokenType[symbol.name], symbol.display or symbol.name,
+                           symbol.name not in grammar.discard)
+        if isinstance(symbol, Action):
+            functions = _ERRORS if symbol.is_error else _ACTIONS
+            if symbol.name not in functions:
+                raise GrammarError(f"Tanımsız eylem: {symbol!r}")
+            return functions[symbol.name]
+        return _LazyRule(symbol) if symbol in grammar.lazy else symbol
+
+    expansions = {production.index: tuple(compile_symbol(symbol) for symbol in reversed(production.symbols))
+                  for production in grammar.productions}
+
+    compiled = {}
+    for head, row in parse_table.table.items():
+        default = parse_table.defaults[head]
+        if default is not None:
+            default_expansion = expansions[default.index]
+        else:
+            expected = ', '.join(sorted(row))
+            default_expansion = (_unexpected_token(expected),)
+        compiled[head] = ({TokenType[terminal]: expansions[production.index] for terminal, production in row.items()},
+                          default_expansion)
+    return compiled
+
+
+def _unexpected_token(expected):
+    def raise_error(parser, values):
+        raise parser.expected_token_error(expected)
+    return raise_error
+
+
+_compiled_table = None
+
+
+def load_table():
+    """Dilbilgisi dosyasından tabloyu bir kez üretir (süreç başına)."""
+    global _compiled_table
+    if _compiled_table is None:
+        _compiled_table = compile_table(build_table(Grammar.load()))
+    return _compiled_table
+
+
+class TableParser(Parser):
+    """
+    language.grammar'dan üretilen LL(1) tablosuyla çalışan, açık yığınlı parser.
+
+    Parser ile aynı syntax_tree düğümlerini, aynı hata mesajlarını ve aynı tembel
+    gövde davranışını üretir; üst seviye döngü, hata bildirimi ve token erişimi
+    Parser'dan gelir. Deyimler özyineleme olmadan ayrıştırıldığı için iç içe
+    blok ve parantez derinliğinin sınırı yoktur; her token için yapılan iş
+    (tablo araması + yığın işlemleri) sabittir.
+    """
+
+    def __init__(self, tokens, diagnostics=None, lazy=False):
+        super().__init__(tokens, diagnostics, lazy)
+        self.table = load_table()
+
+    def parse_statement(self):
+        return self._run('statement')
+
+    def parse_block(self):
+        # Tembel gövdeler INDENT/DEDENT olmadan ayrıştırılır
+        return self._run('body')
+
+    def _run(self, start):
+        table = self.table
+        values = []
+        stack = [start]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            symbol = pop()
+            kind = symbol.__class__
+            if kind is _Expect:
+                token = self.lookahead
+                if token.type is not symbol.type:
+                    raise self.expected_token_error(symbol.display)
+                if symbol.keep:
+                    values.append(token)
+                self.advance()
+            elif kind is str:
+                row, default = table[symbol]
+                extend(row.get(self.lookahead.type, default))
+            elif kind is _LazyRule:
+                if self.lazy:
+                    values.append(self.skip_indented_block())
+                else:
+                    stack.append(symbol.name)
+            else:
+                symbol(self, values)
+        return values[-1]
+
+
+def check_equivalence(sources, lazy=False):
+    """
+    Her kaynak için Parser ve TableParser'ın çıktısını (AST metni veya hata
+    mesajı) karşılaştırır; farklı çıkanların açıklamalarını döndürür.
+    """
+    from lexer import Lexer
+
+    lexer = Lexer()
+    failures = []
+    for source in sources:
+        try:
+            tokens = lexer.tokenize(source)
+        except RuntimeError:
+            continue  # Girinti hatası: iki parser'a da ulaşmaz
+        results = []
+        for parser_class in (Parser, TableParser):
+            try:
+                results.append(_full_repr(parser_class(tokens, lazy=lazy).parse()))
+            except ParserError as e:
+                results.append(f"ParserError: {e}")
+        if results[0] != results[1]:
+            failures.append(f"{source[:60]!r}...: Parser {results[0][:160]!r}, TableParser {results[1][:160]!r}")
+    return failures
+
+
+def _full_repr(program):
+    """Tembel gövdeler de ayrıştırılmış haliyle; konumlar dahil."""
+    lines = []
+
+    def visit(node):
+        if isinstance(node, list):
+            for item in node:
+                visit(item)
+        elif isinstance(node, tuple):
+            for item in node:
+                visit(item)
+        elif hasattr(node, '_str_recursive'):
+            if isinstance(node, FunctionDefNode):
+                try:
+                    visit(node.body)
+                except ParserError as e:
+                    lines.append(f"gövde hatası: {e}")
+            lines.append(f"{type(node).__name__} {node.line} {node.column} {node.end_line}")
+            for value in vars(node).values():
+                visit(value)
+    visit(program.statements)
+    return repr(program) + '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    from lexer import Lexer
+
+    if len(sys.argv) < 2:
+        print("Kullanım: python table_parser.py <dosya> [tekrar]")
+        sys.exit(1)
+    with open(sys.argv[1], encoding='utf-8') as f:
+        source = f.read()
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    failures = check_equivalence([source]) + check_equivalence([source], lazy=True)
+    print("Aynı AST: " + ("evet" if not failures else "HAYIR\n  " + "\n  ".join(failures)))
+
+    tokens = Lexer().tokenize(source)
+    load_table()  # Tablo üretimi ölçüme katılmasın
+    for parser_class in (Parser, TableParser):
+        for lazy in (False, True):
+            best = None
+            for _ in range(repeat):
+                started = time.perf_counter()
+                try:
+                    parser_class(tokens, lazy=lazy).parse()
+                except ParserError:
+                    pass  # Hatalı dosyada da hataya kadar geçen süre ölçülür
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            mode = 'tembel' if lazy else 'tam'
+            print(f"{parser_class.__name__:12} {mode:7} {best:.3f} sn ({len(tokens) / best / 1e6:.2f} M token/sn)")
@@ -0,0 +1,131 @@
+# themes.py
+import json
+import os
+
+from tokens import TokenType
+
+THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'themes')
+DEFAULT_THEME = 'default'
+
+# Token tipi -> tag eşlemesi; vurgulama, dışa aktarıcılar ve sunucular bunu kullanır.
+# Burada olmayan tipler (NEWLINE, INDENT, DEDENT, EOF, ...) renklendirilmez.
+TOKEN_TAGS = {
+    TokenType.KEYWORD_IF: 'keyword', TokenType.KEYWORD_ELIF: 'keyword', TokenType.KEYWORD_ELSE: 'keyword',
+    TokenType.KEYWORD_WHILE: 'keyword', TokenType.KEYWORD_DEF: 'keyword', TokenType.KEYWORD_RETURN: 'keyword',
+    TokenType.KEYWORD_AND: 'keyword', TokenType.KEYWORD_OR: 'keyword', TokenType.KEYWORD_NOT: 'keyword',
+    TokenType.KEYWORD_PRINT: 'function_call',
+    TokenType.KEYWORD_TRUE: 'boolean', TokenType.KEYWORD_FALSE: 'boolean', TokenType.KEYWORD_NONE: 'boolean',
+    TokenType.OPERATOR: 'operator',
+    TokenType.NUMBER: 'number',
+    TokenType.STRING: 'string',
+    TokenType.COMMENT: 'comment',
+    TokenType.IDENTIFIER: 'variable',
+    TokenType.LPAREN: 'lparen',
+    TokenType.RPAREN: 'rparen',
+    TokenType.COLON: 'colon',
+    TokenType.COMMA: 'comma',
+    TokenType.MISMATCH: 'mismatch',
+}
+
+TOKEN_TAG_NAMES = frozenset(TOKEN_TAGS.values())
+
+_STYLE_KEYS = {'foreground', 'background', 'italic', 'bold', 'underline'}
+_EDITOR_DEFAULTS = {
+    'background': '#FFFFFF',
+    'foreground': '#000000',
+    'insert': '#000000',
+    'line_numbers_background': '#F0F0F0',
+    'line_numbers_foreground': '#000000',
+}
+
+
+class ThemeError(Exception):
+    pass
+
+
+class Theme:
+    """
+    Tag stilleri (ön/arka plan rengi, italik, kalın, altı çizili) ve editör
+    renklerinden oluşan tema. JSON dosyalarından yüklenir.
+    """
+
+    def __init__(self, key, name, tags, editor=None):
+        self.key = key
+        self.name = name
+        self.tags = tags  # tag -> stil sözlüğü
+        self.editor = dict(_EDITOR_DEFAULTS)
+        self.editor.update(editor or {})
+
+    @classmethod
+    def from_dict(cls, key, data):
+        if not isinstance(data, dict) or not isinstance(data.get('tags'), dict):
+            raise ThemeError(f"Geçersiz tema '{key}': 'tags' sözlüğü bekleniyor")
+        tags = {}
+        for tag, style in data['tags'].items():
+            if not isinstance(style, dict) or not set(style) <= _STYLE_KEYS:
+                raise ThemeError(f"Geçersiz tema '{key}': '{tag}' stili tanınmayan alanlar içeriyor")
+            tags[tag] = dict(style)
+        return cls(key, data.get('name', key), tags, data.get('editor'))
+
+    @classmethod
+    def load(cls, path):
+        key = os.path.splitext(os.path.basename(path))[0]
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ThemeError(f"Tema yüklenemedi ({path}): {e}")
+        return cls.from_dict(key, data)
+
+    def style(self, tag):
+        return self.tags.get(tag, {})
+
+    def token_styles(self):
+        """Yalnızca token tag'lerinin stilleri (dışa aktarıcılar için)."""
+        return {tag: style for tag, style in self.tags.items() if tag in TOKEN_TAG_NAMES}
+
+    def tk_options(self, tag, font_family='Consolas', font_size=10):
+        """
+        Tk tag_config seçenekleri. Temada olmayan seçenekler boş string ile
+        sıfırlanır; böylece tema değişince önceki temadan renk kalmaz.
+        """
+        style = self.style(tag)
+        modifiers = [name for name in ('bold', 'italic') if style.get(name)]
+        return {
+            'foreground': style.get('foreground', ''),
+            'background': style.get('background', ''),
+            'underline': bool(style.get('underline')),
+            'font': (font_family, font_size, ' '.join(modifiers)) if modifiers else '',
+        }
+
+
+_theme_cache = {}
+
+
+def available_themes(directory=THEMES_DIR):
+    """Dizindeki temaları (anahtar, görünen ad) listesi olarak döndürür; varsayılan tema önce gelir."""
+    themes = []
+    if os.path.isdir(directory):
+        for file_name in sorted(os.listdir(directory)):
+            if file_name.endswith('.json'):
+                try:
+                    theme = load_theme(os.path.splitext(file_name)[0], directory)
+                except ThemeError:
+                    continue  # Bozuk tema menüde gösterilmez
+                themes.append((theme.key, theme.name))
+    themes.sort(key=lambda item: item[0] != DEFAULT_THEME)
+    return themes
+
+
+def load_theme(key=DEFAULT_THEME, directory=THEMES_DIR):
+    """Temayı anahtarından (dosya adı) veya bir JSON dosya yolundan yükler; sonuç önbelleğe alınır."""
+    if key.endswith('.json'):
+        path = key
+    else:
+        path = os.path.join(directory, key + '.json')
+    path = os.path.abspath(path)
+    theme = _theme_cache.get(path)
+    if theme is None:
+        theme = Theme.load(path)
+        _theme_cache[path] = theme
+    return theme
@@ -0,0 +1,239 @@
+# token_stream.py
+import mmap
+import struct
+import sys
+from array import array
+
+from tokens import Token, TokenType
+
+# Dosya düzeni (tüm sayılar little-endian):
+#   başlık: sihirli sayı, sürüm, token sayısı, tip adları uzunluğu, değer alanı uzunluğu
+#   tip adları: '\n' ile ayrılmış TokenType adları (tip kodu = bu listedeki indeks)
+#   types:   token başına 1 bayt tip kodu
+#   offsets: token başına uint32, değerin değer alanındaki bayt konumu
+#   lengths: token başına uint32, değerin bayt uzunluğu
+#   lines:   token başına int32
+#   columns: token başına int32
+#   değer alanı: kaynak metnin UTF-8 baytları + kaynakta birebir bulunmayan değerler
+# Diziler 4 bayt hizalıdır; böylece okuyucu memoryview.cast ile kopyasız erişir.
+MAGIC = b'PSTK'
+VERSION = 1
+HEADER = struct.Struct('<4sHxxIII')
+
+_TOKEN_TYPES = list(TokenType)
+_TOKEN_TYPE_INDEX = {token_type: idx for idx, token_type in enumerate(_TOKEN_TYPES)}
+_SWAP = sys.byteorder != 'little'
+
+
+class TokenStreamError(Exception):
+    pass
+
+
+def _padding(size):
+    return (-size) % 4
+
+
+def encode_tokens(tokens, source):
+    """
+    Lexer çıktısını ikili biçime çevirir. Token değerleri mümkün olduğunca
+    kaynak metindeki konumlarına referans olarak saklanır; kopyalanmaz.
+    """
+    lines = source.splitlines(keepends=True)
+    line_char_starts = []
+    line_byte_starts = []
+    line_ascii = []
+    char_pos = byte_pos = 0
+    for line in lines:
+        line_char_starts.append(char_pos)
+        line_byte_starts.append(byte_pos)
+        is_ascii = line.isascii()
+        line_ascii.append(is_ascii)
+        char_pos += len(line)
+        byte_pos += len(line) if is_ascii else len(line.encode('utf-8'))
+
+    source_bytes = source.encode('utf-8')
+    extras = bytearray()
+    extra_offsets = {}  # Kaynakta bulunmayan değerler bir kez saklanır
+
+    count = len(tokens)
+    types = array('B', bytes(count))
+    offsets = array('I', bytes(4 * count))
+    lengths = array('I', bytes(4 * count))
+    line_numbers = array('i', bytes(4 * count))
+    columns = array('i', bytes(4 * count))
+
+    for idx, token in enumerate(tokens):
+        types[idx] = _TOKEN_TYPE_INDEX[token.type]
+        line_numbers[idx] = token.line
+        columns[idx] = token.column
+        value = token.value
+        if not value:
+            continue
+
+        line_idx = token.line - 1
+        offset = None
+        if 0 <= line_idx < len(lines) and token.column >= 0:
+            line = lines[line_idx]
+            if line.startswith(value, token.column):
+                if line_ascii[line_idx]:
+                    offset = line_byte_starts[line_idx] + token.column
+                else:
+                    offset = line_byte_starts[line_idx] + len(line[:token.column].encode('utf-8'))
+                length = len(value) if line_ascii[line_idx] else len(value.encode('utf-8'))
+
+        if offset is None:
+            offset = extra_offsets.get(value)
+            encoded = value.encode('utf-8')
+            if offset is None:
+                offset = len(source_bytes) + len(extras)
+                extra_offsets[value] = offset
+                extras += encoded
+            length = len(encoded)
+
+        offsets[idx] = offset
+        lengths[idx] = length
+
+    if _SWAP:
+        for arr in (offsets, lengths, line_numbers, columns):
+            arr.byteswap()
+
+    names = '\n'.join(token_type.name for token_type in _TOKEN_TYPES).encode('ascii')
+    blob_length = len(source_bytes) + len(extras)
+
+    out = bytearray(HEADER.pack(MAGIC, VERSION, count, len(names), blob_length))
+    out += names + bytes(_padding(len(names)))
+    out += types.tobytes() + bytes(_padding(count))
+    for arr in (offsets, lengths, line_numbers, columns):
+        out += arr.tobytes()
+    out += source_bytes
+    out += extras
+    return bytes(out)
+
+
+class TokenStream:
+    """
+    encode_tokens çıktısı üzerinde kopyasız okuyucu. bytes, bytearray veya mmap
+    sarmalanır; Token nesneleri yalnızca erişildiklerinde oluşturulur.
+    """
+
+    def __init__(self, buffer):
+        view = memoryview(buffer)
+        if len(view) < HEADER.size:
+            raise TokenStreamError("Token akışı başlığı eksik")
+        magic, version, count, names_length, blob_length = HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION:
+            raise TokenStreamError(f"Desteklenmeyen token akışı (sihirli sayı {magic!r}, sürüm {version})")
+
+        pos = HEADER.size
+        names = bytes(view[pos:pos + names_length]).decode('ascii').split('\n')
+        pos += names_length + _padding(names_length)
+        try:
+            self._type_table = [TokenType[name] for name in names]
+        except KeyError as e:
+            raise TokenStreamError(f"Bilinmeyen token tipi: {e}")
+
+        self._count = count
+        self._types = view[pos:pos + count]
+        pos += count + _padding(count)
+
+        arrays = []
+        for fmt in ('I', 'I', 'i', 'i'):
+            chunk = view[pos:pos + 4 * count]
+            if _SWAP:
+                # Büyük endian makinelerde kopyasız okuma mümkün değil
+                swapped = array(fmt, chunk.tobytes())
+                swapped.byteswap()
+                arrays.append(swapped)
+            else:
+                arrays.append(chunk.cast(fmt))
+            pos += 4 * count
+        self._offsets, self._lengths, self._lines, self._columns = arrays
+
+        self._blob = view[pos:pos + blob_length]
+        if len(self._blob) != blob_length:
+            raise TokenStreamError("Token akışı kesik")
+        self._buffer = buffer
+
+    def __len__(self):
+        return self._count
+
+    def type_at(self, idx):
+        return self._type_table[self._types[idx]]
+
+    def line_at(self, idx):
+        return self._lines[idx]
+
+    def column_at(self, idx):
+        return self._columns[idx]
+
+    def value_at(self, idx):
+        offset = self._offsets[idx]
+        return str(self._blob[offset:offset + self._lengths[idx]], 'utf-8')
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self._count))]
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("Token indeksi aralık dışında")
+        return Token(self._type_table[self._types[idx]], self.value_at(idx), self._lines[idx], self._columns[idx])
+
+    def __iter__(self):
+        for idx in range(self._count):
+            yield self[idx]
+
+    def to_list(self):
+        return list(self)
+
+    def release(self):
+        """memoryview'ları bırakır; mmap ancak bundan sonra kapatılabilir."""
+        for view in (self._types, self._offsets, self._lengths, self._lines, self._columns, self._blob):
+            if isinstance(view, memoryview):
+                view.release()
+
+
+def save_tokens(path, tokens, source):
+    with open(path, 'wb') as f:
+        f.write(encode_tokens(tokens, source))
+
+
+def load_tokens(path):
+    """Dosyayı mmap ile açar ve üzerindeki TokenStream'i döndürür (dosya okunup kopyalanmaz)."""
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return TokenStream(mapped)
+
+
+if __name__ == '__main__':
+    import pickle
+    import time
+
+    from lexer import Lexer
+
+    if len(sys.argv) < 2:
+        print("Kullanım: python token_stream.py <dosya>")
+        sys.exit(1)
+
+    with open(sys.argv[1], encoding='utf-8') as f:
+        source_code = f.read()
+    token_list = Lexer().tokenize(source_code)
+
+    started = time.perf_counter()
+    pickled = pickle.dumps(token_list, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle_dump_time = time.perf_counter() - started
+    started = time.perf_counter()
+    pickle.loads(pickled)
+    pickle_load_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    encoded_stream = encode_tokens(token_list, source_code)
+    encode_time = time.perf_counter() - started
+    started = time.perf_counter()
+    stream = TokenStream(encoded_stream)
+    stream.type_at(len(stream) - 1)
+    open_time = time.perf_counter() - started
+
+    print(f"{len(token_list)} token")
+    print(f"pickle:      {len(pickled)} bayt, yazma {pickle_dump_time:.4f} sn, okuma {pickle_load_time:.4f} sn")
+    print(f"token akışı: {len(encoded_stream)} bayt, yazma {encode_time:.4f} sn, açma {open_time:.6f} sn")
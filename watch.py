@@ -0,0 +1,188 @@
+# watch.py
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from lexer import Lexer
+from parser import Parser, ParserError
+from diagnostics import DiagnosticCollector
+from exporters import HtmlExporter
+
+INDEX_FILE = '.watch_index.json'
+MANIFEST_FILE = 'manifest.json'
+
+
+class SourceWatcher:
+    """
+    Bir dizin ağacını yoklayıp yalnızca gerçekten değişen dosyaların token
+    dökümünü, vurgulanmış HTML çıktısını ve AST dökümünü yeniden üretir.
+
+    İndeks her dosya için (mtime, boyut, içerik özeti) tutar. Değişmeyen dosyalar
+    için yalnızca stat yapılır; mtime/boyut değiştiyse dosya okunup özeti alınır
+    ve içerik gerçekten değiştiyse yeniden tokenlanıp ayrıştırılır.
+    """
+
+    def __init__(self, source_dir, output_dir, extensions=('.py',)):
+        self.source_dir = os.path.abspath(source_dir)
+        self.output_dir = os.path.abspath(output_dir)
+        self.extensions = tuple(extensions)
+        self.lexer = Lexer()
+        self.index = {}  # göreli yol -> {"mtime", "size", "hash", ...manifest bilgisi}
+        self._load_index()
+
+    def _load_index(self):
+        path = os.path.join(self.output_dir, INDEX_FILE)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                self.index = json.load(f)
+
+    def _save_index(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(os.path.join(self.output_dir, INDEX_FILE), 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+
+    def scan(self):
+        """Kaynak ağacındaki izlenen dosyaları (göreli yol, stat sonucu) olarak üretir."""
+        stack = [self.source_dir]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Çıktı dizini kaynak ağacının içindeyse onu izleme
+                        if entry.path != self.output_dir:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(self.extensions):
+                        yield os.path.relpath(entry.path, self.source_dir), entry.stat()
+
+    def poll(self):
+        """
+        Ağacı bir kez yoklar. Yeniden üretilen, silinen ve içeriği değişmeden
+        dokunulmuş dosyaların listelerini içeren bir sözlük döndürür.
+        """
+        changes = {'rendered': [], 'removed': [], 'touched': []}
+        seen = set()
+
+        for rel_path, stat in self.scan():
+            entry = self.index.get(rel_path)
+            if entry is not None and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                seen.add(rel_path)
+                continue  # Sadece stat: dosya okunmaz, tokenlanmaz
+
+            try:
+                with open(os.path.join(self.source_dir, rel_path), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                # Tarama ile okuma arasında silindi, yeniden adlandırıldı veya okunamaz oldu
+                # (ör. atomik kayıt); görülmemiş sayılır, sonraki yoklamada yeniden denenir
+                continue
+            seen.add(rel_path)
+            digest = hashlib.sha256(data).hexdigest()
+
+            if entry is not None and entry['hash'] == digest:
+                # İçerik aynı (örn. sadece touch edildi); yeniden üretmeye gerek yok
+                entry['mtime'] = stat.st_mtime_ns
+                entry['size'] = stat.st_size
+                changes['touched'].append(rel_path)
+                continue
+
+            entry = self.render(rel_path, data.decode('utf-8', errors='replace'))
+            entry.update(mtime=stat.st_mtime_ns, size=stat.st_size, hash=digest)
+            self.index[rel_path] = entry
+            changes['rendered'].append(rel_path)
+
+        for rel_path in [path for path in self.index if path not in seen]:
+            self._remove_outputs(self.index.pop(rel_path))
+            changes['removed'].append(rel_path)
+
+        if any(changes.values()):
+            self._save_index()
+            self.write_manifest()
+        return changes
+
+    def render(self, rel_path, code):
+        """Bir dosyanın token ve AST çıktılarını yazar, manifest girdisini döndürür."""
+        base = os.path.join(self.output_dir, rel_path)
+        os.makedirs(os.path.dirname(base), exist_ok=True)
+        entry = {'tokens': rel_path + '.tokens.txt', 'ast': rel_path + '.ast.txt', 'html': rel_path + '.html',
+                 'status': 'ok', 'error': None}
+
+        diagnostics = DiagnosticCollector()
+        try:
+            tokens = self.lexer.tokenize(code, diagnostics)
+        except RuntimeError as e:
+            tokens = []
+            entry.update(status='lexer_error', error=str(e))
+
+        with open(base + '.tokens.txt', 'w', encoding='utf-8') as f:
+            for token in tokens:
+                f.write(f"{token.line}:{token.column}\t{token.type.name}\t{token.value!r}\n")
+        entry['token_count'] = len(tokens)
+
+        with open(base + '.html', 'w', encoding='utf-8', newline='\n') as f:
+            HtmlExporter(title=rel_path).export(self.lexer.split_lines(code), tokens, f)
+
+        with open(base + '.ast.txt', 'w', encoding='utf-8') as f:
+            if entry['status'] == 'ok':
+                try:
+                    f.write(repr(Parser(tokens, diagnostics).parse()))
+                except ParserError as e:
+                    entry.update(status='parser_error', error=str(e))
+            if entry['error']:
+                f.write(f"❌ {entry['error']}\n")
+        entry['diagnostics'] = [f"{d.code} {d.line}:{d.column} {d.message}" for d in diagnostics]
+        return entry
+
+    def _remove_outputs(self, entry):
+        for key in ('tokens', 'ast', 'html'):
+            if key not in entry:
+                continue  # Eski indekslerde HTML çıktısı yok
+            path = os.path.join(self.output_dir, entry[key])
+            if os.path.exists(path):
+                os.remove(path)
+
+    def write_manifest(self):
+        manifest = {
+            'source_dir': self.source_dir,
+            'generated_at': time.time(),
+            'files': {path: {key: value for key, value in entry.items() if key not in ('mtime', 'size')}
+                      for path, entry in sorted(self.index.items())},
+        }
+        with open(os.path.join(self.output_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    def watch(self, interval=1.0):
+        while True:
+            started = time.perf_counter()
+            changes = self.poll()
+            elapsed = time.perf_counter() - started
+            if any(changes.values()):
+                print(f"{len(changes['rendered'])} yeniden üretildi, {len(changes['removed'])} silindi, "
+                      f"{len(changes['touched'])} dokunuldu ({elapsed:.3f} sn)")
+            time.sleep(interval)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Değişen dosyaları yeniden vurgulayan izleme modu")
+    arg_parser.add_argument('source_dir')
+    arg_parser.add_argument('output_dir')
+    arg_parser.add_argument('--interval', type=float, default=1.0, help="Yoklama aralığı (saniye)")
+    arg_parser.add_argument('--once', action='store_true', help="Tek bir yoklama yap ve çık")
+    args = arg_parser.parse_args()
+
+    watcher = SourceWatcher(args.source_dir, args.output_dir)
+    if args.once:
+        changes = watcher.poll()
+        print(f"{len(changes['rendered'])} yeniden üretildi, {len(changes['removed'])} silindi")
+    else:
+        watcher.watch(args.interval)
+
+
+if __name__ == '__main__':
+    main()